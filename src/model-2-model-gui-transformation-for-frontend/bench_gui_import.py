@@ -0,0 +1,123 @@
+"""
+bench_gui_import.py
+
+Import-time benchmark of generated_gui_model.py in both export modes
+(export_gui_model_to_python(mode="portable" | "direct")).
+
+A synthetic GUI (N screens x M elements, buttons navigating between screens,
+lists bound to the baseline datasources) is exported twice and imported in a
+fresh process, the way generate_app.load_model does it, both cold (source
+compiled on import) and warm (.pyc present, as left by the direct export). Only the module load is timed:
+interpreter start-up and the BESSER import are excluded.
+
+    python bench_gui_import.py                      # 50/200/1000 screens x 20 elements
+    python bench_gui_import.py --screens 2000 --elements 30 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import py_compile
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+STRUCTURAL_MODULE = "structural_community_platform"
+
+
+def build_synthetic_gui(n_screens: int, n_elements: int):
+    from m2m_dsml_to_gui_pruning_only_with_py_export import (
+        GUIModel, InputFieldType, ButtonActionType, _accepted_kwargs,
+        _ensure_structural_binding, mk_screen, mk_datasource, mk_input, mk_button, mk_datalist,
+    )
+    from besser.BUML.metamodel.gui import Module
+
+    ds = {name: mk_datasource(name=name, dataSourceClass=cls, fields=set())
+          for name, cls in (("ItemsDataSource", "Item"), ("RatingsDataSource", "Rating"))}
+    screens = [mk_screen(name=f"Screen{i}", description=f"Screen {i}", is_main=(i == 0)) for i in range(n_screens)]
+    for i, screen in enumerate(screens):
+        for j in range(n_elements):
+            kind = j % 3
+            if kind == 0:
+                e = mk_input(name=f"S{i}Field{j}", description=f"field {j}", field_type=InputFieldType.Text)
+            elif kind == 1:
+                e = mk_button(name=f"S{i}Btn{j}", description=f"go {j}", label="Go",
+                              action_type=ButtonActionType.Navigate, target=screens[(i + j) % n_screens])
+            else:
+                e = mk_datalist(name=f"S{i}List{j}", description=f"list {j}", sources={ds["ItemsDataSource"]})
+            screen.view_elements.add(e)
+
+    module = Module(**_accepted_kwargs(Module, {"name": "MainModule", "screens": set(screens)}))
+    gui = GUIModel(**_accepted_kwargs(GUIModel, {
+        "name": "BenchApp", "package": "com.example.bench", "versionCode": "1", "versionName": "1.0",
+        "description": "import benchmark", "screenCompatibility": True, "modules": {module},
+    }))
+    gui.data_sources = set(ds.values())
+    _ensure_structural_binding(gui, ds, STRUCTURAL_MODULE)
+    return gui
+
+
+def _measure(py_path: str):
+    """Runs in the child process: exec of the generated module, as generate_app does."""
+    import importlib.util
+    import besser.BUML.metamodel.gui  # noqa: F401  (excluded from the timing)
+    import structural_community_platform  # noqa: F401
+
+    t0 = time.perf_counter()
+    spec = importlib.util.spec_from_file_location("generated_gui_model", py_path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    dt = time.perf_counter() - t0
+    print(json.dumps({"seconds": dt}))
+
+
+def _run(py_path: Path) -> float:
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    cmd = [sys.executable, __file__, "--child", str(py_path)]
+    out = subprocess.run(cmd, cwd=str(HERE), env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])["seconds"]
+
+
+def _best(py_path: Path, cold: bool, repeat: int) -> float:
+    """cold: no .pyc, the source is compiled on import; warm: .pyc already there."""
+    shutil.rmtree(py_path.parent / "__pycache__", ignore_errors=True)
+    if not cold:
+        py_compile.compile(str(py_path), doraise=True)
+    return min(_run(py_path) for _ in range(repeat)) * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--screens", type=int, nargs="+", default=[50, 200, 1000])
+    ap.add_argument("--elements", type=int, default=20, help="elements per screen")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    sys.path.insert(0, str(HERE))
+    if args.child:
+        _measure(args.child)
+        return
+
+    from m2m_dsml_to_gui_pruning_only_with_py_export import export_gui_model_to_python
+
+    print(f"{'screens':>8} {'elements':>9} {'':>5} {'portable ms':>12} {'direct ms':>10} {'speed-up':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.screens:
+            gui = build_synthetic_gui(n, args.elements)
+            paths = {}
+            for mode in ("portable", "direct"):
+                paths[mode] = Path(tmp) / f"gui_{n}_{mode}.py"
+                export_gui_model_to_python(gui, STRUCTURAL_MODULE, str(paths[mode]), mode=mode)
+            for cold in (True, False):
+                best = {mode: _best(path, cold, args.repeat) for mode, path in paths.items()}
+                print(f"{n:>8} {n * args.elements:>9} {'cold' if cold else 'warm':>5} {best['portable']:>12.1f} "
+                      f"{best['direct']:>10.1f} {best['portable'] / best['direct']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
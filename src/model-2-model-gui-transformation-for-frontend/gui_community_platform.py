@@ -62,8 +62,13 @@ def mk_screen(*, name: str, description: str, is_main: bool = False) -> Screen:
 def mk_module(*, name: str, screens: Set[Screen]) -> Module:
     return Module(**_accepted_kwargs(Module, {"name": name, "screens": set(screens)}))
 
-def mk_datasource(*, name: str, dataSourceClass: str, fields: Set) -> DataSourceElement:
-    return DataSourceElement(**_accepted_kwargs(DataSourceElement, {"name": name, "dataSourceClass": dataSourceClass, "fields": set(fields)}))
+def mk_datasource(*, name: str, dataSourceClass: str, fields: Set, cache_ttl: Optional[int] = None, size_hint: Optional[int] = None) -> DataSourceElement:
+    ds = DataSourceElement(**_accepted_kwargs(DataSourceElement, {"name": name, "dataSourceClass": dataSourceClass, "fields": set(fields)}))
+    if cache_ttl is not None:
+        ds.cache_ttl = cache_ttl  # seconds the generated web UI caches responses of this source
+    if size_hint is not None:
+        ds.size_hint = size_hint  # expected number of records (large lists are virtualized)
+    return ds
 
 # ----------------------------
 # 1. FULL baseline screens
@@ -80,13 +85,13 @@ BlankScreen = mk_screen(name="BlankScreen", description="Placeholder")
 # ----------------------------
 # 2. FULL baseline datasources (Sincronizado com Structural)
 # ----------------------------
-ItemsDataSource = mk_datasource(name="ItemsDataSource", dataSourceClass="Item", fields=set())
-TagsDataSource = mk_datasource(name="TagsDataSource", dataSourceClass="Tag", fields=set())
-RatingsDataSource = mk_datasource(name="RatingsDataSource", dataSourceClass="Rating", fields=set())
-MessagesDataSource = mk_datasource(name="MessagesDataSource", dataSourceClass="Message", fields=set())
-ConversationsDataSource = mk_datasource(name="ConversationsDataSource", dataSourceClass="Conversation", fields=set())
-CommunitiesDataSource = mk_datasource(name="CommunitiesDataSource", dataSourceClass="Community", fields=set())
-OffersDataSource = mk_datasource(name="OffersDataSource", dataSourceClass="Offer", fields=set())
+ItemsDataSource = mk_datasource(name="ItemsDataSource", dataSourceClass="Item", fields=set(), cache_ttl=60, size_hint=20000)
+TagsDataSource = mk_datasource(name="TagsDataSource", dataSourceClass="Tag", fields=set(), cache_ttl=3600, size_hint=50)
+RatingsDataSource = mk_datasource(name="RatingsDataSource", dataSourceClass="Rating", fields=set(), cache_ttl=300, size_hint=2000)
+MessagesDataSource = mk_datasource(name="MessagesDataSource", dataSourceClass="Message", fields=set(), cache_ttl=0, size_hint=5000)
+ConversationsDataSource = mk_datasource(name="ConversationsDataSource", dataSourceClass="Conversation", fields=set(), cache_ttl=30, size_hint=200)
+CommunitiesDataSource = mk_datasource(name="CommunitiesDataSource", dataSourceClass="Community", fields=set(), cache_ttl=3600, size_hint=100)
+OffersDataSource = mk_datasource(name="OffersDataSource", dataSourceClass="Offer", fields=set(), cache_ttl=30, size_hint=500)
 
 # ----------------------------
 # 3. View Elements
@@ -0,0 +1,188 @@
+"""
+gui_model_index.py
+
+Name-indexed view over a (cloned) BESSER GUIModel, used by the pruning rules
+of m2m_dsml_to_gui_pruning_only_with_py_export.py.
+
+Maps kept in sync with every mutation made through the index:
+  - screen name  -> Screen
+  - screen name  -> modules that contain it
+  - screen name  -> {element name -> [elements]}
+  - screen name  -> buttons whose targetScreen is that screen (reverse refs)
+  - datasource name -> DataSourceElement
+
+Removing a screen, removing an element or retargeting a button is O(1) (plus
+the number of modules/buttons actually touched), instead of a scan over every
+module, screen and view element per rule.
+
+With copy_on_write=True the screens and elements of the model are shared with
+a baseline and must not be mutated: the first edit to a screen replaces it
+(in its modules) by a shallow copy with its own view_elements set, and the
+first edit to a button replaces it by a copy inside its (copied) screen.
+Buttons that navigate to a copied screen are copied and repointed through the
+reverse refs, so the variant never references a superseded object. Only what
+the rules touch is materialised.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from besser.BUML.metamodel.gui import Button, ButtonActionType, DataSourceElement, GUIModel, Screen
+
+
+class GUIModelIndex:
+
+    def __init__(self, gui: GUIModel, copy_on_write: bool = False):
+        self.gui = gui
+        self.copy_on_write = copy_on_write
+        # id -> object for screens/buttons materialised by this index (copy_on_write)
+        self.owned: Dict[int, Any] = {}
+        self._replaced: Dict[int, Any] = {}
+        self._home: Dict[int, str] = {}          # button id -> name of the screen holding it
+        self.screens: Dict[str, Screen] = {}
+        self.modules_of: Dict[str, List[Any]] = {}
+        self.elements: Dict[str, Dict[str, List[Any]]] = {}
+        self.targeted_by: Dict[str, Set[Button]] = {}
+        self.datasources: Dict[str, DataSourceElement] = {}
+
+        for m in (getattr(gui, "modules", None) or set()):
+            for s in (getattr(m, "screens", None) or set()):
+                name = getattr(s, "name", "")
+                if name not in self.screens:
+                    self._add_screen(s)
+                self.modules_of[name].append(m)
+
+        for d in (getattr(gui, "data_sources", None) or set()):
+            self.datasources[getattr(d, "name", "")] = d
+
+    # --------------------------------------------------------
+    # bookkeeping
+    # --------------------------------------------------------
+    def _add_screen(self, screen: Screen):
+        name = getattr(screen, "name", "")
+        self.screens[name] = screen
+        self.modules_of.setdefault(name, [])
+        self.targeted_by.setdefault(name, set())
+        by_name: Dict[str, List[Any]] = {}
+        for e in (getattr(screen, "view_elements", None) or set()):
+            by_name.setdefault(getattr(e, "name", ""), []).append(e)
+            self._link_button(e)
+            if isinstance(e, Button):
+                self._home[id(e)] = name
+        self.elements[name] = by_name
+
+    def _link_button(self, e: Any):
+        target = getattr(e, "targetScreen", None) if isinstance(e, Button) else None
+        if target is not None:
+            self.targeted_by.setdefault(getattr(target, "name", ""), set()).add(e)
+
+    def _unlink_button(self, e: Any):
+        target = getattr(e, "targetScreen", None) if isinstance(e, Button) else None
+        if target is not None:
+            self.targeted_by.get(getattr(target, "name", ""), set()).discard(e)
+
+    # --------------------------------------------------------
+    # copy-on-write
+    # --------------------------------------------------------
+    def _own_screen(self, name: str) -> Screen:
+        screen = self.screens[name]
+        if not self.copy_on_write or id(screen) in self.owned:
+            return screen
+        own = copy.copy(screen)
+        own.view_elements = set(screen.view_elements)
+        self.owned[id(own)] = own
+        self.screens[name] = own
+        for m in self.modules_of.get(name, ()):
+            m.screens.discard(screen)
+            m.screens.add(own)
+        for b in list(self.targeted_by.get(name, ())):
+            b = self._own_button(b)
+            try: b.targetScreen = own
+            except Exception: pass
+        return own
+
+    def _own_button(self, button: Button) -> Button:
+        if not self.copy_on_write or id(button) in self.owned:
+            return button
+        if id(button) in self._replaced:
+            return self._replaced[id(button)]
+        home = self._home[id(button)]
+        screen = self._own_screen(home)
+        if id(button) in self._replaced:   # owning the home screen may have repointed it already
+            return self._replaced[id(button)]
+        own = copy.copy(button)
+        self.owned[id(own)] = own
+        self._replaced[id(button)] = own
+        self._home[id(own)] = home
+        screen.view_elements.discard(button)
+        screen.view_elements.add(own)
+        elems = self.elements[home][getattr(button, "name", "")]
+        elems[elems.index(button)] = own
+        self._unlink_button(button)
+        self._link_button(own)
+        return own
+
+    # --------------------------------------------------------
+    # queries
+    # --------------------------------------------------------
+    def screen(self, name: str) -> Optional[Screen]:
+        return self.screens.get(name)
+
+    def element(self, screen_name: str, element_name: str) -> Optional[Any]:
+        found = self.elements.get(screen_name, {}).get(element_name)
+        return found[0] if found else None
+
+    def buttons_targeting(self, screen_name: str) -> Set[Button]:
+        return set(self.targeted_by.get(screen_name, ()))
+
+    def dangling_buttons(self) -> List[Button]:
+        """Buttons that still navigate to a screen no longer in the model."""
+        return [b for name, buttons in self.targeted_by.items() if name not in self.screens for b in buttons]
+
+    # --------------------------------------------------------
+    # mutations
+    # --------------------------------------------------------
+    def remove_screen(self, name: str) -> bool:
+        screen = self.screens.pop(name, None)
+        if screen is None:
+            return False
+        for m in self.modules_of.pop(name, ()):
+            m.screens.discard(screen)
+        for elems in self.elements.pop(name, {}).values():
+            for e in elems:
+                self._unlink_button(e)
+        # targeted_by[name] is kept: buttons elsewhere may still point here
+        return True
+
+    def remove_element(self, screen_name: str, element_name: str) -> bool:
+        if screen_name not in self.screens or not self.elements[screen_name].get(element_name):
+            return False
+        screen = self._own_screen(screen_name)
+        elems = self.elements[screen_name].pop(element_name)
+        for e in elems:
+            screen.view_elements.discard(e)
+            self._unlink_button(e)
+        return True
+
+    def set_button_target(self, screen_name: str, button_name: str,
+                          action: ButtonActionType, target: Optional[Screen]):
+        for e in list(self.elements.get(screen_name, {}).get(button_name, ())):
+            if not isinstance(e, Button):
+                continue
+            e = self._own_button(e)
+            self._unlink_button(e)
+            if hasattr(e, "targetScreen"):
+                try: e.targetScreen = target
+                except Exception: pass
+            if hasattr(e, "actionType"):
+                try: e.actionType = action
+                except Exception: pass
+            self._link_button(e)
+
+    def remove_datasources(self, names: Iterable[str]) -> List[str]:
+        removed = [n for n in names if self.datasources.pop(n, None) is not None]
+        if removed:
+            self.gui.data_sources = set(self.datasources.values())
+        return removed
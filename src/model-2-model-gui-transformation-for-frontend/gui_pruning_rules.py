@@ -0,0 +1,147 @@
+"""
+gui_pruning_rules.py
+
+DSML -> GUI pruning as a declarative rule table.
+
+Each PruneRule pairs a predicate over the AppConfig feature flags
+(dsml_features.FEATURE_FLAGS, e.g. f["messaging.chat"]) with the edits it
+implies: screens / elements / datasources to remove and buttons to retarget.
+
+compile_plan(mask) evaluates the whole table once per feature mask and merges
+the edits of every rule that fires into a PruningPlan (duplicates collapse,
+removals win over retargets). Plans are cached by mask, so a batch pays for
+compilation once per distinct feature set. apply_plan() then executes the
+plan against a GUIModelIndex, one O(1) edit per entry.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Tuple
+
+from besser.BUML.metamodel.gui import ButtonActionType
+
+from dsml_features import describe_mask, feature_mask
+from gui_model_index import GUIModelIndex
+
+Flags = Dict[str, bool]
+
+
+def _price(f: Flags) -> bool:
+    return f["listings.priceMode"]
+
+
+def _any_payment(f: Flags) -> bool:
+    return f["payments.mbway"] or f["payments.multibanco"] or f["payments.paypal"]
+
+
+def _payments_on(f: Flags) -> bool:
+    return _price(f) and _any_payment(f)
+
+
+def _login(f: Flags) -> bool:
+    return f["accounts.localLogin"] or f["accounts.oauthLogin"] or f["accounts.phoneVerification"]
+
+
+def _ratings(f: Flags) -> bool:
+    return f["ratings.simple"] or f["ratings.bidirectional"]
+
+
+@dataclass(frozen=True)
+class PruneRule:
+    name: str
+    when: Callable[[Flags], bool]
+    remove_screens: Tuple[str, ...] = ()
+    remove_elements: Tuple[Tuple[str, str], ...] = ()          # (screen, element)
+    remove_datasources: Tuple[str, ...] = ()
+    retarget: Tuple[Tuple[str, str, str], ...] = ()            # (screen, button, target screen), Navigate
+    require_screens: Tuple[str, ...] = ()                      # baseline must provide these when the rule fires
+
+
+RULES: Tuple[PruneRule, ...] = (
+    PruneRule("price-off", lambda f: not _price(f),
+              remove_elements=(("ItemDetailsScreen", "ItemPrice"),)),
+    PruneRule("payments-off", lambda f: not _payments_on(f),
+              remove_elements=(("ItemDetailsScreen", "PayBtn"),),
+              remove_screens=("PaymentScreen",)),
+    PruneRule("payments-on", _payments_on,
+              require_screens=("PaymentScreen",),
+              retarget=(("ItemDetailsScreen", "PayBtn", "PaymentScreen"),)),
+    PruneRule("mbway-off", lambda f: _payments_on(f) and not f["payments.mbway"],
+              remove_elements=(("PaymentScreen", "MBWayBtn"),)),
+    PruneRule("multibanco-off", lambda f: _payments_on(f) and not f["payments.multibanco"],
+              remove_elements=(("PaymentScreen", "MultibancoBtn"),)),
+    PruneRule("paypal-off", lambda f: _payments_on(f) and not f["payments.paypal"],
+              remove_elements=(("PaymentScreen", "PayPalBtn"),)),
+    PruneRule("chat-off", lambda f: not f["messaging.chat"],
+              remove_elements=(("ItemDetailsScreen", "ContactBtn"),),
+              remove_screens=("ChatScreen",),
+              remove_datasources=("MessagesDataSource", "ConversationsDataSource")),
+    PruneRule("chat-on", lambda f: f["messaging.chat"],
+              require_screens=("ChatScreen",),
+              retarget=(("ItemDetailsScreen", "ContactBtn", "ChatScreen"),)),
+    PruneRule("ratings-off", lambda f: not _ratings(f),
+              remove_elements=(("ItemDetailsScreen", "ItemRatingsList"),),
+              remove_screens=("RatingsListScreen",),
+              remove_datasources=("RatingsDataSource",)),
+    PruneRule("subcommunities-off", lambda f: not f["subcommunities.enabled"],
+              remove_screens=("SubcommunitySelectorScreen",),
+              remove_datasources=("CommunitiesDataSource",)),
+    PruneRule("login-off", lambda f: f["accessPolicies.anonymousBrowse"] or not _login(f),
+              remove_screens=("LoginScreen",)),
+)
+
+
+@dataclass(frozen=True)
+class PruningPlan:
+    fired: Tuple[str, ...]
+    remove_screens: FrozenSet[str]
+    remove_elements: FrozenSet[Tuple[str, str]]
+    remove_datasources: FrozenSet[str]
+    retarget: Tuple[Tuple[str, str, str], ...]
+    require_screens: FrozenSet[str]
+
+
+@lru_cache(maxsize=None)
+def compile_plan(mask: int, rules: Tuple[PruneRule, ...] = RULES) -> PruningPlan:
+    """Evaluates every rule once for this feature mask and merges what fires."""
+    flags = describe_mask(mask)
+    fired = []
+    screens, elements, datasources, required = set(), set(), set(), set()
+    retarget: Dict[Tuple[str, str], str] = {}
+    for rule in rules:
+        if not rule.when(flags):
+            continue
+        fired.append(rule.name)
+        screens.update(rule.remove_screens)
+        elements.update(rule.remove_elements)
+        datasources.update(rule.remove_datasources)
+        required.update(rule.require_screens)
+        for screen, button, target in rule.retarget:
+            retarget[(screen, button)] = target
+
+    live_retargets = tuple(
+        (screen, button, target) for (screen, button), target in retarget.items()
+        if (screen, button) not in elements and screen not in screens
+    )
+    return PruningPlan(tuple(fired), frozenset(screens), frozenset(elements),
+                       frozenset(datasources), live_retargets, frozenset(required))
+
+
+def plan_for(dsml) -> PruningPlan:
+    return compile_plan(feature_mask(dsml))
+
+
+def apply_plan(ix: GUIModelIndex, plan: PruningPlan):
+    for name in sorted(plan.require_screens):
+        if ix.screen(name) is None:
+            raise RuntimeError(f"Baseline FULL missing {name}.")
+
+    for screen, element in plan.remove_elements:
+        ix.remove_element(screen, element)
+    for screen, button, target in plan.retarget:
+        ix.set_button_target(screen, button, ButtonActionType.Navigate, ix.screen(target))
+    for name in plan.remove_screens:
+        ix.remove_screen(name)
+    ix.remove_datasources(plan.remove_datasources)
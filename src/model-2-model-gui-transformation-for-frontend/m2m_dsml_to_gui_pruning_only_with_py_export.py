@@ -19,17 +19,26 @@ Run:
 from __future__ import annotations
 
 from typing import Optional, Dict, Set, Tuple, Any, List
+from functools import lru_cache
 import inspect
 import importlib
 import importlib.util
+import hashlib
+import json
+import py_compile
 from pathlib import Path
 import os
-
-# Optional DSML XMI loader (pyecore)
-try:
-    from pyecore.resources import ResourceSet
-except Exception:
-    ResourceSet = None
+import sys
+import time
+
+# Shared DSML loader (src/pipeline): frozen AppConfig snapshots cached on disk
+sys.path.append(str(Path(__file__).resolve().parent.parent / "pipeline"))
+from build_cache import CACHE_ROOT, FileHasher
+from dsml_loader import load_dsml_appconfig
+from dsml_features import cosmetic_overlay, group_by_features
+from gui_model_index import GUIModelIndex
+from gui_pruning_rules import PruningPlan, apply_plan, plan_for
+from structural_binding import bind_datasources
 
 # BESSER GUI metamodel
 from besser.BUML.metamodel.gui import (
@@ -38,32 +47,50 @@ from besser.BUML.metamodel.gui import (
     ButtonType, ButtonActionType, InputFieldType
 )
 
-# BESSER Structural metamodel types
-from besser.BUML.metamodel.structural import Property as StructuralProperty
-
 
 # ------------------------------------------------------------
-# DSML loader
+# Baseline import
 # ------------------------------------------------------------
-def load_dsml_appconfig(xmi_path: str, ecore_path: str):
-    if ResourceSet is None:
-        raise RuntimeError("pyecore is required to load DSML XMI. Install pyecore.")
-    rset = ResourceSet()
-    ecore_resource = rset.get_resource(ecore_path)
-    mm_root = ecore_resource.contents[0]
-    rset.metamodel_registry[mm_root.nsURI] = mm_root
-    xmi_res = rset.get_resource(xmi_path)
-    return xmi_res.contents[0]
+# The baseline is loaded once per process per (path, mtime, size), and persisted
+# as a JSON snapshot (src/.pipeline_cache/gui_baseline/) keyed by the SHA-256 of
+# the file and the BESSER version, so later runs rebuild it without executing
+# gui_community_platform.py. See "Baseline snapshot" below for what it holds.
+BASELINE_SNAPSHOT_VERSION = 3
+BASELINE_CACHE_DIR = CACHE_ROOT / "gui_baseline"
 
+_baseline_hasher = FileHasher()
+_baselines: Dict[Tuple[str, int, int], GUIModel] = {}
 
-# ------------------------------------------------------------
-# Baseline import
-# ------------------------------------------------------------
-def _import_baseline_gui_model(baseline_py_path: str) -> GUIModel:
+
+def _import_baseline_gui_model(baseline_py_path: str, use_cache: bool = True,
+                               cache_dir: Path = BASELINE_CACHE_DIR) -> GUIModel:
+    """
+    Lookup order: in-process memo -> on-disk snapshot -> exec of the module.
+    """
     p = Path(baseline_py_path).resolve()
     if not p.exists():
         raise FileNotFoundError(f"Baseline GUI file not found: {p}")
+    if not use_cache:
+        return _exec_baseline_gui_model(p)
+
+    st = p.stat()
+    key = (str(p), st.st_mtime_ns, st.st_size)
+    gui = _baselines.get(key)
+    if gui is not None:
+        return gui
+
+    snap = _baseline_snapshot_path(Path(cache_dir), _baseline_hasher.file_digest(p))
+    gui = _read_baseline_snapshot(snap)
+    if gui is None:
+        gui = _exec_baseline_gui_model(p)
+        data = _baseline_to_snapshot(gui)
+        if data is not None:
+            _write_baseline_snapshot(snap, data, p)
+    _baselines[key] = gui
+    return gui
 
+
+def _exec_baseline_gui_model(p: Path) -> GUIModel:
     spec = importlib.util.spec_from_file_location("baseline_gui_module", str(p))
     if spec is None or spec.loader is None:
         raise RuntimeError(f"Failed to load baseline module from: {p}")
@@ -74,34 +101,49 @@ def _import_baseline_gui_model(baseline_py_path: str) -> GUIModel:
         raise AttributeError("Baseline module must define `community_gui_model: GUIModel`.")
     return getattr(mod, "community_gui_model")
 
+# ------------------------------------------------------------
+# Constructor adapters
+# ------------------------------------------------------------
+# BESSER GUI classes spell some keywords differently across versions
+# (buttonType / button_type, list_sources / listSources, ...). Each logical
+# keyword maps to its spellings in order of preference.
+_KEYWORD_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "validation_rules": ("validationRules", "validation", "validation_rules"),
+    "field_type": ("field_type", "type", "inputFieldType", "fieldType"),
+    "sources": ("list_sources", "listSources", "sources"),
+    "button_type": ("buttonType", "button_type"),
+    "action_type": ("actionType", "action_type"),
+    "target": ("targetScreen",),
+}
+
+# class -> {keyword we pass: keyword its __init__ accepts}, resolved once per class
+_CTOR_ADAPTERS: Dict[type, Dict[str, str]] = {}
+
+
+def _ctor_adapter(cls) -> Dict[str, str]:
+    adapter = _CTOR_ADAPTERS.get(cls)
+    if adapter is None:
+        params = set(inspect.signature(cls.__init__).parameters)
+        params.discard("self")
+        adapter = {name: name for name in params}
+        for logical, spellings in _KEYWORD_ALIASES.items():
+            for spelled in spellings:
+                if spelled in params:
+                    adapter[logical] = spelled
+                    break
+        _CTOR_ADAPTERS[cls] = adapter
+    return adapter
+
+
 def _accepted_kwargs(cls, provided: dict) -> dict:
-    sig = inspect.signature(cls.__init__)
-    params = set(sig.parameters.keys())
-    params.discard("self")
-    return {k: v for k, v in provided.items() if k in params}
+    """Renames provided keywords to cls's spelling and drops the ones it does not accept."""
+    adapter = _ctor_adapter(cls)
+    return {adapter[k]: v for k, v in provided.items() if k in adapter}
 
-def mk_input(*, name: str, description: str, field_type=InputFieldType.Text, validation_rules: str = "") -> InputField:
-    base = {"name": name, "description": description}
-    p = inspect.signature(InputField.__init__).parameters
-
-    # validation
-    if "validationRules" in p:
-        base["validationRules"] = validation_rules
-    elif "validation" in p:
-        base["validation"] = validation_rules
-    elif "validation_rules" in p:
-        base["validation_rules"] = validation_rules
-
-    # field type key
-    if "field_type" in p:
-        base["field_type"] = field_type
-    elif "type" in p:
-        base["type"] = field_type
-    elif "inputFieldType" in p:
-        base["inputFieldType"] = field_type
-    elif "fieldType" in p:
-        base["fieldType"] = field_type
 
+def mk_input(*, name: str, description: str, field_type=InputFieldType.Text, validation_rules: str = "") -> InputField:
+    base = {"name": name, "description": description,
+            "validation_rules": validation_rules, "field_type": field_type}
     return InputField(**_accepted_kwargs(InputField, base))
 
 
@@ -118,20 +160,26 @@ def mk_screen(*, name: str, description: str, is_main: bool = False) -> Screen:
     return Screen(**_accepted_kwargs(Screen, base))
 
 
-def mk_datasource(*, name: str, dataSourceClass, fields: Set) -> DataSourceElement:
+# Plain attributes a baseline datasource may carry for the web UI generator
+# (not BESSER attributes): response cache TTL in seconds, expected item count
+DATASOURCE_HINTS: Tuple[str, ...] = ("cache_ttl", "size_hint")
+
+
+def _datasource_hints(d: Any) -> Dict[str, Any]:
+    return {h: getattr(d, h) for h in DATASOURCE_HINTS if getattr(d, h, None) is not None}
+
+
+def mk_datasource(*, name: str, dataSourceClass, fields: Set, **hints) -> DataSourceElement:
     base = {"name": name, "dataSourceClass": dataSourceClass, "fields": set(fields)}
-    return DataSourceElement(**_accepted_kwargs(DataSourceElement, base))
+    d = DataSourceElement(**_accepted_kwargs(DataSourceElement, base))
+    for h, value in hints.items():
+        if h in DATASOURCE_HINTS and value is not None:
+            setattr(d, h, value)
+    return d
 
 
 def mk_datalist(*, name: str, description: str, sources: Set[DataSourceElement]) -> DataList:
-    p = inspect.signature(DataList.__init__).parameters
-    base = {"name": name, "description": description}
-    if "list_sources" in p:
-        base["list_sources"] = set(sources)
-    elif "listSources" in p:
-        base["listSources"] = set(sources)
-    elif "sources" in p:
-        base["sources"] = set(sources)
+    base = {"name": name, "description": description, "sources": set(sources)}
     return DataList(**_accepted_kwargs(DataList, base))
 
 
@@ -143,25 +191,14 @@ def mk_button(*, name: str, description: str, label: str,
     Some BESSER variants validate Navigate requires targetScreen at construction.
     We protect by using OpenForm during ctor if target is None.
     """
-    p = inspect.signature(Button.__init__).parameters
-    base = {"name": name, "description": description, "label": label}
-
-    if "buttonType" in p:
-        base["buttonType"] = button_type
-    elif "button_type" in p:
-        base["button_type"] = button_type
-
     ctor_action = action_type
     if action_type == ButtonActionType.Navigate and target is None:
         ctor_action = ButtonActionType.OpenForm
 
-    if "actionType" in p:
-        base["actionType"] = ctor_action
-    elif "action_type" in p:
-        base["action_type"] = ctor_action
-
-    if target is not None and "targetScreen" in p:
-        base["targetScreen"] = target
+    base = {"name": name, "description": description, "label": label,
+            "button_type": button_type, "action_type": ctor_action}
+    if target is not None:
+        base["target"] = target
 
     b = Button(**_accepted_kwargs(Button, base))
 
@@ -214,6 +251,7 @@ def _clone_gui_model(template: GUIModel) -> Tuple[GUIModel, Dict[str, Screen], D
             name=getattr(d, "name", "DataSource"),
             dataSourceClass=getattr(d, "dataSourceClass", None),
             fields=set(fields),
+            **_datasource_hints(d),
         )
         datasources_by_name[dd.name] = dd
     cloned.data_sources = set(datasources_by_name.values())
@@ -305,32 +343,160 @@ def _clone_gui_model(template: GUIModel) -> Tuple[GUIModel, Dict[str, Screen], D
     return cloned, screens_by_name, datasources_by_name
 
 
-def _remove_screen(gui: GUIModel, screen_name: str):
-    for m in (getattr(gui, "modules", None) or set()):
-        rm = [s for s in (getattr(m, "screens", None) or set()) if getattr(s, "name", "") == screen_name]
-        for s in rm:
-            m.screens.discard(s)
+# ------------------------------------------------------------
+# Baseline snapshot
+# ------------------------------------------------------------
+# Plain-JSON form of a baseline, holding exactly what _clone_gui_model reads
+# (the pipeline only ever consumes the baseline through that clone). Baselines
+# the format cannot express (non-empty datasource fields, classes instead of
+# class names, other element kinds, duplicate screen names) are not persisted.
+_SNAPSHOT_SCALARS = (str, int, float, bool, type(None))
 
 
-def _remove_element(screen: Optional[Screen], element_name: str):
-    if screen is None:
-        return
-    rm = [e for e in (getattr(screen, "view_elements", None) or set()) if getattr(e, "name", "") == element_name]
-    for e in rm:
-        screen.view_elements.discard(e)
+def _enum_name(value: Any) -> Optional[str]:
+    return getattr(value, "name", None) if value is not None else None
 
 
-def _set_button_target(screen: Optional[Screen], button_name: str, action: ButtonActionType, target: Optional[Screen]):
-    if screen is None:
-        return
-    for e in (getattr(screen, "view_elements", None) or set()):
-        if isinstance(e, Button) and getattr(e, "name", "") == button_name:
-            if hasattr(e, "targetScreen"):
-                try: e.targetScreen = target
-                except Exception: pass
-            if hasattr(e, "actionType"):
-                try: e.actionType = action
+def _baseline_to_snapshot(gui: GUIModel) -> Optional[Dict[str, Any]]:
+    datasources = {}
+    for d in (getattr(gui, "data_sources", None) or set()):
+        cls = getattr(d, "dataSourceClass", None)
+        hints = _datasource_hints(d)
+        if not isinstance(cls, (str, type(None))) or (getattr(d, "fields", None) or set()) \
+                or not all(isinstance(v, _SNAPSHOT_SCALARS) for v in hints.values()):
+            return None
+        datasources[getattr(d, "name", "DataSource")] = [cls, hints]
+
+    screens: Dict[str, Screen] = {}
+    for m in (getattr(gui, "modules", None) or set()):
+        for s in (getattr(m, "screens", None) or set()):
+            if screens.setdefault(getattr(s, "name", "Screen"), s) is not s:
+                return None
+
+    screen_data = []
+    for name, s in sorted(screens.items()):
+        props = {k: getattr(s, k) for k in ("x_dpi", "y_dpi", "screen_size") if hasattr(s, k)}
+        if not all(isinstance(v, _SNAPSHOT_SCALARS) for v in props.values()):
+            return None
+        elements = []
+        for e in (getattr(s, "view_elements", None) or set()):
+            entry = {"name": getattr(e, "name", None), "description": getattr(e, "description", "")}
+            if isinstance(e, InputField):
+                entry.update(kind="input",
+                             field_type=_enum_name(getattr(e, "field_type", None) or getattr(e, "type", None)),
+                             validation_rules=getattr(e, "validationRules", "") or getattr(e, "validation", "") or "")
+            elif isinstance(e, Button):
+                tgt = getattr(e, "targetScreen", None)
+                if tgt is not None and screens.get(getattr(tgt, "name", None)) is not tgt:
+                    return None
+                entry.update(kind="button", label=getattr(e, "label", getattr(e, "name", "Button")),
+                             button_type=_enum_name(getattr(e, "buttonType", None)),
+                             action_type=_enum_name(getattr(e, "actionType", None)),
+                             target=getattr(tgt, "name", None))
+            elif isinstance(e, DataList):
+                srcs = getattr(e, "list_sources", None) or getattr(e, "listSources", None) or getattr(e, "sources", None) or set()
+                names = sorted(getattr(src, "name", "") for src in srcs)
+                if not all(n in datasources for n in names):
+                    return None
+                entry.update(kind="datalist", sources=names)
+            else:
+                return None
+            elements.append(entry)
+        elements.sort(key=lambda x: x["name"] or "")
+        screen_data.append({"name": name, "description": getattr(s, "description", ""),
+                            "is_main": bool(getattr(s, "is_main_page", False)), "props": props,
+                            "elements": elements})
+
+    vc = getattr(gui, "viewComponent", None)
+    return {
+        "gui": {k: getattr(gui, k, None) for k in
+                ("name", "package", "versionCode", "versionName", "description", "screenCompatibility")},
+        "view_component": None if vc is None else {"name": getattr(vc, "name", None),
+                                                   "description": getattr(vc, "description", "")},
+        "datasources": datasources,
+        "screens": screen_data,
+        "modules": sorted(({"name": getattr(m, "name", "Module"),
+                            "screens": sorted(getattr(s, "name", "Screen") for s in (getattr(m, "screens", None) or set()))}
+                           for m in (getattr(gui, "modules", None) or set())), key=lambda m: m["name"]),
+    }
+
+
+def _baseline_from_snapshot(data: Dict[str, Any]) -> GUIModel:
+    g = data["gui"]
+    gui = GUIModel(**_accepted_kwargs(GUIModel, {
+        "name": g["name"], "package": g["package"], "versionCode": g["versionCode"],
+        "versionName": g["versionName"], "description": g["description"],
+        "screenCompatibility": g["screenCompatibility"], "modules": set(),
+    }))
+    if data["view_component"] is not None:
+        gui.viewComponent = ViewComponent(**_accepted_kwargs(ViewComponent, data["view_component"]))
+
+    datasources = {name: mk_datasource(name=name, dataSourceClass=cls, fields=set(), **hints)
+                   for name, (cls, hints) in data["datasources"].items()}
+    gui.data_sources = set(datasources.values())
+
+    screens: Dict[str, Screen] = {}
+    for sd in data["screens"]:
+        sc = mk_screen(name=sd["name"], description=sd["description"], is_main=sd["is_main"])
+        for k, v in sd["props"].items():
+            if hasattr(sc, k):
+                try: setattr(sc, k, v)
                 except Exception: pass
+        screens[sd["name"]] = sc
+
+    for sd in data["screens"]:
+        elements = set()
+        for e in sd["elements"]:
+            if e["kind"] == "input":
+                ftype = InputFieldType[e["field_type"]] if e["field_type"] else InputFieldType.Text
+                elements.add(mk_input(name=e["name"], description=e["description"], field_type=ftype,
+                                      validation_rules=e["validation_rules"]))
+            elif e["kind"] == "button":
+                elements.add(mk_button(
+                    name=e["name"], description=e["description"], label=e["label"],
+                    button_type=ButtonType[e["button_type"]] if e["button_type"] else ButtonType.TextButton,
+                    action_type=ButtonActionType[e["action_type"]] if e["action_type"] else ButtonActionType.Navigate,
+                    target=screens[e["target"]] if e["target"] else None,
+                ))
+            else:
+                elements.add(mk_datalist(name=e["name"], description=e["description"],
+                                         sources={datasources[n] for n in e["sources"]}))
+        screens[sd["name"]].view_elements = elements
+
+    for md in data["modules"]:
+        gui.modules.add(Module(**_accepted_kwargs(Module, {
+            "name": md["name"], "screens": {screens[n] for n in md["screens"]},
+        })))
+    return gui
+
+
+def _baseline_snapshot_path(cache_dir: Path, digest: str) -> Path:
+    key = hashlib.sha256(f"{BASELINE_SNAPSHOT_VERSION}:{_besser_version()}:{digest}".encode("ascii")).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _read_baseline_snapshot(path: Path) -> Optional[GUIModel]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != BASELINE_SNAPSHOT_VERSION:
+        return None
+    try:
+        return _baseline_from_snapshot(data["baseline"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _write_baseline_snapshot(path: Path, data: Dict[str, Any], source: Path):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": BASELINE_SNAPSHOT_VERSION, "source": str(source), "baseline": data}
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
 
 
 def _prune_ds_field(ds: Optional[DataSourceElement], field_obj: Any):
@@ -342,102 +508,9 @@ def _prune_ds_field(ds: Optional[DataSourceElement], field_obj: Any):
     ds.fields = set(fields) - {field_obj}
 
 # ------------------------------------------------------------
-def _get_structural_class(st_mod, name: str):
-    if not hasattr(st_mod, name):
-        raise RuntimeError(f"structural binding missing: {st_mod.__name__}.{name}")
-    return getattr(st_mod, name)
-
-
-def _get_attr_prop(cls_obj, prop_name: str) -> Optional[StructuralProperty]:
-    attrs = getattr(cls_obj, "attributes", None) or set()
-    if isinstance(attrs, list):
-        attrs = set(attrs)
-    for a in attrs:
-        if isinstance(a, StructuralProperty) and getattr(a, "name", None) == prop_name:
-            return a
-            
-    for a in attrs:
-        if getattr(a, "name", None) == prop_name:
-            return a  # type: ignore
-    return None
-
-
 def _ensure_structural_binding(gui: GUIModel, datasources_by_name: Dict[str, DataSourceElement], structural_module: str):
-    st = importlib.import_module(structural_module)
-
-    Item = _get_structural_class(st, "Item")
-    Community = _get_structural_class(st, "Community")
-    Message = _get_structural_class(st, "Message")
-    Conversation = _get_structural_class(st, "Conversation")
-
-    # Optional classes
-    Category = getattr(st, "Category", None)
-    Rating = getattr(st, "Rating", None)
-    Offer = getattr(st, "Offer", None)
-
-    if "ItemsDataSource" in datasources_by_name:
-        d = datasources_by_name["ItemsDataSource"]
-        d.dataSourceClass = Item
-        fields = set()
-
-        for pn in ["title", "description", "createdAt", "state", "condition", "kind"]:
-            p = _get_attr_prop(Item, pn)
-            if p is not None:
-                fields.add(p)
-
-        d.fields = fields
-
-    if "TagsDataSource" in datasources_by_name:
-        d = datasources_by_name["TagsDataSource"]
-        if Category is not None:
-            d.dataSourceClass = Category
-            name_prop = _get_attr_prop(Category, "name")
-            d.fields = {name_prop} if name_prop is not None else set()
-        else:
-            del datasources_by_name["TagsDataSource"]
-
-    if "RatingsDataSource" in datasources_by_name:
-        d = datasources_by_name["RatingsDataSource"]
-        if Rating is not None:
-            d.dataSourceClass = Rating
-            fields = set()
-            for pn in ["stars", "comment", "createdAt"]:
-                p = _get_attr_prop(Rating, pn)
-                if p is not None:
-                    fields.add(p)
-            d.fields = fields
-        else:
-            del datasources_by_name["RatingsDataSource"]
-
-    if "MessagesDataSource" in datasources_by_name:
-        d = datasources_by_name["MessagesDataSource"]
-        d.dataSourceClass = Message
-        fields = set()
-        for pn in ["content", "sentAt", "kind"]:
-            p = _get_attr_prop(Message, pn)
-            if p is not None:
-                fields.add(p)
-        d.fields = fields
-
-    if "ConversationsDataSource" in datasources_by_name:
-        d = datasources_by_name["ConversationsDataSource"]
-        d.dataSourceClass = Conversation
-        d.fields = set()
-
-    if "CommunitiesDataSource" in datasources_by_name:
-        d = datasources_by_name["CommunitiesDataSource"]
-        d.dataSourceClass = Community
-        name_prop = _get_attr_prop(Community, "name")
-        d.fields = {name_prop} if name_prop is not None else set()
-
-    if "OffersDataSource" in datasources_by_name:
-        if Offer is not None:
-            d = datasources_by_name["OffersDataSource"]
-            d.dataSourceClass = Offer
-            d.fields = set()
-        else:
-            del datasources_by_name["OffersDataSource"]
-
+    """Binds the datasources per structural_binding.BINDINGS (optional classes missing: datasource dropped)."""
+    bind_datasources(datasources_by_name, structural_module)
     gui.data_sources = set(datasources_by_name.values())
 
 def _safe_ident(s: str) -> str:
@@ -452,7 +525,40 @@ def _safe_ident(s: str) -> str:
     return t
 
 
-def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py: str = "generated_gui_model.py"):
+@lru_cache(maxsize=None)
+def _besser_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("besser")
+    except Exception:
+        return "unknown"
+
+
+def _direct_call(cls, values: List[Tuple[str, str]]) -> str:
+    """
+    Constructor call source for the "direct" export: values are (keyword, source
+    expression) pairs, renamed to cls's spelling now instead of at import time.
+    """
+    adapter = _ctor_adapter(cls)
+    args = ", ".join(f"{adapter[k]}={v}" for k, v in values if k in adapter)
+    return f"{cls.__name__}({args})"
+
+
+def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py: str = "generated_gui_model.py",
+                               mode: str = "direct"):
+    """
+    Writes gui as a Python module exposing `community_gui_model`.
+
+    mode="direct"   : BESSER keyword names are resolved here and the module
+                      calls the constructors directly (no inspect at import);
+                      it is also byte-compiled right away.
+                      Tied to the BESSER version installed at generation time.
+    mode="portable" : the module carries _accepted_kwargs/mk_* helpers and
+                      resolves keyword names itself when imported.
+    """
+    if mode not in ("direct", "portable"):
+        raise ValueError(f"Unknown export mode: {mode!r} (expected 'direct' or 'portable')")
+    direct = mode == "direct"
     p = Path(output_py).resolve()
 
     modules = getattr(gui, "modules", None) or set()
@@ -483,20 +589,47 @@ def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py:
             needed_classes.add(getattr(cls, "name"))
 
     L: List[str] = []
-    L += ['"""', 'generated_gui_model.py', '', 'FULL generated GUI model (Python) from M2M (pruning-only).', '"""', ""]
-    L += ["from __future__ import annotations", "import inspect", "from typing import Set, Optional", ""]
+    if direct:
+        L += ['"""', 'generated_gui_model.py', '', 'FULL generated GUI model (Python) from M2M (pruning-only).',
+              f'Direct export: constructor keywords resolved for BESSER {_besser_version()}.', '"""', ""]
+        L += ["from __future__ import annotations", ""]
+    else:
+        L += ['"""', 'generated_gui_model.py', '', 'FULL generated GUI model (Python) from M2M (pruning-only).', '"""', ""]
+        L += ["from __future__ import annotations", "import inspect", "from typing import Set, Optional", ""]
     L += ["from besser.BUML.metamodel.gui import (",
           "    GUIModel, Module, Screen, Button, InputField, DataList,",
           "    DataSourceElement, ViewComponent,",
           "    ButtonType, ButtonActionType, InputFieldType",
           ")", ""]
     L += [f"import {structural_module} as st", ""]
-    L += [
+    L += [] if direct else [
+        "_KEYWORD_ALIASES = {",
+        "    'validation_rules': ('validationRules', 'validation', 'validation_rules'),",
+        "    'field_type': ('field_type', 'type', 'inputFieldType', 'fieldType'),",
+        "    'sources': ('list_sources', 'listSources', 'sources'),",
+        "    'button_type': ('buttonType', 'button_type'),",
+        "    'action_type': ('actionType', 'action_type'),",
+        "    'target': ('targetScreen',),",
+        "}",
+        "_CTOR_ADAPTERS = {}",
+        "",
+        "def _ctor_adapter(cls) -> dict:",
+        "    adapter = _CTOR_ADAPTERS.get(cls)",
+        "    if adapter is None:",
+        "        params = set(inspect.signature(cls.__init__).parameters)",
+        "        params.discard('self')",
+        "        adapter = {name: name for name in params}",
+        "        for logical, spellings in _KEYWORD_ALIASES.items():",
+        "            for spelled in spellings:",
+        "                if spelled in params:",
+        "                    adapter[logical] = spelled",
+        "                    break",
+        "        _CTOR_ADAPTERS[cls] = adapter",
+        "    return adapter",
+        "",
         "def _accepted_kwargs(cls, provided: dict) -> dict:",
-        "    sig = inspect.signature(cls.__init__)",
-        "    params = set(sig.parameters.keys())",
-        "    params.discard('self')",
-        "    return {k: v for k, v in provided.items() if k in params}",
+        "    adapter = _ctor_adapter(cls)",
+        "    return {adapter[k]: v for k, v in provided.items() if k in adapter}",
         "",
         "def _get_prop(cls_obj, prop_name: str):",
         "    attrs = getattr(cls_obj, 'attributes', None) or set()",
@@ -521,31 +654,20 @@ def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py:
         "    return DataSourceElement(**_accepted_kwargs(DataSourceElement, base))",
         "",
         "def mk_input(*, name: str, description: str, field_type=InputFieldType.Text, validation_rules: str = '') -> InputField:",
-        "    base = {'name': name, 'description': description}",
-        "    p = inspect.signature(InputField.__init__).parameters",
-        "    if 'validationRules' in p: base['validationRules'] = validation_rules",
-        "    elif 'validation' in p: base['validation'] = validation_rules",
-        "    elif 'validation_rules' in p: base['validation_rules'] = validation_rules",
-        "    if 'field_type' in p: base['field_type'] = field_type",
-        "    elif 'type' in p: base['type'] = field_type",
-        "    elif 'inputFieldType' in p: base['inputFieldType'] = field_type",
-        "    elif 'fieldType' in p: base['fieldType'] = field_type",
+        "    base = {'name': name, 'description': description,",
+        "            'validation_rules': validation_rules, 'field_type': field_type}",
         "    return InputField(**_accepted_kwargs(InputField, base))",
         "",
         "def mk_button(*, name: str, description: str, label: str,",
         "              button_type=ButtonType.TextButton,",
         "              action_type=ButtonActionType.Navigate,",
         "              target: Optional[Screen] = None) -> Button:",
-        "    p = inspect.signature(Button.__init__).parameters",
-        "    base = {'name': name, 'description': description, 'label': label}",
-        "    if 'buttonType' in p: base['buttonType'] = button_type",
-        "    elif 'button_type' in p: base['button_type'] = button_type",
         "    ctor_action = action_type",
         "    if action_type == ButtonActionType.Navigate and target is None:",
         "        ctor_action = ButtonActionType.OpenForm",
-        "    if 'actionType' in p: base['actionType'] = ctor_action",
-        "    elif 'action_type' in p: base['action_type'] = ctor_action",
-        "    if target is not None and 'targetScreen' in p: base['targetScreen'] = target",
+        "    base = {'name': name, 'description': description, 'label': label,",
+        "            'button_type': button_type, 'action_type': ctor_action}",
+        "    if target is not None: base['target'] = target",
         "    b = Button(**_accepted_kwargs(Button, base))",
         "    if hasattr(b, 'buttonType'):",
         "        try: b.buttonType = button_type",
@@ -559,17 +681,15 @@ def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py:
         "    return b",
         "",
         "def mk_datalist(*, name: str, description: str, sources: Set[DataSourceElement]) -> DataList:",
-        "    p = inspect.signature(DataList.__init__).parameters",
-        "    base = {'name': name, 'description': description}",
-        "    if 'list_sources' in p: base['list_sources'] = set(sources)",
-        "    elif 'listSources' in p: base['listSources'] = set(sources)",
-        "    elif 'sources' in p: base['sources'] = set(sources)",
+        "    base = {'name': name, 'description': description, 'sources': set(sources)}",
         "    return DataList(**_accepted_kwargs(DataList, base))",
         "",
         "def mk_module(*, name: str, screens: Set[Screen]) -> Module:",
         "    base = {'name': name, 'screens': set(screens)}",
         "    return Module(**_accepted_kwargs(Module, base))",
         "",
+    ]
+    L += [
         "def build_generated_gui_model() -> GUIModel:",
         f"    gui_name = {gui_name!r}",
         f"    gui_pkg  = {gui_pkg!r}",
@@ -587,8 +707,18 @@ def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py:
         sv = _safe_ident(sn)
         sd = getattr(s, "description", "")
         sm = bool(getattr(s, "is_main_page", False))
-        L += [f"    {sv} = mk_screen(name={sn!r}, description={sd!r}, is_main={sm!r})"]
+        if direct:
+            L += [f"    {sv} = " + _direct_call(Screen, [
+                ("name", repr(sn)), ("description", repr(sd)), ("x_dpi", "'x_dpi'"), ("y_dpi", "'y_dpi'"),
+                ("screen_size", "'Medium'"), ("view_elements", "set()"), ("is_main_page", repr(sm)),
+            ])]
+        else:
+            L += [f"    {sv} = mk_screen(name={sn!r}, description={sd!r}, is_main={sm!r})"]
     L += ["", "    # DataSources"]
+    if direct:
+        # one name -> Property map per structural class instead of a scan per field
+        for cn in sorted(needed_classes):
+            L += [f"    {_safe_ident('props_' + cn)} = {{a.name: a for a in getattr(st, {cn!r}).attributes}}"]
 
     ds_var: Dict[str, str] = {}
     for d in ds_sorted:
@@ -606,11 +736,22 @@ def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py:
 
         prop_names = sorted({getattr(f, "name", None) for f in fields if getattr(f, "name", None)})
         if prop_names and cls_sym:
-            props_expr = "{ " + ", ".join([f"_get_prop(getattr(st, {cls_sym!r}), {pn!r})" for pn in prop_names]) + " }"
+            if direct:
+                pv = _safe_ident("props_" + cls_sym)
+                props_expr = "{ " + ", ".join([f"{pv}.get({pn!r})" for pn in prop_names]) + " }"
+            else:
+                props_expr = "{ " + ", ".join([f"_get_prop(getattr(st, {cls_sym!r}), {pn!r})" for pn in prop_names]) + " }"
         else:
             props_expr = "set()"
 
-        L += [f"    {dv} = mk_datasource(name={dn!r}, dataSourceClass={cls_expr}, fields={props_expr})"]
+        if direct:
+            L += [f"    {dv} = " + _direct_call(DataSourceElement, [
+                ("name", repr(dn)), ("dataSourceClass", cls_expr), ("fields", props_expr),
+            ])]
+        else:
+            L += [f"    {dv} = mk_datasource(name={dn!r}, dataSourceClass={cls_expr}, fields={props_expr})"]
+        for h, value in _datasource_hints(d).items():
+            L += [f"    {dv}.{h} = {value!r}"]
 
     L += ["", "    # View elements per screen"]
 
@@ -631,7 +772,13 @@ def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py:
                 ftype = getattr(e, "field_type", None) or getattr(e, "type", None) or InputFieldType.Text
                 ftype_expr = f"InputFieldType.{getattr(ftype, 'name', 'Text')}"
                 vr = getattr(e, "validationRules", "") or getattr(e, "validation", "") or ""
-                L += [f"    {ev} = mk_input(name={en!r}, description={ed!r}, field_type={ftype_expr}, validation_rules={vr!r})"]
+                if direct:
+                    L += [f"    {ev} = " + _direct_call(InputField, [
+                        ("name", repr(en)), ("description", repr(ed)),
+                        ("validation_rules", repr(vr)), ("field_type", ftype_expr),
+                    ])]
+                else:
+                    L += [f"    {ev} = mk_input(name={en!r}, description={ed!r}, field_type={ftype_expr}, validation_rules={vr!r})"]
                 created.append(ev)
 
             elif isinstance(e, DataList):
@@ -645,7 +792,12 @@ def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py:
                     if sdn and sdn in ds_var:
                         src_expr.append(ds_var[sdn])
                 sources_expr = "{ " + ", ".join(src_expr) + " }" if src_expr else "set()"
-                L += [f"    {ev} = mk_datalist(name={en!r}, description={ed!r}, sources={sources_expr})"]
+                if direct:
+                    L += [f"    {ev} = " + _direct_call(DataList, [
+                        ("name", repr(en)), ("description", repr(ed)), ("sources", sources_expr),
+                    ])]
+                else:
+                    L += [f"    {ev} = mk_datalist(name={en!r}, description={ed!r}, sources={sources_expr})"]
                 created.append(ev)
 
             elif isinstance(e, Button):
@@ -657,7 +809,19 @@ def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py:
                 at_expr = f"ButtonActionType.{getattr(at, 'name', 'Navigate')}"
                 tgt = getattr(e, "targetScreen", None)
                 tgt_expr = _safe_ident(getattr(tgt, "name", "")) if tgt is not None else "None"
-                L += [f"    {ev} = mk_button(name={en!r}, description={ed!r}, label={label!r}, button_type={bt_expr}, action_type={at_expr}, target={tgt_expr})"]
+                if direct:
+                    # same construction as mk_button: Navigate without target is built as OpenForm, then set
+                    navigate_later = at_expr == "ButtonActionType.Navigate" and tgt is None
+                    values = [("name", repr(en)), ("description", repr(ed)), ("label", repr(label)),
+                              ("button_type", bt_expr),
+                              ("action_type", "ButtonActionType.OpenForm" if navigate_later else at_expr)]
+                    if tgt is not None:
+                        values.append(("target", tgt_expr))
+                    L += [f"    {ev} = " + _direct_call(Button, values)]
+                    if navigate_later and "action_type" in _ctor_adapter(Button):
+                        L += [f"    {ev}.{_ctor_adapter(Button)['action_type']} = {at_expr}"]
+                else:
+                    L += [f"    {ev} = mk_button(name={en!r}, description={ed!r}, label={label!r}, button_type={bt_expr}, action_type={at_expr}, target={tgt_expr})"]
                 created.append(ev)
 
             else:
@@ -681,20 +845,31 @@ def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py:
         mv = _safe_ident(f"Module_{mn}")
         mscreens = sorted(list(getattr(m, "screens", None) or set()), key=lambda x: getattr(x, "name", "") or "")
         ms_expr = "{ " + ", ".join(_safe_ident(getattr(x, "name", "Screen")) for x in mscreens) + " }"
-        L += [f"    {mv} = mk_module(name={mn!r}, screens={ms_expr})", f"    modules.add({mv})"]
+        if direct:
+            L += [f"    {mv} = " + _direct_call(Module, [("name", repr(mn)), ("screens", ms_expr)]), f"    modules.add({mv})"]
+        else:
+            L += [f"    {mv} = mk_module(name={mn!r}, screens={ms_expr})", f"    modules.add({mv})"]
 
     # GUIModel build
+    if direct:
+        L += ["", "    gui = " + _direct_call(GUIModel, [
+            ("name", "gui_name"), ("package", "gui_pkg"), ("versionCode", "vcode"), ("versionName", "vname"),
+            ("description", "gdesc"), ("screenCompatibility", "compat"), ("modules", "modules"),
+        ])]
+    else:
+        L += [
+            "",
+            "    gui = GUIModel(**_accepted_kwargs(GUIModel, {",
+            "        'name': gui_name,",
+            "        'package': gui_pkg,",
+            "        'versionCode': vcode,",
+            "        'versionName': vname,",
+            "        'description': gdesc,",
+            "        'screenCompatibility': compat,",
+            "        'modules': modules,",
+            "    }))",
+        ]
     L += [
-        "",
-        "    gui = GUIModel(**_accepted_kwargs(GUIModel, {",
-        "        'name': gui_name,",
-        "        'package': gui_pkg,",
-        "        'versionCode': vcode,",
-        "        'versionName': vname,",
-        "        'description': gdesc,",
-        "        'screenCompatibility': compat,",
-        "        'modules': modules,",
-        "    }))",
         "    if vc is not None: gui.viewComponent = vc",
         "    gui.data_sources = { " + ", ".join(ds_var.values()) + " }" if ds_var else "    gui.data_sources = set()",
         "    return gui",
@@ -704,137 +879,183 @@ def export_gui_model_to_python(gui: GUIModel, structural_module: str, output_py:
     ]
 
     p.write_text("\n".join(L), encoding="utf-8")
+    if direct:
+        # Compiling the module dominates its first import on big GUIs: do it
+        # here so the M2T stage starts from the cached .pyc.
+        py_compile.compile(str(p), doraise=False)
 
 
 # ------------------------------------------------------------
 # Main transformer
 # ------------------------------------------------------------
+def _apply_pruning(ix: GUIModelIndex, dsml) -> PruningPlan:
+    """
+    DSML pruning / retargeting: the rule table in gui_pruning_rules.RULES,
+    compiled once per feature mask and applied through the index.
+    """
+    plan = plan_for(dsml)
+    apply_plan(ix, plan)
+    return plan
+
+
+def _apply_metadata(gui: GUIModel, overlay: Dict[str, Any], default_name: str, default_package: str):
+    """Cosmetic DSML values (dsml_features.cosmetic_overlay); never affects pruning."""
+    gui.name = overlay.get("appName") or default_name
+    short = overlay.get("shortName")
+    gui.package = f"com.example.{short}" if short else default_package
+    gui.description = f"GUI generated from baseline + DSML pruning for {gui.name}"
+
+
+# (id(baseline), structural module) -> (baseline, bound clone); the baseline is
+# kept in the value so its id cannot be reused while the entry lives.
+_BOUND_BASELINES: Dict[Tuple[int, str], Tuple[GUIModel, GUIModel]] = {}
+
+
+def _bound_baseline(baseline: GUIModel, structural_module: str) -> GUIModel:
+    """
+    Deep clone of the baseline bound to the structural model, built once per
+    (baseline, structural module). Binding does not depend on the DSML, so
+    every variant can share its screens, elements and datasources.
+    """
+    key = (id(baseline), structural_module)
+    entry = _BOUND_BASELINES.get(key)
+    if entry is None:
+        gui, _, datasources = _clone_gui_model(baseline)
+        _ensure_structural_binding(gui, datasources, structural_module)
+        entry = _BOUND_BASELINES[key] = (baseline, gui)
+    return entry[1]
+
+
+def _cow_clone(base: GUIModel) -> GUIModel:
+    """
+    Structural-sharing clone: new GUIModel root and Modules (own screen sets),
+    own data_sources set; screens, elements, datasources and the view
+    component are shared with base. Edits must go through
+    GUIModelIndex(copy_on_write=True), which copies what it touches.
+    """
+    cloned = GUIModel(**_accepted_kwargs(GUIModel, {
+        "name": getattr(base, "name", "GeneratedApp"),
+        "package": getattr(base, "package", "com.example.generated"),
+        "versionCode": getattr(base, "versionCode", "1"),
+        "versionName": getattr(base, "versionName", "1.0"),
+        "description": getattr(base, "description", ""),
+        "screenCompatibility": getattr(base, "screenCompatibility", True),
+        "modules": set(),
+    }))
+    vc = getattr(base, "viewComponent", None)
+    if vc is not None:
+        cloned.viewComponent = vc
+    cloned.data_sources = set(getattr(base, "data_sources", None) or set())
+
+    for m in (getattr(base, "modules", None) or set()):
+        cloned.modules.add(Module(**_accepted_kwargs(Module, {
+            "name": getattr(m, "name", "Module"),
+            "screens": set(getattr(m, "screens", None) or set()),
+        })))
+    return cloned
+
+
+def _build_pruned_gui(baseline: GUIModel, dsml, structural_module: str) -> Tuple[GUIModel, PruningPlan]:
+    gui = _cow_clone(_bound_baseline(baseline, structural_module))
+    plan = _apply_pruning(GUIModelIndex(gui, copy_on_write=True), dsml)
+    return gui, plan
+
+
 def generate_gui_from_dsml_pruning_only_export_py(
     baseline_gui_py_path: str,
     dsml_xmi_path: str,
     dsml_ecore_path: str,
     structural_module: str,
     output_py_path: str = "generated_gui_model.py",
+    export_mode: str = "direct",
 ) -> GUIModel:
     dsml = load_dsml_appconfig(dsml_xmi_path, dsml_ecore_path)
 
-    accounts = getattr(dsml, "accounts", None)
-    listings = getattr(dsml, "listings", None)
-    messaging = getattr(dsml, "messaging", None)
-    ratings = getattr(dsml, "ratings", None)
-    payments = getattr(dsml, "payments", None)
-    subcommunities = getattr(dsml, "subcommunities", None)
-    access_policies = getattr(dsml, "accessPolicies", None)
+    # clone baseline, bind to the structural model and prune
+    baseline = _import_baseline_gui_model(baseline_gui_py_path)
+    gui, plan = _build_pruned_gui(baseline, dsml, structural_module)
+    print("Pruning rules fired:", ", ".join(plan.fired) or "none")
 
-    price_mode = bool(listings and getattr(listings, "priceMode", False))
-    chat_enabled = bool(messaging and getattr(messaging, "chat", False))
-    ratings_enabled = bool(ratings and (getattr(ratings, "simple", False) or getattr(ratings, "bidirectional", False)))
+    # apply metadata
+    _apply_metadata(gui, cosmetic_overlay(dsml), gui.name, gui.package)
 
-    login_enabled = bool(accounts and (
-        getattr(accounts, "localLogin", False) or
-        getattr(accounts, "oauthLogin", False) or
-        getattr(accounts, "phoneVerification", False)
-    ))
+    # Export ALWAYS as Python file
+    export_gui_model_to_python(gui, structural_module=structural_module, output_py=output_py_path, mode=export_mode)
+    return gui
 
-    any_payment = bool(payments and (
-        getattr(payments, "mbway", False) or
-        getattr(payments, "multibanco", False) or
-        getattr(payments, "paypal", False)
-    ))
 
-    sub_enabled = bool(subcommunities and getattr(subcommunities, "enabled", False))
+def generate_gui_batch(
+    baseline_gui_py_path: str,
+    config_dir: str,
+    dsml_ecore_path: str,
+    structural_module: str,
+    output_root: str = "tenants",
+    dedup: bool = True,
+    export_mode: str = "direct",
+) -> Dict[str, str]:
+    """
+    One generated_gui_model.py per AppConfig XMI in config_dir, written to
+    <output_root>/<xmi name>/generated_gui_model.py.
 
-    anonymous_browse = bool(access_policies and getattr(access_policies, "anonymousBrowse", False))
+    The baseline is imported and bound once. With dedup=True, tenants are grouped by
+    feature mask: copy-on-write clone + pruning run once per group and only the
+    cosmetic overlay (name, package, description) is applied per tenant.
+    Returns {tenant: output path}.
+    """
+    xmi_files = sorted(Path(config_dir).glob("*.xmi"))
+    t0 = time.perf_counter()
 
-    # clone baseline
     baseline = _import_baseline_gui_model(baseline_gui_py_path)
-    gui, screens, datasources = _clone_gui_model(baseline)
-
-    # structural binding
-    _ensure_structural_binding(gui, datasources, structural_module)
-
-    # apply metadata
-    gui.name = getattr(dsml, "appName", None) or gui.name
-    short = getattr(dsml, "shortName", None)
-    if short:
-        gui.package = f"com.example.{short}"
-    gui.description = f"GUI generated from baseline + DSML pruning for {gui.name}"
-
-    item_list = screens.get("ItemListScreen")
-    item_details = screens.get("ItemDetailsScreen")
-    chat_screen = screens.get("ChatScreen")
-    payment_screen = screens.get("PaymentScreen")
-
-    if not price_mode:
-        _remove_element(item_details, "ItemPrice")   # baseline uses ItemPrice
-        _remove_element(item_details, "PayBtn")      # baseline uses PayBtn
-        _remove_screen(gui, "PaymentScreen")
+    configs = [(p.stem, load_dsml_appconfig(str(p), dsml_ecore_path)) for p in xmi_files]
+    dsml_by_tenant = dict(configs)
 
-    # Payments OFF (or price off) > remove Pay screen and payment buttons
-    if (not any_payment) or (not price_mode):
-        _remove_element(item_details, "PayBtn")
-        _remove_screen(gui, "PaymentScreen")
+    if dedup:
+        groups = list(group_by_features(configs).values())
     else:
-        # prune specific payment methods
-        if payment_screen is None:
-            raise RuntimeError("Baseline FULL missing PaymentScreen.")
-        if not getattr(payments, "mbway", False):
-            _remove_element(payment_screen, "MBWayBtn")
-        if not getattr(payments, "multibanco", False):
-            _remove_element(payment_screen, "MultibancoBtn")
-        if not getattr(payments, "paypal", False):
-            _remove_element(payment_screen, "PayPalBtn")
-
-        # ensure PayBtn navigates to PaymentScreen (baseline already does)
-        _set_button_target(item_details, "PayBtn", ButtonActionType.Navigate, payment_screen)
-
-    # Chat OFF > remove Contact button and ChatScreen, plus datasources
-    if not chat_enabled:
-        _remove_element(item_details, "ContactBtn")
-        _remove_screen(gui, "ChatScreen")
-        if "MessagesDataSource" in datasources:
-            del datasources["MessagesDataSource"]
-        if "ConversationsDataSource" in datasources:
-            del datasources["ConversationsDataSource"]
-        gui.data_sources = set(datasources.values())
-    else:
-        if chat_screen is None:
-            raise RuntimeError("Baseline FULL missing ChatScreen.")
-        _set_button_target(item_details, "ContactBtn", ButtonActionType.Navigate, chat_screen)
-
-    # Ratings OFF > remove ItemRatingsList + RatingsListScreen + datasource
-    if not ratings_enabled:
-        _remove_element(item_details, "ItemRatingsList")
-        _remove_screen(gui, "RatingsListScreen")
-        if "RatingsDataSource" in datasources:
-            del datasources["RatingsDataSource"]
-            gui.data_sources = set(datasources.values())
-
-    # Subcommunities OFF > remove SubcommunitySelectorScreen + datasource
-    if not sub_enabled:
-        _remove_screen(gui, "SubcommunitySelectorScreen")
-        if "CommunitiesDataSource" in datasources:
-            del datasources["CommunitiesDataSource"]
-            gui.data_sources = set(datasources.values())
-
-    # Login OFF or anonymous browse -> remove LoginScreen
-    if anonymous_browse or (not login_enabled):
-        _remove_screen(gui, "LoginScreen")
-
-    # Export ALWAYS as Python file
-    export_gui_model_to_python(gui, structural_module=structural_module, output_py=output_py_path)
-    return gui
+        groups = [[tenant] for tenant, _ in configs]
+
+    generated: Dict[str, str] = {}
+    for group in groups:
+        gui, _ = _build_pruned_gui(baseline, dsml_by_tenant[group[0]], structural_module)
+        default_name, default_package = gui.name, gui.package
+        for tenant in group:
+            _apply_metadata(gui, cosmetic_overlay(dsml_by_tenant[tenant]), default_name, default_package)
+            out = Path(output_root) / tenant / "generated_gui_model.py"
+            out.parent.mkdir(parents=True, exist_ok=True)
+            export_gui_model_to_python(gui, structural_module=structural_module, output_py=str(out), mode=export_mode)
+            generated[tenant] = str(out)
+
+    elapsed = time.perf_counter() - t0
+    print(f"Generated {len(configs)} GUI models in {elapsed:.2f} s "
+          f"({len(configs) / elapsed if elapsed else 0:.1f} configs/s); "
+          f"pruned {len(groups)} distinct feature sets")
+    return generated
 
 
 # ------------------------------------------------------------
 # CLI
 # ------------------------------------------------------------
 if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="DSML -> GUI (pruning-only) with Python export")
+    ap.add_argument("--batch", metavar="DIR", help="folder with one AppConfig .xmi per tenant")
+    ap.add_argument("--out", default="tenants", help="output folder for --batch")
+    ap.add_argument("--no-dedup", action="store_true", help="prune every tenant even if feature sets repeat")
+    ap.add_argument("--export-mode", choices=("direct", "portable"), default="direct",
+                    help="direct: constructor calls resolved now; portable: resolved when the model is imported")
+    args = ap.parse_args()
+
     baseline_py = "gui_community_platform.py"
     dsml_ecore = "dsml_metamodel.ecore"
     dsml_xmi = "test_custom.xmi"
     structural_mod = "structural_community_platform"
 
+    if args.batch:
+        generate_gui_batch(baseline_py, args.batch, dsml_ecore, structural_mod,
+                           output_root=args.out, dedup=not args.no_dedup, export_mode=args.export_mode)
+        sys.exit(0)
+
     print("Baseline exists?", os.path.exists(baseline_py))
     print("Ecore exists?   ", os.path.exists(dsml_ecore))
     print("XMI exists?     ", os.path.exists(dsml_xmi))
@@ -846,6 +1067,7 @@ if __name__ == "__main__":
         dsml_ecore_path=dsml_ecore,
         structural_module=structural_mod,
         output_py_path="generated_gui_model.py",
+        export_mode=args.export_mode,
     )
     print("Generated GUIModel:", gui.name)
     print("Wrote:", Path("generated_gui_model.py").resolve())
@@ -0,0 +1,118 @@
+"""
+structural_binding.py
+
+GUI DataSource -> structural model binding as a data table, used by
+m2m_dsml_to_gui_pruning_only_with_py_export.py.
+
+Each DataSourceBinding names the structural class a datasource reads and the
+attributes it shows. bind_datasources() resolves the whole table through a
+StructuralIndex: one name -> Property map per class, built once per
+structural module, so every field lookup is a dict hit instead of a scan of
+Class.attributes.
+
+Datasources without a table entry whose baseline dataSourceClass is a class
+name (dataSourceClass="Review") are bound to that class with no fields, so a
+new baseline datasource over an existing class needs no code change. Add an
+entry here when it must show fields or be dropped with a missing class.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from besser.BUML.metamodel.gui import DataSourceElement
+from besser.BUML.metamodel.structural import Class as StructuralClass, Property as StructuralProperty
+
+
+@dataclass(frozen=True)
+class DataSourceBinding:
+    datasource: str
+    cls: str
+    fields: Tuple[str, ...] = ()
+    required: bool = True   # missing class: error when required, else the datasource is dropped
+
+
+BINDINGS: Tuple[DataSourceBinding, ...] = (
+    DataSourceBinding("ItemsDataSource", "Item", ("title", "description", "createdAt", "state", "condition", "kind")),
+    DataSourceBinding("TagsDataSource", "Category", ("name",), required=False),
+    DataSourceBinding("RatingsDataSource", "Rating", ("stars", "comment", "createdAt"), required=False),
+    DataSourceBinding("MessagesDataSource", "Message", ("content", "sentAt", "kind")),
+    DataSourceBinding("ConversationsDataSource", "Conversation"),
+    DataSourceBinding("CommunitiesDataSource", "Community", ("name",)),
+    DataSourceBinding("OffersDataSource", "Offer", required=False),
+)
+
+
+class StructuralIndex:
+    """Class lookup by module attribute name and Property lookup by name, memoised per class."""
+
+    def __init__(self, module):
+        self.module = module
+        self._props: Dict[int, Tuple[Any, Dict[str, Any]]] = {}
+
+    def cls(self, name: str) -> Optional[Any]:
+        return getattr(self.module, name, None)
+
+    def props(self, cls_obj) -> Dict[str, Any]:
+        entry = self._props.get(id(cls_obj))
+        if entry is None:
+            attrs = getattr(cls_obj, "attributes", None) or ()
+            by_name: Dict[str, Any] = {}
+            for a in attrs:
+                name = getattr(a, "name", None)
+                # a real Property wins over any other attribute-like object of the same name
+                if name not in by_name or (isinstance(a, StructuralProperty)
+                                           and not isinstance(by_name[name], StructuralProperty)):
+                    by_name[name] = a
+            entry = self._props[id(cls_obj)] = (cls_obj, by_name)
+        return entry[1]
+
+    def prop(self, cls_obj, name: str) -> Optional[Any]:
+        return self.props(cls_obj).get(name)
+
+
+# structural module name -> index (rebuilt if the module object is replaced)
+_INDEXES: Dict[str, StructuralIndex] = {}
+
+
+def structural_index(structural_module: str) -> StructuralIndex:
+    module = importlib.import_module(structural_module)
+    ix = _INDEXES.get(structural_module)
+    if ix is None or ix.module is not module:
+        ix = _INDEXES[structural_module] = StructuralIndex(module)
+    return ix
+
+
+def bind_datasources(datasources_by_name: Dict[str, DataSourceElement], structural_module: str,
+                     bindings: Tuple[DataSourceBinding, ...] = BINDINGS):
+    """
+    Binds datasources_by_name in place: class + fields per table entry; entries
+    whose optional class is missing are removed from the dict.
+    """
+    ix = structural_index(structural_module)
+    for b in bindings:
+        if b.required and ix.cls(b.cls) is None:
+            raise RuntimeError(f"structural binding missing: {ix.module.__name__}.{b.cls}")
+
+    bound = set()
+    for b in bindings:
+        d = datasources_by_name.get(b.datasource)
+        if d is None:
+            continue
+        bound.add(b.datasource)
+        cls_obj = ix.cls(b.cls)
+        if cls_obj is None:
+            del datasources_by_name[b.datasource]
+            continue
+        props = ix.props(cls_obj)
+        d.dataSourceClass = cls_obj
+        d.fields = {props[f] for f in b.fields if f in props}
+
+    for name, d in datasources_by_name.items():
+        cls_name = getattr(d, "dataSourceClass", None)
+        cls_obj = ix.cls(cls_name) if name not in bound and isinstance(cls_name, str) else None
+        if isinstance(cls_obj, StructuralClass):
+            d.dataSourceClass = cls_obj
+            d.fields = set()
@@ -10,15 +10,15 @@ Outputs:
 """
 
 from typing import Optional
+from pathlib import Path
 import logging
+import sys
 
 #import custom_dsml
 
-# XMI loader (pyecore) - used only to read AppConfig XMI.
-try:
-    from pyecore.resources import ResourceSet
-except Exception:
-    ResourceSet = None
+# Shared DSML loader (src/pipeline) - used only to read AppConfig XMI.
+sys.path.append(str(Path(__file__).resolve().parents[3] / "pipeline"))
+from dsml_loader import load_dsml_appconfig
 
 # Besser GUI metamodel classes - assumed available as in your project
 from besser.BUML.metamodel.gui import (
@@ -44,43 +44,6 @@ log = logging.getLogger("m2m_dsml_to_gui")
 log.setLevel(logging.INFO)
 
 
-# ----------------------------
-# Helper: load DSML (AppConfig)
-# ----------------------------
-def load_dsml_appconfig(xmi_path: str, ecore_path: str):
-    """
-    Loads AppConfig instance from an XMI file.
-    Returns a simple python object with attributes matching Ecore AppConfig structure:
-      - appName, shortName, logoUrl, primaryColor, secondaryColor
-      - accounts (object with localLogin, oauthLogin, phoneVerification, moderators)
-      - listings (object with products, services, priceMode, exchangeMode, donationMode, expiry, variants, currency, minPrice, maxPrice)
-      - messaging (object with chat, imagesInChat)
-      - ratings (object with simple, bidirectional)
-      - payments (object with mbway, multibanco, paypal, none, publicKey, secretRef)
-      - logistics (object with inPerson, mail, locker)
-      - subcommunities (object with enabled)
-      - accessPolicies (object with anonymousBrowse, anonymousMessages)
-    If pyecore is not available, the function will attempt a naive XML parse to extract attributes.
-    """
-    if ResourceSet is None:
-        raise RuntimeError("pyecore is required to load DSML XMI. Install pyecore or provide the model object directly.")
-    
-    rset = ResourceSet()
-
-    # Load metamodel
-    ecore_resource = rset.get_resource(ecore_path)
-    metamodel_root = ecore_resource.contents[0]
-
-    # Register metamodel by its nsURI
-    rset.metamodel_registry[metamodel_root.nsURI] = metamodel_root
-
-    # Load XMI instance
-    xmi_resource = rset.get_resource(xmi_path)
-    root = xmi_resource.contents[0]
-
-    return root
-
-
 # ----------------------------
 # M2M transformer main function
 # ----------------------------
@@ -1,7 +1,5 @@
 import os
-import sys
 import platform
-import subprocess
 
 if platform.system() == "Windows":
     user_scripts = os.path.join(os.environ['APPDATA'], 'Python', 'Python312', 'Scripts')
@@ -11,14 +9,12 @@ if platform.system() == "Windows":
 from besser.BUML.notations.structuralPlantUML import plantuml_to_buml
 from besser.BUML.metamodel.structural import DomainModel
 from besser.generators.django import DjangoGenerator
+from formatters import formatters_available, missing_formatters, format_generated_code
 
 def check_tools():
-    """Verifica se as dependências de formatação exigidas pelo BESSER estão presentes."""
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "black", "isort"], 
-                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    except Exception as e:
-        print(f"Aviso: Não foi possível validar formatadores: {e}")
+    """Verifica (sem pip nem rede) se os formatadores black e isort estão disponíveis; resultado em cache."""
+    if not formatters_available():
+        print(f"Aviso: formatadores em falta ({', '.join(missing_formatters())}). Instale com: pip install black isort")
 
 def main():
     check_tools()
@@ -45,6 +41,7 @@ def main():
             output_dir=output_dir
         )
         django_app.generate()
+        format_generated_code(output_dir)
 
         print("\nBackend Django gerado com sucesso!")
         print(f"Próximos passos:\n  cd {output_dir}\n  python manage.py makemigrations\n  python manage.py migrate")
@@ -1,7 +1,6 @@
 import os
 import sys
 import platform
-import subprocess
 
 if platform.system() == "Windows":
     user_scripts = os.path.join(os.environ['APPDATA'], 'Python', 'Python312', 'Scripts')
@@ -16,13 +15,12 @@ except ImportError:
     sys.exit(1)
 
 from besser.generators.django import DjangoGenerator
+from formatters import formatters_available, missing_formatters, format_generated_code
 
 def check_tools():
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "black", "isort"], 
-                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    except Exception as e:
-        print(f"Aviso: Não foi possível validar formatadores: {e}")
+    """Verifica (sem pip nem rede) se os formatadores black e isort estão disponíveis; resultado em cache."""
+    if not formatters_available():
+        print(f"Aviso: formatadores em falta ({', '.join(missing_formatters())}). Instale com: pip install black isort")
 
 def main():
     check_tools()
@@ -41,6 +39,7 @@ def main():
             output_dir=output_dir
         )
         django_app.generate()
+        format_generated_code(output_dir)
 
         print("\nBackend Django gerado com sucesso a partir do modelo customizado!")
         print(f"Próximos passos:\n  cd {output_dir}\n  python manage.py makemigrations\n  python manage.py migrate")
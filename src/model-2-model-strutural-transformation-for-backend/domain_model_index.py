@@ -0,0 +1,161 @@
+"""
+domain_model_index.py
+
+Adjacency index over a BESSER DomainModel, built once and reused for every
+pruning run (single run_m2m or a whole batch).
+
+For each class it keeps:
+  - the associations that touch it,
+  - the attributes (of any class) typed by it,
+  - its direct subclasses (generalizations).
+
+remove_classes() takes the classes switched off by the DSML and cascades in
+O(classes + associations + attributes):
+  - every association with a removed end is dropped,
+  - a class whose associations all lead to removed classes is dropped too
+    (it was only reachable through them),
+  - subclasses of a removed class are dropped,
+  - attributes typed by a removed class are dropped.
+
+The result is a RemovalReport with the reason for each removal, so the
+pruned model never references a class that is not in it.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+
+from besser.BUML.metamodel.structural import Class, DomainModel, Enumeration
+
+
+@dataclass
+class RemovalReport:
+    classes: Dict[str, str] = field(default_factory=dict)        # class -> reason
+    associations: Dict[str, str] = field(default_factory=dict)   # association -> reason
+    attributes: List[Tuple[str, str, str]] = field(default_factory=list)  # (class, attribute, reason)
+
+    def is_empty(self) -> bool:
+        return not (self.classes or self.associations or self.attributes)
+
+    def lines(self) -> List[str]:
+        out = [f"class {name}: {why}" for name, why in self.classes.items()]
+        out += [f"association {name}: {why}" for name, why in self.associations.items()]
+        out += [f"attribute {owner}.{attr}: {why}" for owner, attr, why in self.attributes]
+        return out
+
+
+@dataclass
+class PrunedModel:
+    classes: List[Tuple[Class, list]]   # (class, surviving attributes), domain_model order
+    enums: List[Enumeration]
+    associations: list
+    report: RemovalReport
+
+
+class DomainModelIndex:
+    """Class/association adjacency of one DomainModel."""
+
+    def __init__(self, model: DomainModel):
+        self.model = model
+        self.classes: Dict[str, Class] = {}
+        self.enums: List[Enumeration] = []
+        # class name -> associations touching it (self-associations listed once)
+        self.assocs_of: Dict[str, list] = {}
+        # class name -> number of association ends that lead to *another* class
+        self.degree: Dict[str, int] = {}
+        # class name -> [(owner class name, attribute)] typed by that class
+        self.typed_by: Dict[str, List[Tuple[str, object]]] = {}
+        # class name -> direct subclass names
+        self.subclasses: Dict[str, List[str]] = {}
+
+        for t in model.types:
+            if isinstance(t, Class):
+                self.classes[t.name] = t
+                self.assocs_of[t.name] = []
+                self.degree[t.name] = 0
+                self.typed_by[t.name] = []
+                self.subclasses[t.name] = []
+            elif isinstance(t, Enumeration):
+                self.enums.append(t)
+
+        for assoc in model.associations:
+            names = [end.type.name for end in assoc.ends]
+            for name in set(names):
+                self.assocs_of[name].append(assoc)
+            if names[0] != names[1]:
+                for name in names:
+                    self.degree[name] += 1
+
+        for cls in self.classes.values():
+            for attr in cls.attributes:
+                if isinstance(attr.type, Class) and attr.type.name in self.typed_by:
+                    self.typed_by[attr.type.name].append((cls.name, attr))
+
+        for gen in model.generalizations or ():
+            self.subclasses[gen.general.name].append(gen.specific.name)
+
+    @staticmethod
+    def _ends(assoc) -> List[str]:
+        return [end.type.name for end in assoc.ends]
+
+    def remove_classes(self, roots: Iterable[str], reason: str = "disabled by DSML") -> RemovalReport:
+        """Transitive removal starting at roots; each class/association is visited once."""
+        report = RemovalReport()
+        alive_degree = dict(self.degree)
+        queue = deque()
+
+        for name in roots:
+            if name in self.classes and name not in report.classes:
+                report.classes[name] = reason
+                queue.append(name)
+
+        while queue:
+            name = queue.popleft()
+
+            for sub in self.subclasses[name]:
+                if sub not in report.classes:
+                    report.classes[sub] = f"subclass of removed {name}"
+                    queue.append(sub)
+
+            for assoc in self.assocs_of[name]:
+                if assoc.name in report.associations:
+                    continue
+                report.associations[assoc.name] = f"end {name} removed"
+                for other in self._ends(assoc):
+                    if other == name or other in report.classes:
+                        continue
+                    alive_degree[other] -= 1
+                    if alive_degree[other] == 0:
+                        report.classes[other] = f"only reachable through removed {name}"
+                        queue.append(other)
+
+        for name in report.classes:
+            for owner, attr in self.typed_by[name]:
+                if owner not in report.classes:
+                    report.attributes.append((owner, attr.name, f"typed by removed {name}"))
+
+        return report
+
+    def prune(self, roots: Iterable[str], dropped_attributes: Iterable[Tuple[str, str]] = (),
+              reason: str = "disabled by DSML") -> PrunedModel:
+        """
+        Removes roots (and everything that cascades from them) plus the explicit
+        (class, attribute) pairs in dropped_attributes. Order follows domain_model.
+        """
+        report = self.remove_classes(roots, reason)
+        dropped: Set[Tuple[str, str]] = {(owner, attr) for owner, attr, _ in report.attributes}
+        for owner, attr in dropped_attributes:
+            if owner not in report.classes and (owner, attr) not in dropped:
+                dropped.add((owner, attr))
+                report.attributes.append((owner, attr, reason))
+
+        classes = []
+        for t in self.model.types:
+            if isinstance(t, Class) and t.name not in report.classes:
+                attrs = [a for a in t.attributes if (t.name, a.name) not in dropped]
+                classes.append((t, attrs))
+
+        associations = [a for a in self.model.associations if a.name not in report.associations]
+        return PrunedModel(classes, list(self.enums), associations, report)
@@ -0,0 +1,156 @@
+"""
+formatters.py
+
+black / isort support for the Django generators
+(community_platform_puml_to_buml_generator.py and
+custom_community_platform_puml_to_buml_generator.py).
+
+- formatters_available() checks in-process whether black and isort can be
+  imported, without pip or network access. The answer is kept in a stamp file
+  (src/.pipeline_cache/formatters.json) keyed by the interpreter and by the
+  installed packages' paths and mtimes, so later runs only stat a few files.
+- format_tree() formats every generated .py file with isort.code() and
+  black.format_str(), batched over a process pool (one batch per worker, no
+  subprocess per file). Files already formatted are not rewritten.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "pipeline"))
+from build_cache import CACHE_ROOT
+
+TOOLS = ("black", "isort")
+STAMP_PATH = CACHE_ROOT / "formatters.json"
+SKIP_DIRS = {"__pycache__", "migrations", ".git", "venv", ".venv"}
+
+
+def _tool_origin(name: str) -> Optional[str]:
+    spec = importlib.util.find_spec(name)
+    if spec is None or not spec.origin:
+        return None
+    return spec.origin
+
+
+def _fingerprint() -> Dict[str, object]:
+    """Where each formatter lives and when it was installed; None when missing."""
+    tools = {}
+    for name in TOOLS:
+        origin = _tool_origin(name)
+        tools[name] = [origin, os.stat(origin).st_mtime_ns] if origin else None
+    return {"python": sys.executable, "tools": tools}
+
+
+def _stamp_valid(stamp: Dict[str, object]) -> bool:
+    if stamp.get("python") != sys.executable:
+        return False
+    for name in TOOLS:
+        entry = stamp.get("tools", {}).get(name)
+        if entry is None:
+            return False   # re-check: it may have been installed since
+        origin, mtime = entry
+        try:
+            if os.stat(origin).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def formatters_available(stamp_path: Path = STAMP_PATH) -> bool:
+    """True when black and isort are importable by this interpreter."""
+    try:
+        stamp = json.loads(Path(stamp_path).read_text(encoding="utf-8"))
+        if _stamp_valid(stamp):
+            return True
+    except (OSError, ValueError):
+        pass
+
+    info = _fingerprint()
+    ok = all(info["tools"][name] is not None for name in TOOLS)
+    try:
+        Path(stamp_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp = Path(stamp_path).with_name(f"{Path(stamp_path).name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(info, indent=1), encoding="utf-8")
+        os.replace(tmp, stamp_path)
+    except OSError:
+        pass
+    return ok
+
+
+def missing_formatters() -> List[str]:
+    return [name for name in TOOLS if _tool_origin(name) is None]
+
+
+def _format_batch(paths: List[str]) -> Tuple[int, List[Tuple[str, str]]]:
+    """Runs in a worker: isort + black over a batch of files. Returns (changed, errors)."""
+    import black
+    import isort
+
+    mode = black.Mode()
+    isort_cfg = isort.Config(profile="black")
+    changed = 0
+    errors = []
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                src = f.read()
+            out = black.format_str(isort.code(src, config=isort_cfg), mode=mode)
+            if out != src:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(out)
+                changed += 1
+        except Exception as e:
+            errors.append((path, f"{type(e).__name__}: {e}"))
+    return changed, errors
+
+
+def python_files(root: str) -> List[str]:
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        files.extend(os.path.join(dirpath, f) for f in filenames if f.endswith(".py"))
+    return sorted(files)
+
+
+def format_tree(root: str, workers: Optional[int] = None) -> Tuple[int, int, List[Tuple[str, str]]]:
+    """
+    Formats every .py under root (Django migrations excluded).
+    Returns (files, changed, errors).
+    """
+    files = python_files(root)
+    if not files:
+        return 0, 0, []
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files)))
+    batches = [files[i::workers] for i in range(workers)]
+
+    if workers == 1:
+        results = [_format_batch(batches[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_format_batch, batches))
+
+    changed = sum(r[0] for r in results)
+    errors = [e for r in results for e in r[1]]
+    return len(files), changed, errors
+
+
+def format_generated_code(output_dir: str, workers: Optional[int] = None):
+    """Used by the generators after DjangoGenerator.generate(): format if possible, never fail."""
+    if not formatters_available():
+        print(f"Aviso: formatadores em falta ({', '.join(missing_formatters())}); código gerado não formatado.")
+        return
+    t0 = time.perf_counter()
+    total, changed, errors = format_tree(output_dir, workers)
+    for path, err in errors:
+        print(f"  Aviso: não foi possível formatar {path}: {err}")
+    print(f"3. Formatados {changed}/{total} ficheiros com black + isort em {time.perf_counter() - t0:.2f} s")
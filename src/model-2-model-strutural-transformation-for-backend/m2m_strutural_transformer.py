@@ -1,76 +1,73 @@
 import os
-import io
-from lxml import etree
-from pyecore.resources import ResourceSet, URI
+import sys
+import time
+import shutil
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "pipeline"))
+from dsml_loader import load_dsml_appconfig, load_metamodel
+from dsml_features import group_by_features
+from domain_model_index import DomainModelIndex
 from buml.buml_model import domain_model
 from besser.BUML.metamodel.structural import (
-    DomainModel, Class, Property, BinaryAssociation, 
+    DomainModel, Class, Property, BinaryAssociation,
     Enumeration, EnumerationLiteral, Multiplicity
 )
 
-def run_m2m():
-    print("[1/3] A carregar configurações...")
-    try:
-        rset = ResourceSet()
-        def get_clean_bytes(path):
-            parser = etree.XMLParser(remove_comments=True, recover=True)
-            tree = etree.parse(path, parser)
-            return etree.tostring(tree)
-
-        ecore_res = rset.create_resource(URI('dsml_metamodel.ecore'))
-        ecore_res.load(io.BytesIO(get_clean_bytes('dsml_metamodel.ecore')))
-        mm_root = ecore_res.contents[0]
-        rset.metamodel_registry[mm_root.nsURI] = mm_root
-        
-        xmi_res = rset.create_resource(URI('test_custom.xmi'))
-        xmi_res.load(io.BytesIO(get_clean_bytes('test_custom.xmi')))
-        dsml = xmi_res.contents[0]
-    except Exception as e:
-        print(f"ERRO: {e}")
-        return
+DEFAULT_OUTPUT = os.path.join("buml", "custom_buml_model.py")
+
+
+# Índice de adjacência construído uma vez e partilhado por todas as podas
+# (no modo batch é construído antes do fork e herdado pelos workers)
+_index = None
+
+
+def get_domain_index():
+    global _index
+    if _index is None:
+        _index = DomainModelIndex(domain_model)
+    return _index
+
+
+def disabled_classes(dsml):
+    """Classes desligadas diretamente pelo DSML; o resto da remoção é feito em cascata."""
+    roots = []
+    if not dsml.messaging.chat: roots += ["Conversation", "Message"]
+    if not dsml.subcommunities.enabled: roots.append("SubCommunity")
+    return roots
+
+
+def disabled_attributes(dsml):
+    attrs = []
+    if not dsml.accounts.moderators: attrs.append(("User", "isModerator"))
+    return attrs
+
+
+def prune_domain_model(dsml):
+    """Aplica as regras DSML ao domain_model (com remoção em cascata) e devolve um PrunedModel."""
+    return get_domain_index().prune(disabled_classes(dsml), disabled_attributes(dsml))
+
+
+def write_custom_buml(output_path, new_classes_data, new_enums, new_associations):
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
 
-    print("[2/3] A filtrar e mapear tipos...")
-    new_classes_data = []
-    new_enums = []
-    new_associations = []
-    class_names_survived = set()
-
-    for element in domain_model.types:
-        if isinstance(element, Class):
-            if element.name in ["Conversation", "Message"] and not dsml.messaging.chat: continue
-            if element.name == "SubCommunity" and not dsml.subcommunities.enabled: continue
-            
-            class_names_survived.add(element.name)
-            new_classes_data.append((element, list(element.attributes)))
-        elif isinstance(element, Enumeration):
-            new_enums.append(element)
-
-    for assoc in domain_model.associations:
-        ends = list(assoc.ends)
-        if ends[0].type.name in class_names_survived and ends[1].type.name in class_names_survived:
-            new_associations.append(assoc)
-
-    print("[3/3] A gerar buml/custom_buml_model.py...")
-    os.makedirs("buml", exist_ok=True)
-    output_path = os.path.join("buml", "custom_buml_model.py")
-    
     with open(output_path, "w", encoding="utf-8") as f:
         f.write("from besser.BUML.metamodel.structural import *\n\n")
-        
+
         for enum in new_enums:
             literals = ", ".join([f'EnumerationLiteral("{l.name}")' for l in enum.literals])
             f.write(f"{enum.name} = Enumeration(name='{enum.name}', literals={{{literals}}})\n")
-        
+
         f.write("\n# Classes\n")
         for cls_obj, _ in new_classes_data:
             f.write(f"{cls_obj.name} = Class(name='{cls_obj.name}')\n")
-        
+
         f.write("\n# Attributes\n")
         for cls_obj, attrs in new_classes_data:
             attr_defs = []
             for attr in attrs:
-                if cls_obj.name == "User" and attr.name == "isModerator" and not dsml.accounts.moderators: continue
-                
                 if isinstance(attr.type, (Class, Enumeration)):
                     t_name = attr.type.name
                 else:
@@ -100,7 +97,143 @@ def run_m2m():
         all_assocs = ", ".join([a.name for a in new_associations])
         f.write(f"\ndomain_model = DomainModel(name='CustomModel', types={{{all_types}}}, associations={{{all_assocs}}})\n")
 
+
+def run_m2m(xmi_path='test_custom.xmi', ecore_path='dsml_metamodel.ecore', output_path=DEFAULT_OUTPUT):
+    print("[1/3] A carregar configurações...")
+    try:
+        dsml = load_dsml_appconfig(xmi_path, ecore_path)
+    except Exception as e:
+        print(f"ERRO: {e}")
+        return
+
+    print("[2/3] A filtrar e mapear tipos...")
+    pruned = prune_domain_model(dsml)
+    for line in pruned.report.lines():
+        print(f"  - removido {line}")
+
+    print(f"[3/3] A gerar {output_path}...")
+    write_custom_buml(output_path, pruned.classes, pruned.enums, pruned.associations)
+
     print(f"✓ SUCESSO: {output_path} gerado corretamente.")
 
+
+# ------------------------------------------------------------
+# Batch (multi-tenant) mode
+# ------------------------------------------------------------
+def _load_job(job):
+    """Executado num worker: lê o AppConfig (snapshot em cache quando possível)."""
+    tenant, xmi_path, ecore_path = job
+    t0 = time.perf_counter()
+    try:
+        return tenant, load_dsml_appconfig(xmi_path, ecore_path), time.perf_counter() - t0, None
+    except Exception as e:
+        return tenant, None, time.perf_counter() - t0, f"{type(e).__name__}: {e}"
+
+
+def _tenant_job(job):
+    """Executado num worker: AppConfig -> <output_root>/<tenant>/custom_buml_model.py."""
+    tenant, dsml, output_root = job
+    t0 = time.perf_counter()
+    try:
+        output_path = os.path.join(output_root, tenant, "custom_buml_model.py")
+        pruned = prune_domain_model(dsml)
+        write_custom_buml(output_path, pruned.classes, pruned.enums, pruned.associations)
+        return tenant, time.perf_counter() - t0, None
+    except Exception as e:
+        return tenant, time.perf_counter() - t0, f"{type(e).__name__}: {e}"
+
+
+def _pool_map(fn, jobs, workers):
+    if workers == 1 or len(jobs) <= 1:
+        return [fn(j) for j in jobs]
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, jobs, chunksize=chunksize))
+
+
+def run_m2m_batch(config_dir, output_root="tenants", ecore_path='dsml_metamodel.ecore', workers=None, dedup=True):
+    """
+    Gera um custom_buml_model.py por tenant para todos os *.xmi de config_dir.
+    O domain_model e o metamodelo ecore são carregados uma única vez (no processo
+    principal, herdados pelos workers) e a poda é distribuída por um process pool.
+
+    Com dedup=True os tenants são agrupados pelo feature_mask (flags que a poda
+    lê): cada grupo é gerado uma vez e copiado para os restantes tenants, já que
+    o modelo estrutural não contém valores cosméticos (appName, cores, logo).
+    """
+    xmi_files = sorted(Path(config_dir).glob("*.xmi"))
+    if not xmi_files:
+        print(f"ERRO: nenhum ficheiro .xmi em {config_dir}")
+        return {}, {}
+
+    # Aquecer o metamodelo e o índice antes do fork: os workers herdam-nos já construídos
+    load_metamodel(ecore_path)
+    get_domain_index()
+    workers = workers or os.cpu_count() or 1
+
+    print(f"A processar {len(xmi_files)} configurações com {workers} workers...")
+    t0 = time.perf_counter()
+
+    timings = {}
+    errors = {}
+    configs = []
+    for tenant, dsml, dt, err in _pool_map(_load_job, [(p.stem, str(p), ecore_path) for p in xmi_files], workers):
+        timings[tenant] = dt
+        if err:
+            errors[tenant] = err
+        else:
+            configs.append((tenant, dsml))
+
+    dsml_by_tenant = dict(configs)
+    if dedup:
+        groups = list(group_by_features(configs).values())
+    else:
+        groups = [[tenant] for tenant, _ in configs]
+
+    reps = [(g[0], dsml_by_tenant[g[0]], output_root) for g in groups]
+    for tenant, dt, err in _pool_map(_tenant_job, reps, workers):
+        timings[tenant] += dt
+        if err:
+            errors[tenant] = err
+
+    # Overlay: os restantes membros de cada grupo recebem uma cópia do representante
+    for group in groups:
+        rep = group[0]
+        src = os.path.join(output_root, rep, "custom_buml_model.py")
+        for tenant in group[1:]:
+            if rep in errors:
+                errors[tenant] = f"representante {rep} falhou"
+                continue
+            t1 = time.perf_counter()
+            dst_dir = os.path.join(output_root, tenant)
+            os.makedirs(dst_dir, exist_ok=True)
+            shutil.copyfile(src, os.path.join(dst_dir, "custom_buml_model.py"))
+            timings[tenant] += time.perf_counter() - t1
+
+    elapsed = time.perf_counter() - t0
+
+    for tenant, err in sorted(errors.items()):
+        print(f"  ERRO [{tenant}]: {err}")
+
+    total = len(xmi_files)
+    slowest = max(timings.items(), key=lambda kv: kv[1])
+    print(f"✓ {total - len(errors)}/{total} tenants gerados em {output_root}/ "
+          f"em {elapsed:.2f} s ({total / elapsed:.1f} configs/s)")
+    if dedup:
+        print(f"  Conjuntos de features distintos: {len(groups)} (poda executada {len(groups)}x em vez de {len(configs)}x)")
+    print(f"  Tenant mais lento: {slowest[0]} ({slowest[1] * 1000:.1f} ms)")
+    return timings, errors
+
+
 if __name__ == "__main__":
-    run_m2m()
\ No newline at end of file
+    ap = argparse.ArgumentParser(description="DSML -> custom BUML (poda estrutural)")
+    ap.add_argument("--batch", metavar="DIR", help="pasta com um AppConfig .xmi por tenant")
+    ap.add_argument("--out", default="tenants", help="pasta de saída do modo batch")
+    ap.add_argument("--workers", type=int, default=None, help="número de processos (default: CPUs)")
+    ap.add_argument("--no-dedup", action="store_true", help="gerar cada tenant mesmo com features idênticas")
+    args = ap.parse_args()
+
+    if args.batch:
+        run_m2m_batch(args.batch, output_root=args.out, workers=args.workers, dedup=not args.no_dedup)
+    else:
+        run_m2m()
@@ -4,8 +4,15 @@ Generates HTML+CSS+Vanilla JS from BESSER GUI models using Jinja2 templates
 Using the official BESSER GeneratorInterface
 """
 
+import hashlib
+import json
+import multiprocessing
 import os
-from jinja2 import Environment, FileSystemLoader
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bundler import ENTRY, STYLESHEETS, bundle_app, minify_css
+from template_cache import describe_load, load_templates, make_environment, template_mtimes
 
 try:
     # Try to import the official BESSER GeneratorInterface
@@ -27,6 +34,457 @@ except ImportError:
             return os.path.join(self.output_dir, file_name)
 
 
+def _register_filters(env):
+    """Register custom Jinja2 filters"""
+    
+    def snake_case(text):
+        """Convert text to snake_case"""
+        import re
+        text = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
+        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', text).lower()
+    
+    def kebab_case(text):
+        """Convert text to kebab-case"""
+        return snake_case(text).replace('_', '-')
+    
+    def camel_case(text):
+        """Convert text to camelCase"""
+        words = text.replace('-', '_').split('_')
+        return words[0].lower() + ''.join(w.capitalize() for w in words[1:])
+    
+    def pascal_case(text):
+        """Convert text to PascalCase"""
+        words = text.replace('-', '_').split('_')
+        return ''.join(w.capitalize() for w in words)
+    
+    def by_name(items):
+        """Model sets sorted by name, so the output does not depend on set order"""
+        return sorted(items or (), key=lambda x: getattr(x, 'name', '') or '')
+    
+    env.filters['snake_case'] = snake_case
+    env.filters['kebab_case'] = kebab_case
+    env.filters['camel_case'] = camel_case
+    env.filters['pascal_case'] = pascal_case
+    env.filters['by_name'] = by_name
+
+
+# One Jinja2 environment per templates folder, shared by every generator in
+# the process: templates are parsed once when several GUIs are rendered by the
+# same process. Compiled templates come from the AOT modules or the bytecode
+# cache of template_cache.py; the environment is rebuilt when a template
+# changes (AOT modules never re-check their source).
+_ENVIRONMENTS = {}
+
+
+def _environment(templates_path):
+    mtimes = template_mtimes(templates_path)
+    entry = _ENVIRONMENTS.get(templates_path)
+    if entry is None or entry[0] != mtimes:
+        entry = _ENVIRONMENTS[templates_path] = (mtimes, make_environment(templates_path, register_filters=_register_filters))
+    return entry[1]
+
+
+GITIGNORE = """# Dependencies
+node_modules/
+
+# Environment
+.env
+.env.local
+
+# IDEs
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Build
+dist/
+build/
+"""
+
+# Below this many files, forking workers costs more than rendering in-process
+PARALLEL_MIN_JOBS = 16
+
+# Screen-specific page logic, decided at generation time: page.js.j2 only
+# emits the guards, fetches and element markup of the screen it renders.
+AUTH_SCREENS = frozenset(("PaymentScreen", "CheckoutScreen"))
+# where the auth guard sends logged-out users; the guard is only emitted
+# when the model (after pruning) still has this screen
+LOGIN_SCREEN = "LoginScreen"
+# screen -> (query parameter it needs, route to redirect to without it)
+REQUIRED_PARAMS = {"ItemDetailsScreen": ("id", "itemlistscreen")}
+# screen -> what its DataLists show: "items" (ItemApi.getAll) or "item" (ItemApi.getById)
+SCREEN_FETCHES = {"ItemListScreen": "items", "ItemDetailsScreen": "item"}
+# element types page.js.j2 renders; others produce no markup
+PAGE_ELEMENT_TYPES = frozenset(("InputField", "Button", "DataList"))
+# DataLists whose sources expect at least this many records (DataSource
+# size_hint) render through components.js VirtualList, a page at a time
+VIRTUAL_LIST_MIN_ITEMS = 200
+VIRTUAL_LIST_PAGE_SIZE = 50
+
+# components.css.j2 is split into style groups. css/components.css holds the
+# SHARED_STYLES; every screen gets a chunk, css/pages/<screen>.css, with the
+# groups of the elements its page renders, loaded by the router with the page.
+ELEMENT_STYLES = {"InputField": "forms", "Button": "buttons", "DataList": "data-lists"}
+VIRTUAL_LIST_STYLES = "virtual-lists"
+# page layout (also needed by the router's fallback pages) and the
+# ComponentRegistry components of components.js
+SHARED_STYLES = ("layout", "action-buttons", "list-view", "detail-view", "fab", "chat")
+# inlined into index.html, with styles.css and the main screen's groups
+CRITICAL_STYLES = ("layout",)
+PAGE_STYLES_DIR = "css/pages"
+
+
+def route_prefetch(screens):
+    """
+    screen name -> names of the other screens its Buttons navigate to (sorted),
+    prefetched by the router once the screen is shown
+    """
+    names = {s.name for s in screens}
+    prefetch = {}
+    for screen in screens:
+        targets = {getattr(e.targetScreen, "name", None) for e in screen.view_elements
+                   if type(e).__name__ == "Button" and getattr(e, "targetScreen", None) is not None}
+        prefetch[screen.name] = sorted(t for t in targets if t in names and t != screen.name)
+    return prefetch
+
+
+def main_screen(screens):
+    """Screen the router loads eagerly: the first main page, if any"""
+    return next((s for s in screens if getattr(s, "is_main_page", False)), None)
+
+
+def login_route(screens):
+    """Route of the LOGIN_SCREEN ("loginscreen"), or None when it was pruned"""
+    return next((s.name.lower() for s in screens if s.name == LOGIN_SCREEN), None)
+
+
+def logout_route(screens):
+    """Route shown after logging out: the login screen, else the main screen (else the first)"""
+    home = main_screen(screens) or (screens[0] if screens else None)
+    return login_route(screens) or (home.name.lower() if home is not None else "")
+
+
+# Seconds api.js keeps responses of an entity fresh when none of its
+# DataSources sets cache_ttl (0: always revalidate with If-None-Match)
+DEFAULT_CACHE_TTL = 0
+
+
+def cache_ttls(gui):
+    """
+    entity (DataSource class name) -> response TTL in seconds, from the
+    cache_ttl of its DataSourceElements (the shortest one when several differ)
+    """
+    ttls = {}
+    for ds in getattr(gui, "data_sources", None) or ():
+        ttl = getattr(ds, "cache_ttl", None)
+        cls = getattr(ds, "dataSourceClass", None)
+        entity = getattr(cls, "name", cls)
+        if ttl is None or not isinstance(entity, str):
+            continue
+        ttls[entity] = min(ttl, ttls.get(entity, ttl))
+    return ttls
+
+
+# Backend the generated api.js and sw.js talk to
+API_BASE_URL = "http://localhost:3000/api"
+SERVICE_WORKER = "sw.js"
+# Written files the service worker precaches
+PRECACHE_EXTENSIONS = (".html", ".js", ".css")
+
+
+def api_resource(entity):
+    """REST collection of an entity, as in api.js: Item -> /items, Category -> /categories"""
+    name = entity.lower()
+    if name.endswith("y") and name[-2:-1] not in "aeiou":
+        return "/" + name[:-1] + "ies"
+    return "/" + name + ("es" if name.endswith("s") else "s")
+
+
+def api_routes(screens):
+    """API collections read by the DataLists of the given screens, sorted"""
+    routes = set()
+    for screen in screens:
+        for element in screen.view_elements:
+            for ds in getattr(element, "list_sources", None) or ():
+                cls = getattr(ds, "dataSourceClass", None)
+                entity = getattr(cls, "name", cls)
+                if isinstance(entity, str):
+                    routes.add(api_resource(entity))
+    return sorted(routes)
+
+
+# index.html references of the unbundled app (see bundler.bundle_app for bundle=True)
+LOOSE_ASSETS = {"styles": list(STYLESHEETS), "script": ENTRY, "preload": []}
+
+
+class VirtualListPlan(object):
+    """A DataList rendered by VirtualList: the entity it pages through and the fields each row shows"""
+
+    __slots__ = ('entity', 'resource', 'fields', 'page_size')
+
+    def __init__(self, entity, resource, fields, page_size=VIRTUAL_LIST_PAGE_SIZE):
+        self.entity = entity
+        self.resource = resource
+        self.fields = fields
+        self.page_size = page_size
+
+
+def virtual_list_plan(data_list):
+    """VirtualListPlan of a DataList whose sources hint at VIRTUAL_LIST_MIN_ITEMS or more, else None"""
+    sources = sorted(getattr(data_list, "list_sources", None) or (), key=lambda d: d.name)
+    if max((getattr(d, "size_hint", None) or 0 for d in sources), default=0) < VIRTUAL_LIST_MIN_ITEMS:
+        return None
+    cls = getattr(sources[0], "dataSourceClass", None)
+    entity = getattr(cls, "name", cls)
+    if not isinstance(entity, str):
+        return None
+    fields = sorted({getattr(f, "name", None) for d in sources for f in (getattr(d, "fields", None) or ())} - {None})
+    return VirtualListPlan(entity, api_resource(entity), fields)
+
+
+class PagePlan(object):
+    """What the page module of one screen contains (see page_plan)"""
+
+    __slots__ = ('auth', 'required_param', 'fetch', 'elements', 'virtual_lists', 'api_imports', 'styles')
+
+    def __init__(self, auth, required_param, fetch, elements, virtual_lists, api_imports, styles):
+        self.auth = auth
+        self.required_param = required_param
+        self.fetch = fetch
+        self.elements = elements
+        self.virtual_lists = virtual_lists
+        self.api_imports = api_imports
+        self.styles = styles
+
+
+def page_plan(screen, login=None):
+    """
+    Resolves the screen-specific branches of page.js.j2: auth guard (the
+    route of the login screen, None without one; see login_route) and
+    parameter guard, the API fetch (only when a non-virtual DataList shows its result),
+    the (element, type name) pairs with markup, sorted by name, the
+    DataLists rendered by VirtualList (by element name) and the style groups
+    of components.css.j2 that markup uses.
+    """
+    elements = [(e, type(e).__name__) for e in sorted(screen.view_elements, key=lambda e: e.name)]
+    elements = [(e, t) for e, t in elements if t in PAGE_ELEMENT_TYPES]
+    lists = [e for e, t in elements if t == "DataList"]
+    virtual_lists = {e.name: plan for e, plan in ((e, virtual_list_plan(e)) for e in lists) if plan is not None}
+    fetch = SCREEN_FETCHES.get(screen.name) if len(virtual_lists) < len(lists) else None
+
+    api_imports = set()
+    if fetch:
+        api_imports.add("ItemApi")
+    for plan in virtual_lists.values():
+        api_imports.add("ItemApi" if plan.entity == "Item" else "ApiService")
+    styles = {ELEMENT_STYLES[t] for e, t in elements if t in ELEMENT_STYLES}
+    if virtual_lists:
+        styles.add(VIRTUAL_LIST_STYLES)
+    return PagePlan(
+        auth=login if screen.name in AUTH_SCREENS else None,
+        required_param=REQUIRED_PARAMS.get(screen.name),
+        fetch=fetch,
+        elements=elements,
+        virtual_lists=virtual_lists,
+        api_imports=sorted(api_imports),
+        styles=sorted(styles - set(SHARED_STYLES)),
+    )
+
+
+def page_stylesheet(screen):
+    """Path of the CSS chunk of a screen's page (posix, relative to index.html)"""
+    return "%s/%s.css" % (PAGE_STYLES_DIR, screen.name.lower())
+
+
+class RenderJob(object):
+    """One output file: a template (None for static content) and its context"""
+
+    __slots__ = ('template', 'path', 'context')
+
+    def __init__(self, template, path, context):
+        self.template = template
+        self.path = path
+        self.context = context
+
+
+def _render(env, job):
+    t0 = time.perf_counter()
+    if job.template is None:
+        content = job.context
+    else:
+        content = env.get_template(job.template).render(**job.context)
+    return content, time.perf_counter() - t0
+
+
+# Set in the parent right before the pool forks; workers inherit it (the GUI
+# model and the compiled templates are never pickled)
+_RENDER_STATE = None
+
+
+def _render_index(i):
+    env, jobs = _RENDER_STATE
+    content, seconds = _render(env, jobs[i])
+    return i, content, seconds
+
+
+def _pool_size(workers, n_jobs):
+    if 'fork' not in multiprocessing.get_all_start_methods() or n_jobs < PARALLEL_MIN_JOBS:
+        return 1
+    return max(1, min(workers or os.cpu_count() or 1, n_jobs))
+
+
+def render_jobs(env, jobs, workers=1):
+    """Yields (job, content, seconds) for every job; in job order when workers == 1"""
+    global _RENDER_STATE
+    if workers <= 1:
+        for job in jobs:
+            content, seconds = _render(env, job)
+            yield job, content, seconds
+        return
+
+    # Parse every template once in the parent so the workers inherit them compiled
+    for name in set(job.template for job in jobs if job.template):
+        env.get_template(name)
+    _RENDER_STATE = (env, jobs)
+    try:
+        ctx = multiprocessing.get_context('fork')
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            for i, content, seconds in pool.map(_render_index, range(len(jobs)), chunksize=chunksize):
+                yield jobs[i], content, seconds
+    finally:
+        _RENDER_STATE = None
+
+
+# Generation manifest kept in the output folder: {path: [sha256, size, mtime_ns]}
+MANIFEST_NAME = ".webui-manifest.json"
+MANIFEST_VERSION = 1
+
+# Folders whose files all come from the generator: anything there that the
+# current run did not produce is stale (e.g. the page of a pruned screen)
+OWNED_DIRS = (os.path.join("js", "pages"), os.path.join(*PAGE_STYLES_DIR.split("/")))
+
+
+def _manifest_key(rel_path):
+    return rel_path.replace(os.sep, "/")
+
+
+def read_manifest(root):
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+class BatchedWriter(object):
+    """
+    Buffers rendered files and writes them in batches: each folder is created
+    once, and files are written back to back instead of between renders.
+
+    Writes are incremental against the manifest of the previous run: a file
+    whose content hash is unchanged (and that nobody touched on disk since,
+    same size and mtime) is not rewritten. finish() deletes the files of the
+    previous run, or of the OWNED_DIRS, that this run did not produce, and
+    saves the new manifest.
+    """
+
+    def __init__(self, root, max_files=64, max_bytes=4 << 20):
+        self.root = root
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.pending = []
+        self.pending_bytes = 0
+        self.created_dirs = set()
+        self.previous = read_manifest(root)
+        self.manifest = {}
+        self.changed = []
+        self.unchanged = []
+        self.removed = []
+        self.batches = 0
+        self.seconds = 0.0
+
+    def add(self, rel_path, content):
+        self.pending.append((rel_path, content))
+        self.pending_bytes += len(content)
+        if len(self.pending) >= self.max_files or self.pending_bytes >= self.max_bytes:
+            self.flush()
+
+    def _up_to_date(self, path, key, digest):
+        prev = self.previous.get(key)
+        if not prev or prev[0] != digest:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return st.st_size == prev[1] and st.st_mtime_ns == prev[2]
+
+    def written(self):
+        """{manifest key: sha256} of every file added so far in this run"""
+        self.flush()
+        return {key: entry[0] for key, entry in self.manifest.items()}
+
+    def flush(self):
+        if not self.pending:
+            return
+        t0 = time.perf_counter()
+        for rel_path, content in self.pending:
+            path = os.path.join(self.root, rel_path)
+            key = _manifest_key(rel_path)
+            digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            if self._up_to_date(path, key, digest):
+                self.manifest[key] = self.previous[key]
+                self.unchanged.append(key)
+                continue
+            folder = os.path.dirname(path)
+            if folder not in self.created_dirs:
+                os.makedirs(folder, exist_ok=True)
+                self.created_dirs.add(folder)
+            with open(path, mode="w", encoding='utf-8') as f:
+                f.write(content)
+            st = os.stat(path)
+            self.manifest[key] = [digest, st.st_size, st.st_mtime_ns]
+            self.changed.append(key)
+        self.batches += 1
+        self.pending = []
+        self.pending_bytes = 0
+        self.seconds += time.perf_counter() - t0
+
+    def finish(self):
+        """Flushes, removes stale files and saves the manifest"""
+        self.flush()
+        t0 = time.perf_counter()
+        stale = set(k for k in self.previous if k not in self.manifest)
+        for owned in OWNED_DIRS:
+            folder = os.path.join(self.root, owned)
+            if os.path.isdir(folder):
+                for name in os.listdir(folder):
+                    key = _manifest_key(os.path.join(owned, name))
+                    if key not in self.manifest and os.path.isfile(os.path.join(folder, name)):
+                        stale.add(key)
+        for key in sorted(stale):
+            try:
+                os.remove(os.path.join(self.root, *key.split("/")))
+                self.removed.append(key)
+            except FileNotFoundError:
+                pass
+
+        tmp = os.path.join(self.root, "%s.%d.tmp" % (MANIFEST_NAME, os.getpid()))
+        with open(tmp, mode="w", encoding='utf-8') as f:
+            json.dump({"version": MANIFEST_VERSION, "files": self.manifest}, f, indent=1, sort_keys=True)
+        os.replace(tmp, os.path.join(self.root, MANIFEST_NAME))
+        self.seconds += time.perf_counter() - t0
+
+
 class WebUIGenerator(GeneratorInterface):
     """
     WebUIGenerator is a class that implements the GeneratorInterface and is responsible
@@ -36,214 +494,161 @@ class WebUIGenerator(GeneratorInterface):
         model (GUIModel): An instance of the GUIModel class representing the B-UML GUI model.
         output_dir (str, optional): The output directory where the generated code will be 
             saved. Defaults to None.
+        workers (int, optional): Render processes. Defaults to the CPU count; small
+            GUIs and platforms without fork render in-process.
+        bundle (bool, optional): Production build: JS and CSS bundled, minified and
+            content-hashed (see bundler.py). Defaults to False.
     """
     
-    def __init__(self, model, output_dir=None):
+    def __init__(self, model, output_dir=None, workers=None, bundle=False):
         super().__init__(model, output_dir)
+        self.workers = workers
+        self.bundle = bundle
         
         # Setup Jinja2 environment
         templates_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
-        self.env = Environment(
-            loader=FileSystemLoader(templates_path),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Add custom filters
-        self._register_filters()
-    
-    def _register_filters(self):
-        """Register custom Jinja2 filters"""
-        
-        def snake_case(text):
-            """Convert text to snake_case"""
-            import re
-            text = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-            return re.sub('([a-z0-9])([A-Z])', r'\1_\2', text).lower()
-        
-        def kebab_case(text):
-            """Convert text to kebab-case"""
-            return snake_case(text).replace('_', '-')
-        
-        def camel_case(text):
-            """Convert text to camelCase"""
-            words = text.replace('-', '_').split('_')
-            return words[0].lower() + ''.join(w.capitalize() for w in words[1:])
-        
-        def pascal_case(text):
-            """Convert text to PascalCase"""
-            words = text.replace('-', '_').split('_')
-            return ''.join(w.capitalize() for w in words)
-        
-        self.env.filters['snake_case'] = snake_case
-        self.env.filters['kebab_case'] = kebab_case
-        self.env.filters['camel_case'] = camel_case
-        self.env.filters['pascal_case'] = pascal_case
-    
-
+        self.env = _environment(templates_path)
     
     def generate(self, *args):
         """
         Generates HTML+CSS+JavaScript code based on the provided BESSER GUI model 
         and saves it to the specified output directory.
 
+        All render jobs are listed up front, rendered on a worker pool
+        (forked processes inheriting the model and the parsed templates) and
+        written through a BatchedWriter, which skips unchanged files and deletes
+        stale ones (see MANIFEST_NAME). With bundle=True the JS and CSS are
+        bundled before writing and index.html is rendered last, against the
+        hashed names. Template load/compile time, render time per template
+        and a changed / unchanged / removed summary are printed.
+
+        CSS is split per screen (see ELEMENT_STYLES): index.html inlines the
+        critical CSS of the main screen and loads the stylesheets without
+        blocking rendering; other screens' chunks come with their page.
+
         Returns:
             None, but stores the generated code as files in the output directory
         """
         print("Starting Web UI generation from GUI model: " + self.model.name)
-        
-        # Generate HTML
-        self._generate_html()
-        
-        # Generate CSS
-        self._generate_css()
-        
-        # Generate JavaScript
-        self._generate_javascript()
-        
-        # Generate additional assets
-        self._generate_assets()
-        
+
+        jobs = self._render_jobs()
+        templates = sorted({job.template for job in jobs if job.template is not None} | {'index.html.j2', 'sw.js.j2'})
+        print("  " + describe_load(self.env, len(templates), load_templates(self.env, templates)))
+        # index.html inlines CSS rendered from the templates just loaded
+        index_context = self._index_context(self._get_screens())
+        if not self.bundle:
+            jobs.insert(0, RenderJob('index.html.j2', "index.html", dict(index_context, assets=LOOSE_ASSETS)))
+        workers = _pool_size(self.workers, len(jobs))
+        print("  Rendering %d files on %d worker(s)..." % (len(jobs), workers))
+
+        writer = BatchedWriter(self.build_generation_path(""))
+        timings = {}
+        sources = {}
+        for job, content, seconds in render_jobs(self.env, jobs, workers):
+            if self.bundle and job.path.endswith((".js", ".css")):
+                sources[job.path.replace(os.sep, "/")] = content
+            else:
+                writer.add(job.path, content)
+            if job.template is None:
+                continue
+            count, total, worst = timings.get(job.template, (0, 0.0, 0.0))
+            timings[job.template] = (count + 1, total + seconds, max(worst, seconds))
+        if self.bundle:
+            self._write_bundle(writer, sources, index_context)
+        self._write_service_worker(writer)
+        writer.finish()
+
+        for template, (count, total, worst) in sorted(timings.items(), key=lambda kv: -kv[1][1]):
+            print("  %-20s x%-4d %8.1f ms (max %.1f ms)" % (template, count, total * 1000, worst * 1000))
+        for key in writer.removed:
+            print("  Removed stale " + key)
+        print("  %d changed, %d unchanged, %d removed (%d batch(es), %.1f ms)" % (
+            len(writer.changed), len(writer.unchanged), len(writer.removed), writer.batches, writer.seconds * 1000))
         print("Code generated successfully in: " + self.output_dir)
-    
-    def _generate_html(self):
-        """Generate HTML file from template"""
-        print("  Generating index.html...")
-        
-        template = self.env.get_template('index.html.j2')
-        file_path = self.build_generation_path("index.html")
-        
-        with open(file_path, mode="w", encoding='utf-8') as f:
-            content = template.render(gui=self.model)
-            f.write(content)
-    
-    def _generate_css(self):
-        """Generate CSS files"""
-        # Create css directory
-        css_dir = self.build_generation_path("css")
-        if not os.path.exists(css_dir):
-            os.makedirs(css_dir)
-        
-        # Main styles
-        print("  Generating styles.css...")
-        template = self.env.get_template('styles.css.j2')
-        file_path = os.path.join(css_dir, "styles.css")
-        
-        with open(file_path, mode="w", encoding='utf-8') as f:
-            content = template.render(gui=self.model)
-            f.write(content)
-        
-        # Component styles
-        print("  Generating components.css...")
-        template = self.env.get_template('components.css.j2')
-        file_path = os.path.join(css_dir, "components.css")
-        
-        with open(file_path, mode="w", encoding='utf-8') as f:
-            content = template.render(gui=self.model)
-            f.write(content)
-    
-    def _generate_javascript(self):
-        """Generate JavaScript files"""
-        # Create js directory
-        js_dir = self.build_generation_path("js")
-        if not os.path.exists(js_dir):
-            os.makedirs(js_dir)
-        
-        # App.js
-        print("  Generating app.js...")
-        template = self.env.get_template('app.js.j2')
-        file_path = os.path.join(js_dir, "app.js")
-        
-        with open(file_path, mode="w", encoding='utf-8') as f:
-            content = template.render(gui=self.model)
-            f.write(content)
-        
-        # Router.js
-        print("  Generating router.js...")
-        template = self.env.get_template('router.js.j2')
-        file_path = os.path.join(js_dir, "router.js")
-        
-        with open(file_path, mode="w", encoding='utf-8') as f:
-            content = template.render(gui=self.model, screens=self._get_screens())
-            f.write(content)
-        
-        # Components.js
-        print("  Generating components.js...")
-        template = self.env.get_template('components.js.j2')
-        file_path = os.path.join(js_dir, "components.js")
-        
-        with open(file_path, mode="w", encoding='utf-8') as f:
-            content = template.render(gui=self.model)
-            f.write(content)
-        
-        # API.js
-        print("  Generating api.js...")
-        template = self.env.get_template('api.js.j2')
-        file_path = os.path.join(js_dir, "api.js")
-        
-        with open(file_path, mode="w", encoding='utf-8') as f:
-            content = template.render(gui=self.model)
-            f.write(content)
-        
-        # Generate page-specific JavaScript
-        pages_dir = os.path.join(js_dir, "pages")
-        if not os.path.exists(pages_dir):
-            os.makedirs(pages_dir)
-        
-        screens = self._get_screens()
-        for screen in screens:
-            filename = screen.name.lower() + ".js"
-            print("  Generating " + filename + "...")
-            template = self.env.get_template('page.js.j2')
-            file_path = os.path.join(pages_dir, filename)
-            
-            with open(file_path, mode="w", encoding='utf-8') as f:
-                content = template.render(screen=screen, gui=self.model)
-                f.write(content)
-    
-    def _generate_assets(self):
-        """Generate additional assets like README and gitignore"""
-        # README.md
-        print("  Generating README.md...")
-        template = self.env.get_template('README.md.j2')
-        file_path = self.build_generation_path("README.md")
-        
-        with open(file_path, mode="w", encoding='utf-8') as f:
-            content = template.render(gui=self.model)
-            f.write(content)
-        
-        # .gitignore
-        print("  Generating .gitignore...")
-        gitignore_content = """# Dependencies
-node_modules/
 
-# Environment
-.env
-.env.local
+    def _write_bundle(self, writer, sources, index_context):
+        """Bundles the rendered JS/CSS, then renders index.html against the hashed names"""
+        t0 = time.perf_counter()
+        files, assets, manifest = bundle_app(sources)
+        for path, content in sorted(files.items()):
+            writer.add(os.path.join(*path.split("/")), content)
+        index, _ = _render(self.env, RenderJob('index.html.j2', "index.html", dict(index_context, assets=assets)))
+        writer.add("index.html", index)
+        size = lambda contents: sum(len(c.encode("utf-8")) for c in contents) / 1024.0
+        print("  Bundled %d files into %d: %.1f KiB -> %.1f KiB (%.1f ms)" % (
+            len(manifest), len(files) - 1, size(sources.values()),
+            size(c for p, c in files.items() if p in manifest.values()), (time.perf_counter() - t0) * 1000))
 
-# IDEs
-.vscode/
-.idea/
-*.swp
-*.swo
+    def _write_service_worker(self, writer):
+        """sw.js, precaching what this run wrote (after pruning and bundling)"""
+        written = writer.written()
+        precache = sorted(key for key in written if key.endswith(PRECACHE_EXTENSIONS))
+        version = hashlib.sha256("".join("%s:%s\n" % (key, written[key]) for key in precache).encode("utf-8"))
+        context = {
+            'gui': self.model,
+            'cache_name': "%s-%s" % (self.model.name, version.hexdigest()[:12]),
+            'precache': ["./"] + precache,
+            'api_base_url': API_BASE_URL,
+            'api_routes': api_routes(self._get_screens()),
+        }
+        content, _ = _render(self.env, RenderJob('sw.js.j2', SERVICE_WORKER, context))
+        writer.add(SERVICE_WORKER, content)
 
-# OS
-.DS_Store
-Thumbs.db
+    def _index_context(self, screens):
+        """Context of index.html.j2 but its 'assets' (loose files, or the bundle's)"""
+        return {'gui': self.model, 'service_worker': SERVICE_WORKER,
+                'critical_css': self._critical_css(screens), 'logout_route': logout_route(screens)}
 
-# Build
-dist/
-build/
-"""
-        file_path = self.build_generation_path(".gitignore")
-        with open(file_path, mode="w", encoding='utf-8') as f:
-            f.write(gitignore_content)
+    def _critical_css(self, screens):
+        """
+        CSS inlined into index.html, minified: styles.css, the CRITICAL_STYLES
+        and the style groups of the main screen (which has no chunk of its own)
+        """
+        main = main_screen(screens)
+        styles = list(CRITICAL_STYLES) + (page_plan(main, login_route(screens)).styles if main else [])
+        css = [_render(self.env, RenderJob('styles.css.j2', None, {'gui': self.model}))[0],
+               _render(self.env, RenderJob('components.css.j2', None, {'gui': self.model, 'styles': styles}))[0]]
+        return minify_css("\n".join(css)).strip()
+
+    def _render_jobs(self):
+        """Every file of the web app but index.html, in output order (see generate for index.html)"""
+        gui = self.model
+        screens = self._get_screens()
+        main = main_screen(screens)
+        login = login_route(screens)
+        plans = {screen.name: page_plan(screen, login) for screen in screens}
+        # screen -> CSS chunk the router loads with its page
+        page_styles = {screen.name: page_stylesheet(screen) for screen in screens
+                       if plans[screen.name].styles and screen is not main}
+        jobs = [
+            RenderJob('styles.css.j2', os.path.join("css", "styles.css"), {'gui': gui}),
+            RenderJob('components.css.j2', os.path.join("css", "components.css"),
+                      {'gui': gui, 'styles': SHARED_STYLES}),
+            RenderJob('app.js.j2', os.path.join("js", "app.js"), {'gui': gui}),
+            RenderJob('router.js.j2', os.path.join("js", "router.js"),
+                      {'gui': gui, 'screens': screens, 'main_screen': main,
+                       'prefetch': route_prefetch(screens), 'page_styles': page_styles}),
+            RenderJob('components.js.j2', os.path.join("js", "components.js"), {'gui': gui}),
+            RenderJob('api.js.j2', os.path.join("js", "api.js"),
+                      {'gui': gui, 'cache_ttls': cache_ttls(gui), 'default_cache_ttl': DEFAULT_CACHE_TTL,
+                       'api_base_url': API_BASE_URL}),
+        ]
+        for screen in screens:
+            filename = screen.name.lower() + ".js"
+            context = {'screen': screen, 'gui': gui, 'page': plans[screen.name]}
+            jobs.append(RenderJob('page.js.j2', os.path.join("js", "pages", filename), context))
+            if screen.name in page_styles:
+                jobs.append(RenderJob('components.css.j2', os.path.join(*page_styles[screen.name].split("/")),
+                                      {'gui': gui, 'styles': plans[screen.name].styles}))
+        jobs.append(RenderJob('README.md.j2', "README.md", {'gui': gui, 'screens': screens}))
+        jobs.append(RenderJob(None, ".gitignore", GITIGNORE))
+        return jobs
     
     def _get_screens(self):
         """Extract all screens from the GUI model"""
         screens = []
         if hasattr(self.model, 'modules'):
-            for module in self.model.modules:
+            for module in sorted(self.model.modules, key=lambda m: m.name):
                 if hasattr(module, 'screens'):
-                    screens.extend(module.screens)
+                    screens.extend(sorted(module.screens, key=lambda s: s.name))
         return screens
@@ -0,0 +1,314 @@
+"""
+bundler.py
+
+Production bundling for the web app rendered by besser_web_ui_generator.py
+(WebUIGenerator(..., bundle=True), `generate_app.py --bundle`). Pure Python:
+no Node toolchain.
+
+JavaScript is split along the module graph of the rendered ES modules:
+
+- entry chunk  js/app.<hash>.js: js/app.js and everything it imports
+  statically (router, main page...), minus the shared chunk;
+- shared chunk js/shared.<hash>.js: modules also imported by lazily loaded
+  pages (components.js, api.js);
+- one chunk per lazily loaded page, js/pages/<screen>.<hash>.js.
+
+Modules of a chunk are concatenated in dependency order with the imports
+between them removed; imports from another chunk and dynamic import() paths
+are rewritten to its hashed name. Chunks are hashed shared first, then pages,
+then the entry, so every reference is to a final name. The global
+stylesheets are concatenated, in page order, into css/app.<hash>.css; any
+other stylesheet (the per-screen chunks in css/pages/) is minified and hashed
+on its own, before the JS, and the quoted paths to it in the JS (e.g. the
+router's `style: 'css/pages/<screen>.css'`) are rewritten to the hashed name.
+
+Minification is conservative (comments, indentation and blank lines go;
+strings, the text of template literals, regular expressions and line breaks
+that could matter to automatic semicolon insertion stay; only the code
+inside ${...} is minified).
+
+bundle_app() returns the files to write, the index.html assets and the
+manifest written as ASSET_MANIFEST (source file -> hashed file).
+"""
+
+import hashlib
+import json
+import posixpath
+import re
+
+ASSET_MANIFEST = "asset-manifest.json"
+HASH_LENGTH = 10
+
+ENTRY = "js/app.js"
+STYLESHEETS = ("css/styles.css", "css/components.css")
+
+_STATIC_IMPORT = re.compile(r"^import\s*\{([^}]*)\}\s*from\s*'([^']+)';[ \t]*\n?", re.M)
+_DYNAMIC_IMPORT = re.compile(r"import\('([^']+)'\)")
+_STYLE_REF = re.compile(r"'(css/[^']+\.css)'")
+_TOP_LEVEL = re.compile(r"^(?:export\s+)?(?:class|function|const|let|var)\s+([A-Za-z_$][\w$]*)", re.M)
+
+
+# ------------------------------------------------------------
+# Minification
+# ------------------------------------------------------------
+# a '/' after one of these (or a keyword) starts a regular expression literal
+_REGEX_PREFIX = set("(,=:[!&|?{};+-*%<>~^")
+_KEYWORD_END = re.compile(r"(?<![\w$])(?:return|typeof|case|do|else|in|of|void|yield)$")
+# no space is needed next to these
+_PUNCTUATION = set("{}()[];,:=<>+-*/%&|!?.~^")
+# a line break after one of these never ends a statement
+_CONTINUES = set("{([,;=:?&|")
+
+
+def _copy_quoted(src, i, quote):
+    j = i + 1
+    while j < len(src) and src[j] != quote:
+        j += 2 if src[j] == "\\" else 1
+    return j + 1
+
+
+def _copy_regex(src, i):
+    j, in_class = i + 1, False
+    while j < len(src):
+        c = src[j]
+        if c == "\\":
+            j += 2
+            continue
+        if c == "[":
+            in_class = True
+        elif c == "]":
+            in_class = False
+        elif c == "/" and not in_class:
+            break
+        j += 1
+    j += 1
+    while j < len(src) and (src[j].isalpha()):
+        j += 1
+    return j
+
+
+def _template_literal(src, i, out):
+    """Copies the template literal at src[i], its text verbatim; returns the index after it"""
+    out.append("`")
+    j = start = i + 1
+    while j < len(src):
+        c = src[j]
+        if c == "\\":
+            j += 2
+        elif c == "`":
+            break
+        elif c == "$" and src.startswith("${", j):
+            out.append(src[start:j])
+            out.append("${")
+            j = start = _minify_js(src, j + 2, out, until="}")
+            out.append("}")
+        else:
+            j += 1
+    out.append(src[start:j])
+    out.append("`")
+    return j + 1
+
+
+def _minify_js(src, i, out, until=None):
+    depth = 0
+    pending = None   # whitespace seen since the last token: " " or "\n"
+    while i < len(src):
+        c = src[i]
+        if until and depth == 0 and c == until:
+            return i + 1
+        if c in " \t\r\n":
+            if c == "\n" or pending == "\n":
+                pending = "\n"
+            elif pending is None:
+                pending = " "
+            i += 1
+            continue
+        if c == "/" and src.startswith("//", i):
+            i = src.find("\n", i)
+            i = len(src) if i < 0 else i
+            continue
+        if c == "/" and src.startswith("/*", i):
+            end = src.find("*/", i + 2)
+            i = len(src) if end < 0 else end + 2
+            pending = pending or " "
+            continue
+
+        prev = _last_char(out)
+        if pending and prev:
+            if pending == "\n" and prev not in _CONTINUES and c not in ")]}.,;:?":
+                out.append("\n")
+            elif prev not in _PUNCTUATION and c not in _PUNCTUATION:
+                out.append(" ")
+            elif prev in "+-" and c in "+-":
+                out.append(" ")
+        pending = None
+
+        if c in "'\"":
+            j = _copy_quoted(src, i, c)
+            out.append(src[i:j])
+            i = j
+        elif c == "`":
+            i = _template_literal(src, i, out)
+        elif c == "/" and (not prev or prev in _REGEX_PREFIX or _ends_with_keyword(out)):
+            j = _copy_regex(src, i)
+            out.append(src[i:j])
+            i = j
+        else:
+            if c in "{([":
+                depth += 1
+            elif c in "})]":
+                depth -= 1
+            out.append(c)
+            i += 1
+    return i
+
+
+def _last_char(out):
+    for chunk in reversed(out):
+        if chunk:
+            return chunk[-1]
+    return ""
+
+
+def _ends_with_keyword(out):
+    return _KEYWORD_END.search("".join(out[-12:])) is not None
+
+
+def minify_js(src):
+    out = []
+    _minify_js(src, 0, out)
+    return "".join(out).strip() + "\n"
+
+
+def minify_css(src):
+    parts = re.split(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')", src)
+    for k in range(0, len(parts), 2):
+        s = re.sub(r"/\*.*?\*/", "", parts[k], flags=re.S)
+        s = re.sub(r"\s+", " ", s)
+        s = re.sub(r"\s*([{};,>])\s*", r"\1", s)
+        s = re.sub(r":\s+", ":", s)
+        parts[k] = s.replace(";}", "}")
+    return "".join(parts).strip() + "\n"
+
+
+# ------------------------------------------------------------
+# Module graph
+# ------------------------------------------------------------
+def _resolve(importer, spec):
+    return posixpath.normpath(posixpath.join(posixpath.dirname(importer), spec))
+
+
+def _static_deps(path, sources):
+    return [_resolve(path, m.group(2)) for m in _STATIC_IMPORT.finditer(sources[path])]
+
+
+def _closure(roots, sources):
+    """Static import closure of roots, dependencies first"""
+    order, seen = [], set()
+
+    def visit(path):
+        if path in seen:
+            return
+        if path not in sources:
+            raise ValueError("bundle: %s is imported but was not generated" % path)
+        seen.add(path)
+        for dep in _static_deps(path, sources):
+            visit(dep)
+        order.append(path)
+
+    for root in roots:
+        visit(root)
+    return order
+
+
+def _chunks(sources, entry):
+    """[(chunk name, modules)] in hashing order: shared, lazy pages, entry"""
+    eager = _closure([entry], sources)
+    lazy_roots = sorted({_resolve(p, m.group(1)) for p in sources if p.endswith(".js")
+                         for m in _DYNAMIC_IMPORT.finditer(sources[p])} - set(eager))
+    lazy = {root: _closure([root], sources) for root in lazy_roots}
+    shared_roots = sorted({dep for modules in lazy.values() for dep in modules} - set(lazy_roots))
+    shared = _closure(shared_roots, sources)
+
+    chunks = [("js/shared.js", shared)] if shared else []
+    for root in lazy_roots:
+        chunks.append((root, [p for p in lazy[root] if p not in shared]))
+    chunks.append((entry, [p for p in eager if p not in shared]))
+    return chunks
+
+
+def _hashed(path, content):
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+    stem, ext = posixpath.splitext(path)
+    return "%s.%s%s" % (stem, digest, ext)
+
+
+def _link_chunk(name, modules, sources, chunk_of, final, styles):
+    """Concatenates modules into one chunk, pointing imports at final chunk names"""
+    out_dir = posixpath.dirname(name)
+    names = {}
+    for path in modules:
+        for top in _TOP_LEVEL.findall(sources[path]):
+            if names.setdefault(top, path) != path:
+                raise ValueError("bundle: %s is declared in both %s and %s" % (top, names[top], path))
+
+    def rel(target):
+        spec = posixpath.relpath(final[chunk_of[target]], out_dir)
+        return spec if spec.startswith(".") else "./" + spec
+
+    imports, bodies = {}, []
+    for path in modules:
+        def static(m, path=path):
+            target = _resolve(path, m.group(2))
+            if chunk_of[target] != chunk_of[path]:
+                imports.setdefault(rel(target), set()).update(n.strip() for n in m.group(1).split(",") if n.strip())
+            elif " as " in m.group(1):
+                raise ValueError("bundle: aliased import in %s" % path)
+            return ""
+
+        def dynamic(m, path=path):
+            return "import('%s')" % rel(_resolve(path, m.group(1)))
+
+        body = _STATIC_IMPORT.sub(static, sources[path])
+        body = _STYLE_REF.sub(lambda m: "'%s'" % styles.get(m.group(1), m.group(1)), body)
+        bodies.append(_DYNAMIC_IMPORT.sub(dynamic, body))
+
+    head = "".join("import { %s } from '%s';\n" % (", ".join(sorted(n)), spec) for spec, n in sorted(imports.items()))
+    return minify_js(head + "\n".join(bodies))
+
+
+def bundle_app(sources, entry=ENTRY, stylesheets=STYLESHEETS):
+    """
+    sources: rendered file path (posix, relative to the app root) -> content,
+    for every .js and stylesheet of the app.
+
+    Returns (files, assets, manifest): hashed path -> content, the index.html
+    assets ({'styles': [...], 'script': ..., 'preload': [...]}) and source path
+    -> hashed path (also in files, as ASSET_MANIFEST).
+    """
+    files, styles = {}, {}
+    for path in sorted(p for p in sources if p.endswith(".css") and p not in stylesheets):
+        css = minify_css(sources[path])
+        styles[path] = _hashed(path, css)
+        files[styles[path]] = css
+
+    chunks = _chunks(sources, entry)
+    chunk_of = {path: name for name, modules in chunks for path in modules}
+    final = {}
+    for name, modules in chunks:
+        content = _link_chunk(name, modules, sources, chunk_of, final, styles)
+        final[name] = _hashed(name, content)
+        files[final[name]] = content
+
+    css = minify_css("\n".join(sources[path] for path in stylesheets))
+    css_path = _hashed("css/app.css", css)
+    files[css_path] = css
+
+    manifest = {path: final[chunk_of[path]] for path in sorted(chunk_of)}
+    manifest.update((path, css_path) for path in stylesheets)
+    manifest.update(styles)
+    files[ASSET_MANIFEST] = json.dumps(manifest, indent=1, sort_keys=True) + "\n"
+
+    preload = [final["js/shared.js"]] if "js/shared.js" in final else []
+    assets = {"styles": [css_path], "script": final[entry], "preload": preload}
+    return files, assets, manifest
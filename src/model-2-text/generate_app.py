@@ -29,6 +29,12 @@ def _load_module_py2(py_path, module_name):
 
 
 def _load_module(py_path):
+    # Sibling imports of the model (e.g. structural_community_platform) must
+    # resolve from the model's own folder, not from this generator's folder
+    model_dir = os.path.dirname(os.path.abspath(py_path))
+    if model_dir not in sys.path:
+        sys.path.insert(0, model_dir)
+
     # Prefer Python 3 importlib.util when available
     try:
         import importlib.util
@@ -98,23 +104,32 @@ def load_model(py_path):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 generate_app.py <path_to_model.py> [output_dir]")
+    args = [a for a in sys.argv[1:] if a != "--bundle"]
+    bundle = len(args) < len(sys.argv) - 1
+    if len(args) < 1:
+        print("Usage: python3 generate_app.py <path_to_model.py> [output_dir] [--bundle]")
         if USING_BESSER:
             print("Using BESSER GUI metamodel classes")
         else:
             print("Using local GUI model classes (BESSER not found)")
         sys.exit(1)
 
-    model_py = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else "./output_besser"
+    model_py = args[0]
+    output_dir = args[1] if len(args) > 1 else "./output_besser"
 
     print("Loading model from:", model_py)
     if USING_BESSER:
         print("✓ Using official BESSER framework")
     
-    gui_model = load_model(model_py)
+    gui_model = prepare_model(load_model(model_py))
+
+    generator = WebUIGenerator(model=gui_model, output_dir=output_dir, bundle=bundle)
+    generator.generate()
+    print("\n✓ Website ready at:", output_dir)
 
+
+def prepare_model(gui_model):
+    """Template defaults (features, theme) expected by the Jinja templates."""
     # Ensure features dict exists (for template compatibility)
     if not hasattr(gui_model, 'features'):
         gui_model.features = {}
@@ -137,10 +152,7 @@ def main():
     # Ensure theme dict exists
     if not hasattr(gui_model, 'theme'):
         gui_model.theme = {}
-
-    generator = WebUIGenerator(model=gui_model, output_dir=output_dir)
-    generator.generate()
-    print("\n✓ Website ready at:", output_dir)
+    return gui_model
 
 
 if __name__ == '__main__':
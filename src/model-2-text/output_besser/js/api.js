@@ -1,11 +1,100 @@
 /**
  * API Service
  * Handles all API communication for appName
+ *
+ * GET responses are cached per entity: fresh for the TTL of the entity's
+ * DataSource in the GUI model, then revalidated with If-None-Match (a 304
+ * keeps the cached body). Identical GETs in flight share one request, and
+ * writes drop the cached responses of their entity. The cache can also be
+ * kept in IndexedDB across reloads (ApiService.enablePersistentCache()).
  */
 
-const API_BASE_URL = 'http://localhost:3000/api'; // Configure your backend URL
+const API_BASE_URL = 'http://localhost:3000/api'; // Configure your backend URL (WebUIGenerator API_BASE_URL)
+
+// Seconds a response stays fresh, per entity (DataSourceElement.cache_ttl)
+const CACHE_TTLS = {
+    'Category': 3600,
+    'Community': 3600,
+    'Item': 60,
+    'Offer': 30,
+    'Rating': 300,
+};
+const DEFAULT_CACHE_TTL = 0;
+
+const DB_NAME = 'app-name-api-cache';
+const DB_STORE = 'responses';
+
+class ResponseCache {
+    constructor() {
+        this.entries = new Map();   // url -> { data, etag, expires, entity }
+        this.inflight = new Map();  // url -> Promise
+        this.db = null;
+    }
+
+    ttl(entity) {
+        return (entity in CACHE_TTLS ? CACHE_TTLS[entity] : DEFAULT_CACHE_TTL) * 1000;
+    }
+
+    async get(url) {
+        let entry = this.entries.get(url);
+        if (!entry && this.db) {
+            entry = await this.request(this.db.transaction(DB_STORE).objectStore(DB_STORE).get(url));
+            if (entry) this.entries.set(url, entry);
+        }
+        return entry;
+    }
+
+    set(url, entry) {
+        this.entries.set(url, entry);
+        if (this.db) {
+            this.db.transaction(DB_STORE, 'readwrite').objectStore(DB_STORE).put(entry, url);
+        }
+    }
+
+    invalidate(entity) {
+        for (const [url, entry] of this.entries) {
+            if (entry.entity === entity) this.entries.delete(url);
+        }
+        if (this.db) {
+            const store = this.db.transaction(DB_STORE, 'readwrite').objectStore(DB_STORE);
+            store.openCursor().onsuccess = event => {
+                const cursor = event.target.result;
+                if (!cursor) return;
+                if (cursor.value.entity === entity) cursor.delete();
+                cursor.continue();
+            };
+        }
+    }
+
+    async open() {
+        if (this.db || typeof indexedDB === 'undefined') return;
+        const request = indexedDB.open(DB_NAME, 1);
+        request.onupgradeneeded = () => request.result.createObjectStore(DB_STORE);
+        this.db = await this.request(request);
+    }
+
+    request(req) {
+        return new Promise((resolve, reject) => {
+            req.onsuccess = () => resolve(req.result);
+            req.onerror = () => reject(req.error);
+        });
+    }
+}
 
 export class ApiService {
+    static cache = new ResponseCache();
+
+    /**
+     * Keep cached responses in IndexedDB across page reloads
+     */
+    static async enablePersistentCache() {
+        try {
+            await this.cache.open();
+        } catch (error) {
+            console.warn('API cache: IndexedDB unavailable, using memory only', error);
+        }
+    }
+
     /**
      * Generic fetch wrapper
      */
@@ -35,17 +124,70 @@ export class ApiService {
     }
     
     /**
-     * GET request
+     * GET request, cached per entity (see CACHE_TTLS)
      */
-    static async get(endpoint) {
-        return this.fetch(endpoint, { method: 'GET' });
+    static async get(endpoint, { entity = null } = {}) {
+        const url = `${API_BASE_URL}${endpoint}`;
+        const entry = await this.cache.get(url);
+        if (entry && entry.expires > Date.now()) {
+            return entry.data;
+        }
+
+        let pending = this.cache.inflight.get(url);
+        if (!pending) {
+            pending = this.revalidate(url, entry, entity)
+                .finally(() => this.cache.inflight.delete(url));
+            this.cache.inflight.set(url, pending);
+        }
+        return pending;
+    }
+
+    /**
+     * One page of a collection, cursor-paginated: GET endpoint?limit=&cursor=
+     * answering { items, next_cursor } (next_cursor null on the last page)
+     */
+    static async getPage(endpoint, { cursor = null, limit = 50, entity = null } = {}) {
+        const query = new URLSearchParams({ limit: String(limit) });
+        if (cursor !== null && cursor !== undefined) {
+            query.set('cursor', cursor);
+        }
+        const page = await this.get(`${endpoint}?${query}`, { entity });
+        return { items: page.items || [], nextCursor: page.next_cursor ?? null };
+    }
+
+    static async revalidate(url, entry, entity) {
+        const headers = { 'Content-Type': 'application/json' };
+        if (entry && entry.etag) {
+            headers['If-None-Match'] = entry.etag;
+        }
+
+        try {
+            // an expired entry must come from the server, not from the service worker's cache
+            const response = await fetch(url, { method: 'GET', headers, cache: entry ? 'no-cache' : 'default' });
+            const expires = Date.now() + this.cache.ttl(entity);
+
+            if (response.status === 304 && entry) {
+                this.cache.set(url, { ...entry, expires });
+                return entry.data;
+            }
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+
+            const data = await response.json();
+            this.cache.set(url, { data, etag: response.headers.get('ETag'), expires, entity });
+            return data;
+        } catch (error) {
+            console.error('API Error:', error);
+            throw error;
+        }
     }
     
     /**
      * POST request
      */
-    static async post(endpoint, data) {
-        return this.fetch(endpoint, {
+    static async post(endpoint, data, { entity = null } = {}) {
+        return this.write(endpoint, entity, {
             method: 'POST',
             body: JSON.stringify(data),
         });
@@ -54,8 +196,8 @@ export class ApiService {
     /**
      * PUT request
      */
-    static async put(endpoint, data) {
-        return this.fetch(endpoint, {
+    static async put(endpoint, data, { entity = null } = {}) {
+        return this.write(endpoint, entity, {
             method: 'PUT',
             body: JSON.stringify(data),
         });
@@ -64,8 +206,16 @@ export class ApiService {
     /**
      * DELETE request
      */
-    static async delete(endpoint) {
-        return this.fetch(endpoint, { method: 'DELETE' });
+    static async delete(endpoint, { entity = null } = {}) {
+        return this.write(endpoint, entity, { method: 'DELETE' });
+    }
+
+    static async write(endpoint, entity, options) {
+        const result = await this.fetch(endpoint, options);
+        if (entity) {
+            this.cache.invalidate(entity);
+        }
+        return result;
     }
 }
 
@@ -106,7 +256,7 @@ export class ItemApi {
             }
         ];
         // Uncomment when backend is ready:
-        // return ApiService.get('/items');
+        // return ApiService.get('/items', { entity: 'Item' });
     }
     
     static async getById(id) {
@@ -114,19 +264,29 @@ export class ItemApi {
         const items = await this.getAll();
         return items.find(item => item.id == id);
         // Uncomment when backend is ready:
-        // return ApiService.get(`/items/${id}`);
+        // return ApiService.get(`/items/${id}`, { entity: 'Item' });
+    }
+    
+    static async getPage(cursor = null, limit = 50) {
+        // Mock data for demonstration: the cursor is the offset of the next page
+        const items = await this.getAll();
+        const start = cursor ? Number(cursor) : 0;
+        const end = start + limit;
+        return { items: items.slice(start, end), nextCursor: end < items.length ? String(end) : null };
+        // Uncomment when backend is ready:
+        // return ApiService.getPage('/items', { cursor, limit, entity: 'Item' });
     }
     
     static async create(data) {
-        return ApiService.post('/items', data);
+        return ApiService.post('/items', data, { entity: 'Item' });
     }
     
     static async update(id, data) {
-        return ApiService.put(`/items/${id}`, data);
+        return ApiService.put(`/items/${id}`, data, { entity: 'Item' });
     }
     
     static async delete(id) {
-        return ApiService.delete(`/items/${id}`);
+        return ApiService.delete(`/items/${id}`, { entity: 'Item' });
     }
 }
 
@@ -154,7 +314,7 @@ export class ChatApi {
             }
         ];
         // Uncomment when backend is ready:
-        // return ApiService.get(`/conversations/${conversationId}/messages`);
+        // return ApiService.get(`/conversations/${conversationId}/messages`, { entity: 'Message' });
     }
     
     static async sendMessage(conversationId, text) {
@@ -166,6 +326,6 @@ export class ChatApi {
             timestamp: new Date().toISOString()
         };
         // Uncomment when backend is ready:
-        // return ApiService.post(`/conversations/${conversationId}/messages`, { text });
+        // return ApiService.post(`/conversations/${conversationId}/messages`, { text }, { entity: 'Message' });
     }
 }
\ No newline at end of file
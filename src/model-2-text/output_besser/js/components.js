@@ -249,6 +249,102 @@ class ChatComponent extends Component {
     }
 }
 
+/**
+ * VirtualList
+ * Windowed list for large DataLists: only the rows in view (plus a few on
+ * each side) are in the DOM, and the next page is requested through
+ * fetchPage(cursor) -> { items, nextCursor } when the user scrolls near the
+ * end. Rows have a fixed height (rowHeight) so the window is pure arithmetic.
+ */
+export class VirtualList {
+    constructor(container, { fetchPage, renderItem, rowHeight = 112, overscan = 6 }) {
+        this.container = container;
+        this.fetchPage = fetchPage;
+        this.renderItem = renderItem;
+        this.rowHeight = rowHeight;
+        this.overscan = overscan;
+        this.items = [];
+        this.cursor = null;
+        this.done = false;
+        this.loading = null;
+        this.range = null;
+        this.frame = null;
+        this.destroyed = false;
+
+        this.spacer = document.createElement('div');
+        this.spacer.className = 'virtual-list-spacer';
+        this.window = document.createElement('div');
+        this.window.className = 'virtual-list-window';
+        this.spacer.appendChild(this.window);
+        this.container.appendChild(this.spacer);
+
+        this.onScroll = () => {
+            if (this.frame === null) {
+                this.frame = requestAnimationFrame(() => {
+                    this.frame = null;
+                    this.update();
+                });
+            }
+        };
+        this.container.addEventListener('scroll', this.onScroll, { passive: true });
+        this.loadMore();
+    }
+
+    async loadMore() {
+        if (this.loading || this.done || this.destroyed) return this.loading;
+        this.loading = (async () => {
+            try {
+                const { items, nextCursor } = await this.fetchPage(this.cursor);
+                this.items.push(...items);
+                this.cursor = nextCursor;
+                this.done = nextCursor === null || nextCursor === undefined || items.length === 0;
+            } catch (error) {
+                console.error('VirtualList: failed to load page', error);
+                this.done = true;
+            }
+        })();
+        await this.loading;
+        this.loading = null;
+        this.range = null;
+        this.update();
+    }
+
+    update() {
+        // a page still loading when its list is destroyed must not render or fetch more
+        if (this.destroyed) return;
+        const { scrollTop, clientHeight } = this.container;
+        const count = this.items.length;
+        this.spacer.style.height = `${count * this.rowHeight}px`;
+
+        if (count === 0 && this.done) {
+            this.window.innerHTML = '<p class="placeholder-text">No items yet.</p>';
+            return;
+        }
+
+        const start = Math.max(0, Math.floor(scrollTop / this.rowHeight) - this.overscan);
+        const end = Math.min(count, Math.ceil((scrollTop + clientHeight) / this.rowHeight) + this.overscan);
+        if (!this.range || this.range[0] !== start || this.range[1] !== end) {
+            this.range = [start, end];
+            this.window.style.transform = `translateY(${start * this.rowHeight}px)`;
+            this.window.innerHTML = this.items.slice(start, end)
+                .map(item => `<div class="virtual-list-row" style="height: ${this.rowHeight}px">${this.renderItem(item)}</div>`)
+                .join('');
+        }
+
+        // keep a screenful of rows loaded beyond the visible ones
+        if (!this.done && end + this.overscan >= count - Math.ceil(clientHeight / this.rowHeight)) {
+            this.loadMore();
+        }
+    }
+
+    destroy() {
+        this.destroyed = true;
+        this.container.removeEventListener('scroll', this.onScroll);
+        if (this.frame !== null) cancelAnimationFrame(this.frame);
+        this.frame = null;
+    }
+}
+
 // Make ComponentRegistry available globally
 if (typeof window !== 'undefined') {
     window.ComponentRegistry = ComponentRegistry;
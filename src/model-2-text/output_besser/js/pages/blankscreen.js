@@ -4,7 +4,6 @@
  */
 
 import { ComponentRegistry } from '../components.js';
-import { ItemApi } from '../api.js';
 
 export class blankscreenPage {
     constructor(params = {}) {
@@ -13,10 +12,6 @@ export class blankscreenPage {
         this.data = {};
     }
 
-    isLoggedIn() {
-        return localStorage.getItem("isLoggedIn") === "true";
-    }
-
     async init() {
         console.log('Initializing BlankScreen page', this.params);
 
@@ -25,40 +20,7 @@ export class blankscreenPage {
         this.setupChat();
     }
 
-    async fetchData() {
-        try {
-            if ('BlankScreen' === 'ItemListScreen') {
-                this.data.items = await ItemApi.getAll();
-            } else if ('BlankScreen' === 'ItemDetailsScreen') {
-                if (this.params.id) {
-                    this.data.item = await ItemApi.getById(this.params.id);
-                }
-            }
-        } catch (error) {
-            console.error('Error fetching data:', error);
-            this.data.error = 'Failed to load data';
-        }
-    }
-
     async render() {
-        // ---------- AUTH GUARD ----------
-        if (['PaymentScreen','CheckoutScreen'].includes('BlankScreen') && !this.isLoggedIn()) {
-            window.location.hash = '#/loginscreen';
-            return '';
-        }
-
-        // ---------- ITEM DETAILS GUARD ----------
-        if ('BlankScreen' === 'ItemDetailsScreen' && !this.params.id) {
-            window.location.hash = '#/itemlistscreen';
-            return '';
-        }
-
-        await this.fetchData();
-
-        if (this.data.error) {
-            return `<div class="error"><h3>Error</h3><p>${this.data.error}</p></div>`;
-        }
-
         // ---------- RENDER ORIGINAL UI ----------
         let elementsHtml = '';
 
@@ -81,4 +43,8 @@ export class blankscreenPage {
     setupChat() {
         // Setup chat or conversation handlers here
     }
+
+    destroy() {
+        // Called by the router before the page is replaced
+    }
 }
\ No newline at end of file
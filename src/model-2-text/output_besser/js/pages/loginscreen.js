@@ -1,79 +0,0 @@
-/**
- * LoginScreen Page
- * Generated from LoginScreen screen definition
- */
-
-import { ComponentRegistry } from '../components.js';
-
-export class loginscreenPage {
-    constructor(params = {}) {
-        this.params = params;
-        this.components = new ComponentRegistry();
-        this.data = {};
-    }
-    
-    /**
-     * Initialize page after rendering
-     */
-    async init() {
-        console.log('Initializing LoginScreen page', this.params);
-    }
-    
-    /**
-     * Fetch page data
-     */
-    async fetchData() {
-        try {
-            // Data loading logic will be implemented by the application
-        } catch (error) {
-            console.error('Error fetching data:', error);
-            this.data.error = 'Failed to load data';
-        }
-    }
-    
-    /**
-     * Render page content
-     */
-    async render() {
-        // Fetch data before rendering
-        await this.fetchData();
-        
-        if (this.data.error) {
-            return `
-                <div class="error">
-                    <h3>Error</h3>
-                    <p>${this.data.error}</p>
-                </div>
-            `;
-        }
-        
-            return `
-                <div class="page page-login-screen">
-                    <div class="page-header">
-                        <h1 class="page-title">LoginScreen</h1>
-                    </div>
-                
-                    <div class="page-content">
-                        <div class="login-options">
-                            <button class="btn">Sign in with Email</button>
-                            <button class="btn">Sign in with Phone</button>
-                        </div>
-                    </div>
-            </div>
-        `;
-    }
-    
-    /**
-     * Setup action button handlers
-     */
-    setupActionHandlers() {
-        // Action handlers will be implemented by the application
-    }
-    
-    /**
-     * Setup chat functionality
-     */
-    setupChat() {
-        // Chat handlers will be implemented by the application
-    }
-}
\ No newline at end of file
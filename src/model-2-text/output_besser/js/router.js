@@ -1,47 +1,43 @@
 /**
  * Router - Single Page Application Router
  * Handles client-side routing for appName
+ *
+ * Page modules are loaded on first visit with a dynamic import(); only the
+ * main page is bundled with the router. A page's component styles come in a
+ * stylesheet of its own, loaded with the module (the main page's are inlined
+ * in index.html). After a page is shown, the pages its buttons navigate to
+ * are prefetched when the browser is idle.
  */
 
-import { paymentscreenPage } from './pages/paymentscreen.js';
-import { ratingslistscreenPage } from './pages/ratingslistscreen.js';
-import { subcommunityselectorscreenPage } from './pages/subcommunityselectorscreen.js';
 import { itemlistscreenPage } from './pages/itemlistscreen.js';
-import { itemdetailsscreenPage } from './pages/itemdetailsscreen.js';
-import { blankscreenPage } from './pages/blankscreen.js';
-
-/* === MANUAL FIX: Force LoginScreen import with correct class name === */
-import { loginscreenPage } from './pages/loginscreen.js';
-/* =================================================================== */
 
 export class Router {
     constructor() {
         this.routes = [];
         this.currentRoute = null;
+        this.currentPage = null;
+        this.handlers = {};
+        this.styles = {};
         this.setupRoutes();
     }
 
     setupRoutes() {
         this.routes = [
             {
-                path: '/paymentscreen',
-                name: 'PaymentScreen',
-                title: 'PaymentScreen',
-                handler: paymentscreenPage,
-                params: {},
-                isMain: false
-            },            {
-                path: '/ratingslistscreen',
-                name: 'RatingsListScreen',
-                title: 'RatingsListScreen',
-                handler: ratingslistscreenPage,
+                path: '/blankscreen',
+                name: 'BlankScreen',
+                title: 'BlankScreen',
+                load: () => import('./pages/blankscreen.js').then(m => m.blankscreenPage),
+                prefetch: [],
                 params: {},
                 isMain: false
             },            {
-                path: '/subcommunityselectorscreen',
-                name: 'SubcommunitySelectorScreen',
-                title: 'SubcommunitySelectorScreen',
-                handler: subcommunityselectorscreenPage,
+                path: '/itemdetailsscreen',
+                name: 'ItemDetailsScreen',
+                title: 'ItemDetailsScreen',
+                load: () => import('./pages/itemdetailsscreen.js').then(m => m.itemdetailsscreenPage),
+                style: 'css/pages/itemdetailsscreen.css',
+                prefetch: ['/paymentscreen'],
                 params: {},
                 isMain: false
             },            {
@@ -49,35 +45,88 @@ export class Router {
                 name: 'ItemListScreen',
                 title: 'ItemListScreen',
                 handler: itemlistscreenPage,
+                prefetch: ['/itemdetailsscreen'],
                 params: {},
                 isMain: true
             },            {
-                path: '/itemdetailsscreen',
-                name: 'ItemDetailsScreen',
-                title: 'ItemDetailsScreen',
-                handler: itemdetailsscreenPage,
+                path: '/paymentscreen',
+                name: 'PaymentScreen',
+                title: 'PaymentScreen',
+                load: () => import('./pages/paymentscreen.js').then(m => m.paymentscreenPage),
+                style: 'css/pages/paymentscreen.css',
+                prefetch: [],
                 params: {},
                 isMain: false
             },            {
-                path: '/blankscreen',
-                name: 'BlankScreen',
-                title: 'BlankScreen',
-                handler: blankscreenPage,
+                path: '/ratingslistscreen',
+                name: 'RatingsListScreen',
+                title: 'RatingsListScreen',
+                load: () => import('./pages/ratingslistscreen.js').then(m => m.ratingslistscreenPage),
+                prefetch: [],
                 params: {},
                 isMain: false
-            }
-            /* === MANUAL FIX: Force LoginScreen route with correct handler === */
-            ,
-            {
-                path: '/loginscreen',
-                name: 'LoginScreen',
-                title: 'LoginScreen',
-                handler: loginscreenPage,
+            },            {
+                path: '/subcommunityselectorscreen',
+                name: 'SubcommunitySelectorScreen',
+                title: 'SubcommunitySelectorScreen',
+                load: () => import('./pages/subcommunityselectorscreen.js').then(m => m.subcommunityselectorscreenPage),
+                prefetch: [],
                 params: {},
                 isMain: false
+            }        ];
+    }
+
+    /**
+     * Page class of a route, importing its module (and stylesheet) on first use
+     */
+    resolveHandler(route) {
+        if (route.handler) return Promise.resolve(route.handler);
+        if (!this.handlers[route.path]) {
+            this.handlers[route.path] = Promise.all([route.load(), this.loadStyle(route.style)])
+                .then(([Page]) => Page)
+                .catch(error => {
+                    delete this.handlers[route.path];
+                    throw error;
+                });
+        }
+        return this.handlers[route.path];
+    }
+
+    /**
+     * Adds a page stylesheet once; resolves when it is applied or failed to load
+     */
+    loadStyle(href) {
+        if (!href) return Promise.resolve();
+        if (!this.styles[href]) {
+            this.styles[href] = new Promise(resolve => {
+                const link = document.createElement('link');
+                link.rel = 'stylesheet';
+                link.href = href;
+                link.onload = () => resolve();
+                link.onerror = () => {
+                    // the page still renders; the next visit tries again
+                    console.warn('Failed to load stylesheet:', href);
+                    link.remove();
+                    delete this.styles[href];
+                    resolve();
+                };
+                document.head.appendChild(link);
+            });
+        }
+        return this.styles[href];
+    }
+
+    /**
+     * Imports the pages reachable from a route when the browser is idle
+     */
+    prefetch(route) {
+        const idle = window.requestIdleCallback || (cb => setTimeout(cb, 200));
+        for (const path of route.prefetch) {
+            const target = this.routes.find(r => r.path === path);
+            if (target) {
+                idle(() => this.resolveHandler(target).catch(() => {}));
             }
-            /* ================================================================= */
-        ];
+        }
     }
 
     init() {
@@ -152,6 +201,7 @@ export class Router {
             const mainContent = document.getElementById('main-content');
             if (!mainContent) return;
 
+            this.leavePage();
             mainContent.innerHTML = `
                 <div class="loading">
                     <div class="spinner"></div>
@@ -159,12 +209,15 @@ export class Router {
                 </div>
             `;
 
-            const pageInstance = new route.handler(route.params);
+            const Page = await this.resolveHandler(route);
+            const pageInstance = new Page(route.params);
             const content = await pageInstance.render();
 
             mainContent.classList.add('page-exit');
 
             setTimeout(() => {
+                this.leavePage();
+                this.currentPage = pageInstance;
                 mainContent.innerHTML = content;
                 mainContent.classList.remove('page-exit');
                 mainContent.classList.add('page-enter');
@@ -177,6 +230,7 @@ export class Router {
             }, 150);
 
             this.currentRoute = route;
+            this.prefetch(route);
 
         } catch (error) {
             console.error('Error loading route:', error);
@@ -184,6 +238,16 @@ export class Router {
         }
     }
 
+    /**
+     * Tears down the page on screen (pending list loads...) before its markup is replaced
+     */
+    leavePage() {
+        if (this.currentPage) {
+            this.currentPage.destroy();
+            this.currentPage = null;
+        }
+    }
+
     navigate(path) {
         window.location.hash = path.toLowerCase();
     }
@@ -195,6 +259,7 @@ export class Router {
     show404() {
         const mainContent = document.getElementById('main-content');
         if (mainContent) {
+            this.leavePage();
             mainContent.innerHTML = `
                 <div class="empty-state">
                     <div class="empty-state-icon">🔍</div>
@@ -213,6 +278,7 @@ export class Router {
     showError(message) {
         const mainContent = document.getElementById('main-content');
         if (mainContent) {
+            this.leavePage();
             mainContent.innerHTML = `
                 <div class="error">
                     <h3>Error</h3>
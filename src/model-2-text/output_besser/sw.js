@@ -0,0 +1,145 @@
+/**
+ * Service Worker
+ * Offline shell and response caching for appName
+ *
+ * - The files of this build are precached on install and served from the
+ *   cache; CACHE_NAME changes with their content, and activation deletes the
+ *   caches of older builds.
+ * - Page loads get the cached index.html at once, refreshed in the background.
+ * - API GETs of the screens' DataSources are stale-while-revalidate: the
+ *   cached response answers immediately, and a network fetch updates it.
+ *   GETs that revalidate (If-None-Match, set by api.js once its TTL expires)
+ *   or opt out of the HTTP cache go to the network, and a POST / PUT /
+ *   DELETE drops the cached responses of its collection, so this cache never
+ *   answers with data api.js has already invalidated.
+ */
+
+const CACHE_NAME = 'appName-1bb770f3fb0d';
+const API_CACHE_NAME = 'app-name-api';
+const API_BASE_URL = 'http://localhost:3000/api';
+const WRITE_METHODS = ['POST', 'PUT', 'PATCH', 'DELETE'];
+const BYPASS_CACHE_MODES = ['no-cache', 'no-store', 'reload'];
+
+// Files written by the generator for this build
+const PRECACHE = [
+    './',
+    'css/components.css',
+    'css/pages/itemdetailsscreen.css',
+    'css/pages/paymentscreen.css',
+    'css/styles.css',
+    'index.html',
+    'js/api.js',
+    'js/app.js',
+    'js/components.js',
+    'js/pages/blankscreen.js',
+    'js/pages/itemdetailsscreen.js',
+    'js/pages/itemlistscreen.js',
+    'js/pages/paymentscreen.js',
+    'js/pages/ratingslistscreen.js',
+    'js/pages/subcommunityselectorscreen.js',
+    'js/router.js',
+];
+
+// API resources read by the DataSources of the generated screens
+const API_ROUTES = [
+    '/categories',
+    '/items',
+    '/ratings',
+];
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            .then(cache => cache.addAll(PRECACHE))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(keys
+                .filter(key => key !== CACHE_NAME && key !== API_CACHE_NAME)
+                .map(key => caches.delete(key))))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    const route = apiRoute(request.url);
+    if (route && WRITE_METHODS.includes(request.method)) {
+        event.respondWith(writeThrough(route, request));
+        return;
+    }
+    if (request.method !== 'GET') return;
+
+    if (route && bypassesCache(request)) {
+        event.respondWith(networkFirst(API_CACHE_NAME, request));
+    } else if (route) {
+        event.respondWith(staleWhileRevalidate(API_CACHE_NAME, request, event));
+    } else if (request.mode === 'navigate') {
+        event.respondWith(staleWhileRevalidate(CACHE_NAME, new Request('index.html'), event));
+    } else if (new URL(request.url).origin === self.location.origin) {
+        event.respondWith(
+            caches.match(request).then(cached => cached || fetch(request))
+        );
+    }
+});
+
+// API collection a URL belongs to, or null
+function apiRoute(url) {
+    if (!url.startsWith(API_BASE_URL)) return null;
+    const path = url.substring(API_BASE_URL.length).split('?')[0];
+    return API_ROUTES.find(route => path === route || path.startsWith(route + '/')) || null;
+}
+
+function bypassesCache(request) {
+    return request.headers.has('If-None-Match') || BYPASS_CACHE_MODES.includes(request.cache);
+}
+
+async function writeThrough(route, request) {
+    try {
+        return await fetch(request);
+    } finally {
+        const cache = await caches.open(API_CACHE_NAME);
+        const keys = await cache.keys();
+        await Promise.all(keys
+            .filter(key => apiRoute(key.url) === route)
+            .map(key => cache.delete(key)));
+    }
+}
+
+async function networkFirst(cacheName, request) {
+    const cache = await caches.open(cacheName);
+    try {
+        const response = await fetch(request);
+        if (response.ok) {
+            await cache.put(request, response.clone());
+        }
+        return response;
+    } catch (error) {
+        // offline: the cached response is better than none
+        const cached = await cache.match(request);
+        if (cached) return cached;
+        throw error;
+    }
+}
+
+async function staleWhileRevalidate(cacheName, request, event) {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(request);
+    const network = fetch(request)
+        .then(response => {
+            if (response.ok) {
+                cache.put(request, response.clone());
+            }
+            return response;
+        });
+
+    if (cached) {
+        event.waitUntil(network.catch(() => {}));
+        return cached;
+    }
+    return network;
+}
\ No newline at end of file
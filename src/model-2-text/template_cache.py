@@ -0,0 +1,180 @@
+"""
+template_cache.py
+
+Jinja2 environments for the Web UI generators (besser_web_ui_generator.py and
+the legacy web_ui_generator.py) that do not recompile the templates on every
+run.
+
+- Persistent bytecode cache: compiled templates are stored in
+  src/.pipeline_cache/jinja/<config>/ and reused while the template source
+  is unchanged (Jinja checks the source checksum of every bucket).
+- Ahead-of-time compile: `python template_cache.py` compiles every template
+  into src/.pipeline_cache/jinja/<config>/aot/, a folder of modules for
+  jinja2.ModuleLoader, plus a manifest of the template hashes it was built
+  from. The AOT modules are used only while that manifest still matches the
+  templates; otherwise the environment falls back to the source + bytecode
+  cache.
+
+<config> keys the templates folder, the Jinja version and the compile options
+(autoescape, block trimming), since they change the compiled code of the same
+source.
+
+    python template_cache.py            # AOT compile for both generators
+"""
+
+import compileall
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+
+from jinja2 import (ChoiceLoader, Environment, FileSystemBytecodeCache, FileSystemLoader,
+                    ModuleLoader, select_autoescape)
+import jinja2
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pipeline"))
+from build_cache import CACHE_ROOT
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+JINJA_CACHE_DIR = os.path.join(str(CACHE_ROOT), "jinja")
+AOT_MANIFEST = "templates.json"
+
+# Compile options of each generator (name -> autoescaped extensions)
+CONFIGS = {
+    "besser": (),
+    "legacy": ("html", "xml"),
+}
+
+
+class CountingBytecodeCache(FileSystemBytecodeCache):
+    """FileSystemBytecodeCache that counts cache hits and templates compiled from source"""
+
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.hits = 0
+        self.compiled = 0
+
+    def load_bytecode(self, bucket):
+        super().load_bytecode(bucket)
+        if bucket.code is not None:
+            self.hits += 1
+
+    def dump_bytecode(self, bucket):
+        self.compiled += 1
+        super().dump_bytecode(bucket)
+
+
+def _config_dir(templates_dir, autoescape):
+    key = "%s:%s:%s:trim" % (os.path.abspath(templates_dir), jinja2.__version__, ",".join(autoescape))
+    return os.path.join(JINJA_CACHE_DIR, hashlib.sha256(key.encode("utf-8")).hexdigest()[:16])
+
+
+def template_hashes(templates_dir=TEMPLATES_DIR):
+    hashes = {}
+    for name in sorted(os.listdir(templates_dir)):
+        path = os.path.join(templates_dir, name)
+        if name.endswith(".j2") and os.path.isfile(path):
+            with open(path, "rb") as f:
+                hashes[name] = hashlib.sha256(f.read()).hexdigest()
+    return hashes
+
+
+def template_mtimes(templates_dir=TEMPLATES_DIR):
+    """Cheap change check (stat only) for long-lived environments"""
+    return {name: os.stat(os.path.join(templates_dir, name)).st_mtime_ns
+            for name in sorted(os.listdir(templates_dir)) if name.endswith(".j2")}
+
+
+def _aot_valid(aot_dir, templates_dir):
+    try:
+        with open(os.path.join(aot_dir, AOT_MANIFEST), encoding="utf-8") as f:
+            return json.load(f) == template_hashes(templates_dir)
+    except (OSError, ValueError):
+        return False
+
+
+def make_environment(templates_dir=TEMPLATES_DIR, autoescape=(), register_filters=None, use_aot=True):
+    """
+    Environment with trim_blocks / lstrip_blocks, autoescape for the given
+    extensions, the persistent bytecode cache and, when up to date, the AOT
+    modules. env.template_source tells which one is used ("aot" / "bytecode").
+    register_filters(env) adds the custom filters (needed to compile).
+    """
+    cache_dir = _config_dir(templates_dir, autoescape)
+    os.makedirs(cache_dir, exist_ok=True)
+    aot_dir = os.path.join(cache_dir, "aot")
+
+    loader = FileSystemLoader(templates_dir)
+    source = "bytecode"
+    if use_aot and _aot_valid(aot_dir, templates_dir):
+        loader = ChoiceLoader([ModuleLoader(aot_dir), loader])
+        source = "aot"
+
+    env = Environment(
+        loader=loader,
+        autoescape=select_autoescape(list(autoescape)) if autoescape else False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=CountingBytecodeCache(cache_dir),
+    )
+    if register_filters is not None:
+        register_filters(env)
+    env.template_source = source
+    return env
+
+
+def load_templates(env, names):
+    """Loads (compiles if needed) the templates; returns the seconds it took"""
+    env.bytecode_cache.hits = env.bytecode_cache.compiled = 0
+    t0 = time.perf_counter()
+    for name in names:
+        env.get_template(name)
+    return time.perf_counter() - t0
+
+
+def describe_load(env, count, seconds):
+    """One timing line for the generator output"""
+    cache = env.bytecode_cache
+    if env.template_source == "aot":
+        how = "aot modules"
+    else:
+        how = "bytecode cache: %d hit(s), %d compiled" % (cache.hits, cache.compiled)
+    return "%d template(s) loaded in %.1f ms (%s)" % (count, seconds * 1000, how)
+
+
+def compile_aot(templates_dir=TEMPLATES_DIR, autoescape=(), register_filters=None):
+    """Compiles every template into <config>/aot/ for ModuleLoader; returns (folder, count, seconds)"""
+    env = make_environment(templates_dir, autoescape, register_filters, use_aot=False)
+    aot_dir = os.path.join(_config_dir(templates_dir, autoescape), "aot")
+    hashes = template_hashes(templates_dir)
+
+    t0 = time.perf_counter()
+    tmp = "%s.%d.tmp" % (aot_dir, os.getpid())
+    os.makedirs(tmp, exist_ok=True)
+    env.compile_templates(tmp, zip=None, ignore_errors=False, filter_func=lambda name: name in hashes)
+    # ship the .pyc too: loading is then an unmarshal, even with PYTHONDONTWRITEBYTECODE
+    compileall.compile_dir(tmp, quiet=1)
+    with open(os.path.join(tmp, AOT_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(hashes, f, indent=1)
+    if os.path.isdir(aot_dir):
+        old = "%s.%d.old" % (aot_dir, os.getpid())
+        os.replace(aot_dir, old)
+        os.replace(tmp, aot_dir)
+        shutil.rmtree(old)
+    else:
+        os.replace(tmp, aot_dir)
+    return aot_dir, len(hashes), time.perf_counter() - t0
+
+
+def main():
+    # both generators share the filter names; only their existence matters to compile
+    from besser_web_ui_generator import _register_filters
+    for name, autoescape in sorted(CONFIGS.items()):
+        aot_dir, count, seconds = compile_aot(autoescape=autoescape, register_filters=_register_filters)
+        print("%-7s %d templates compiled in %.1f ms -> %s" % (name, count, seconds * 1000, aot_dir))
+
+
+if __name__ == "__main__":
+    main()
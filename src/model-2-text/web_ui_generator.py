@@ -4,7 +4,8 @@ Generates HTML+CSS+Vanilla JS from GUI models using Jinja2 templates
 """
 
 import os
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from template_cache import make_environment
 
 # BESSER-inspired base class (no external dependency needed)
 class CodeGenerator:
@@ -42,14 +43,9 @@ class WebUIGenerator(CodeGenerator):
         self.model_path = model_path
         self.gui_app = None
         
-        # Setup Jinja2 environment
+        # Setup Jinja2 environment (AOT modules / bytecode cache, see template_cache.py)
         template_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(['html', 'xml']),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        self.jinja_env = make_environment(template_dir, autoescape=('html', 'xml'))
         
         # Add custom Jinja2 filters
         self._register_filters()
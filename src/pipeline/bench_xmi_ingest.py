@@ -0,0 +1,122 @@
+"""
+bench_xmi_ingest.py
+
+Latency / peak-memory benchmark of AppConfig XMI ingestion:
+
+  legacy    lxml parse -> etree.tostring -> BytesIO -> pyecore parse (old get_clean_bytes)
+  streaming _CommentFilter -> pyecore parse (dsml_loader)
+
+Synthetic XMI files of growing size are generated from test_custom.xmi by
+padding it with comment blocks and long attribute values (the shape of our
+documented, richer DSML instances). Every measurement runs in a fresh
+process so the peak RSS is that of the load alone.
+
+    python bench_xmi_ingest.py                 # 1, 4, 16 MB
+    python bench_xmi_ingest.py --sizes 2 8 32 --repeat 5
+"""
+
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent / "model-2-model-strutural-transformation-for-backend"
+ECORE = BACKEND / "dsml_metamodel.ecore"
+SAMPLE = BACKEND / "test_custom.xmi"
+
+
+def make_xmi(path: Path, size_mb: float):
+    """Sample AppConfig padded with comments (~80%) and a long logoUrl (~20%) up to size_mb."""
+    sample = SAMPLE.read_text(encoding="utf-8")
+    target = int(size_mb * 1024 * 1024)
+    comment = "<!-- " + ("feature documentation " * 40) + "-->\n"
+    n_comments = max(1, int(target * 0.8) // len(comment))
+    logo = "data:image/png;base64," + "A" * max(0, int(target * 0.2))
+
+    head, sep, rest = sample.partition("<accounts")
+    head = head.replace('logoUrl="logoUrl"', f'logoUrl="{logo}"')
+    body = "  " + comment * (n_comments // 2) + "  " + sep + rest
+    body = body.replace("</custom:AppConfig>", comment * (n_comments - n_comments // 2) + "</custom:AppConfig>")
+    path.write_text(head + body, encoding="utf-8")
+
+
+def _legacy_stream(path: str):
+    from lxml import etree
+    parser = etree.XMLParser(remove_comments=True, recover=True)
+    return io.BytesIO(etree.tostring(etree.parse(path, parser)))
+
+
+def _peak_kb() -> int:
+    # ru_maxrss survives execve on Linux (it would include the parent's peak);
+    # VmHWM belongs to this process image only.
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure(mode: str, xmi: str):
+    """Runs in the child process: one load, prints {seconds, peak_kb}."""
+    import dsml_loader
+    from pyecore.resources import ResourceSet
+
+    mm_root = dsml_loader.load_metamodel(str(ECORE))
+    base_kb = _peak_kb()
+
+    t0 = time.perf_counter()
+    rset = ResourceSet()
+    rset.metamodel_registry[mm_root.nsURI] = mm_root
+    stream = _legacy_stream(xmi) if mode == "legacy" else dsml_loader._clean_stream(xmi)
+    res = rset.create_resource(dsml_loader._StreamURI(xmi, stream))
+    res.load()
+    dsml_loader.compile_appconfig(res.contents[0])
+    dt = time.perf_counter() - t0
+
+    peak_kb = _peak_kb()
+    print(json.dumps({"seconds": dt, "peak_kb": peak_kb - base_kb}))
+
+
+def _run(mode: str, xmi: Path):
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(xmi)],
+        cwd=str(Path(__file__).resolve().parent), capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=float, nargs="+", default=[1, 4, 16], help="XMI sizes in MB")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        _measure(*args.child)
+        return
+
+    print(f"{'size':>8} {'mode':>10} {'best ms':>9} {'peak +MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            xmi = Path(tmp) / f"appconfig_{size}mb.xmi"
+            make_xmi(xmi, size)
+            real = os.path.getsize(xmi) / (1024 * 1024)
+            for mode in ("legacy", "streaming"):
+                runs = [_run(mode, xmi) for _ in range(args.repeat)]
+                best = min(r["seconds"] for r in runs) * 1000
+                peak = max(r["peak_kb"] for r in runs) / 1024
+                print(f"{real:7.1f}M {mode:>10} {best:9.1f} {peak:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+build_cache.py
+
+Content-addressed incremental build cache for the MDE pipeline.
+
+Every stage declares the files it reads (inputs) and the files or folders it
+writes (outputs). A stage key is the SHA-256 of:
+  - the stage name and command,
+  - the content digest of every input,
+  - the output digest of every upstream stage.
+
+A stage is skipped when its key matches the last successful run AND its
+outputs still hash to what that run produced (so a deleted or hand-edited
+output triggers a rebuild).
+
+File digests are memoised by (size, mtime_ns) in the cache state, so a no-op
+rebuild only stats files instead of re-reading them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+CACHE_ROOT = Path(__file__).resolve().parent.parent / ".pipeline_cache"
+STATE_FILE = "build_state.json"
+STATE_VERSION = 1
+
+# Folders never taken into account when hashing a directory tree
+IGNORED_DIRS = {"__pycache__", ".pipeline_cache", ".git"}
+
+
+# ------------------------------------------------------------
+# Stage description
+# ------------------------------------------------------------
+@dataclass
+class Stage:
+    name: str
+    cwd: Path
+    command: List[str]
+    inputs: List[str]
+    outputs: List[str]
+    upstream: List[str] = field(default_factory=list)
+
+    def resolve(self, rel: str) -> Path:
+        p = Path(rel)
+        return p if p.is_absolute() else (self.cwd / p)
+
+
+# ------------------------------------------------------------
+# Hashing
+# ------------------------------------------------------------
+class FileHasher:
+    """SHA-256 of files and folders, memoised by (size, mtime_ns)."""
+
+    def __init__(self, memo: Optional[Dict[str, list]] = None):
+        self.memo: Dict[str, list] = memo or {}
+
+    def file_digest(self, path: Path) -> str:
+        st = path.stat()
+        key = str(path)
+        cached = self.memo.get(key)
+        if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        self.memo[key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def path_digest(self, path: Path) -> Optional[str]:
+        """Digest of a file or a whole folder tree; None when missing."""
+        if path.is_file():
+            return self.file_digest(path)
+        if not path.is_dir():
+            return None
+
+        h = hashlib.sha256()
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d not in IGNORED_DIRS)
+            for name in sorted(files):
+                fp = Path(root) / name
+                rel = fp.relative_to(path).as_posix()
+                h.update(rel.encode("utf-8"))
+                h.update(b"\0")
+                h.update(self.file_digest(fp).encode("ascii"))
+                h.update(b"\n")
+        return h.hexdigest()
+
+    def digest_many(self, paths: Iterable[Path]) -> Dict[str, Optional[str]]:
+        return {str(p): self.path_digest(p) for p in paths}
+
+
+def _combine(parts: Sequence[str]) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+# ------------------------------------------------------------
+# Persistent stage state
+# ------------------------------------------------------------
+class StageCache:
+    """Keeps, per stage, the key of the last successful run and its output digest."""
+
+    def __init__(self, root: Path = CACHE_ROOT):
+        self.root = Path(root)
+        self.state_path = self.root / STATE_FILE
+        self.stages: Dict[str, dict] = {}
+        memo: Dict[str, list] = {}
+
+        if self.state_path.exists():
+            try:
+                data = json.loads(self.state_path.read_text(encoding="utf-8"))
+                if data.get("version") == STATE_VERSION:
+                    self.stages = data.get("stages", {})
+                    memo = data.get("files", {})
+            except (OSError, ValueError):
+                pass
+
+        self.hasher = FileHasher(memo)
+
+    def stage_key(self, stage: Stage, upstream_outputs: Dict[str, str]) -> str:
+        parts = [stage.name, "\0".join(stage.command)]
+        for rel in sorted(stage.inputs):
+            digest = self.hasher.path_digest(stage.resolve(rel))
+            parts.append(f"in:{rel}:{digest}")
+        for up in sorted(stage.upstream):
+            parts.append(f"up:{up}:{upstream_outputs.get(up)}")
+        return _combine(parts)
+
+    def output_digest(self, stage: Stage) -> Optional[str]:
+        parts = []
+        for rel in sorted(stage.outputs):
+            digest = self.hasher.path_digest(stage.resolve(rel))
+            if digest is None:
+                return None
+            parts.append(f"out:{rel}:{digest}")
+        return _combine(parts)
+
+    def is_fresh(self, stage: Stage, key: str) -> Optional[str]:
+        """Returns the output digest if the stage can be skipped, else None."""
+        prev = self.stages.get(stage.name)
+        if not prev or prev.get("key") != key:
+            return None
+        current = self.output_digest(stage)
+        if current is None or current != prev.get("outputs"):
+            return None
+        return current
+
+    def record(self, stage: Stage, key: str, outputs: str):
+        self.stages[stage.name] = {"key": key, "outputs": outputs}
+
+    def forget(self, stage_name: str):
+        self.stages.pop(stage_name, None)
+
+    def save(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Drop memo entries of files that no longer exist
+        files = {k: v for k, v in self.hasher.memo.items() if os.path.exists(k)}
+        payload = {"version": STATE_VERSION, "stages": self.stages, "files": files}
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.state_path)
@@ -0,0 +1,73 @@
+"""
+dsml_features.py
+
+Feature-vector view of an AppConfig.
+
+The structural and GUI transformers only take pruning decisions from a small
+set of boolean flags. Everything else in the AppConfig (appName, shortName,
+logoUrl, colours) is cosmetic: it ends up in the generated artefacts but
+never changes which classes, screens or elements survive.
+
+feature_mask() packs the decision flags into an int, so tenants with the same
+mask can be generated once and the cosmetic values applied afterwards as an
+overlay (cosmetic_overlay()).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+
+# Every flag read by run_m2m or generate_gui_from_dsml_pruning_only_export_py.
+# Order is part of the mask format: only append.
+FEATURE_FLAGS: Tuple[str, ...] = (
+    "messaging.chat",
+    "subcommunities.enabled",
+    "accounts.moderators",
+    "listings.priceMode",
+    "payments.mbway",
+    "payments.multibanco",
+    "payments.paypal",
+    "ratings.simple",
+    "ratings.bidirectional",
+    "accessPolicies.anonymousBrowse",
+    "accounts.localLogin",
+    "accounts.oauthLogin",
+    "accounts.phoneVerification",
+)
+
+# Values that never affect pruning, re-applied per tenant after generation
+COSMETIC_FIELDS: Tuple[str, ...] = ("appName", "shortName", "logoUrl", "primaryColor", "secondaryColor")
+
+
+def _flag(dsml, path: str) -> bool:
+    obj = dsml
+    for part in path.split("."):
+        obj = getattr(obj, part, None)
+        if obj is None:
+            return False
+    return bool(obj)
+
+
+def feature_mask(dsml) -> int:
+    """Bit i is set when FEATURE_FLAGS[i] is true in the AppConfig."""
+    mask = 0
+    for bit, path in enumerate(FEATURE_FLAGS):
+        if _flag(dsml, path):
+            mask |= 1 << bit
+    return mask
+
+
+def describe_mask(mask: int) -> Dict[str, bool]:
+    return {path: bool(mask >> bit & 1) for bit, path in enumerate(FEATURE_FLAGS)}
+
+
+def cosmetic_overlay(dsml) -> Dict[str, Any]:
+    return {name: getattr(dsml, name, None) for name in COSMETIC_FIELDS}
+
+
+def group_by_features(configs: Iterable[Tuple[Hashable, Any]]) -> Dict[int, List[Hashable]]:
+    """Groups (key, dsml) pairs by feature mask, keeping input order inside each group."""
+    groups: Dict[int, List[Hashable]] = {}
+    for key, dsml in configs:
+        groups.setdefault(feature_mask(dsml), []).append(key)
+    return groups
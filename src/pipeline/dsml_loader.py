@@ -0,0 +1,326 @@
+"""
+dsml_loader.py
+
+Shared DSML (AppConfig) loader used by every stage of the pipeline.
+
+The AppConfig XMI is parsed with pyecore against dsml_metamodel.ecore and
+compiled into a plain, read-only snapshot (DSMLNode). Attribute access works
+exactly like on the pyecore object:
+
+    dsml = load_dsml_appconfig("test_custom.xmi", "dsml_metamodel.ecore")
+    dsml.messaging.chat, dsml.subcommunities.enabled, dsml.appName, ...
+
+Snapshots are cached:
+  - in memory, for the life of the process,
+  - on disk (src/.pipeline_cache/dsml/), keyed by the SHA-256 of the ecore and
+    of the XMI, so later stages and later runs skip pyecore entirely.
+
+The parsed metamodel (EPackage) is also kept per ecore digest, so loading many
+XMI files against the same ecore parses it only once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from build_cache import CACHE_ROOT, FileHasher
+
+# Optional DSML XMI loader (pyecore)
+try:
+    from pyecore.resources import ResourceSet, URI
+    from pyecore.ecore import EEnumLiteral, EObject, EReference
+except Exception:
+    ResourceSet = None
+    URI = object
+
+SNAPSHOT_VERSION = 1
+DSML_CACHE_DIR = CACHE_ROOT / "dsml"
+
+_hasher = FileHasher()
+_snapshots: Dict[Tuple[str, str], "DSMLNode"] = {}
+_metamodels: Dict[str, Any] = {}
+
+
+# ------------------------------------------------------------
+# Frozen snapshot
+# ------------------------------------------------------------
+class DSMLNode:
+    """Read-only view of one DSML EObject (AppConfig, Accounts, Listings, ...)."""
+
+    __slots__ = ("_eclass", "_values")
+
+    def __init__(self, eclass: str, values: Dict[str, Any]):
+        object.__setattr__(self, "_eclass", eclass)
+        object.__setattr__(self, "_values", dict(values))
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(f"{self._eclass} has no feature {name!r}") from None
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"DSML snapshot {self._eclass} is read-only")
+
+    def __reduce__(self):
+        return (DSMLNode, (self._eclass, self._values))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, DSMLNode) and self._eclass == other._eclass and self._values == other._values
+
+    def __hash__(self) -> int:
+        return hash((self._eclass, tuple(sorted(self._values.items(), key=lambda kv: kv[0]))))
+
+    def __repr__(self) -> str:
+        inner = ", ".join(f"{k}={v!r}" for k, v in self._values.items())
+        return f"{self._eclass}({inner})"
+
+    @property
+    def eclass_name(self) -> str:
+        return self._eclass
+
+    def features(self) -> Tuple[str, ...]:
+        return tuple(self._values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"__eclass__": self._eclass}
+        for k, v in self._values.items():
+            if isinstance(v, DSMLNode):
+                out[k] = v.to_dict()
+            elif isinstance(v, tuple):
+                out[k] = [x.to_dict() if isinstance(x, DSMLNode) else x for x in v]
+            else:
+                out[k] = v
+        return out
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DSMLNode":
+        values: Dict[str, Any] = {}
+        for k, v in data.items():
+            if k == "__eclass__":
+                continue
+            if isinstance(v, dict):
+                values[k] = cls.from_dict(v)
+            elif isinstance(v, list):
+                values[k] = tuple(cls.from_dict(x) if isinstance(x, dict) else x for x in v)
+            else:
+                values[k] = v
+        return cls(data["__eclass__"], values)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, EEnumLiteral):
+        return value.name
+    if isinstance(value, EObject):
+        return compile_appconfig(value)
+    return value
+
+
+def compile_appconfig(eobj) -> DSMLNode:
+    """Compiles a pyecore EObject (and its containment tree) into a DSMLNode."""
+    values: Dict[str, Any] = {}
+    for feat in eobj.eClass.eAllStructuralFeatures():
+        if isinstance(feat, EReference) and not feat.containment:
+            continue
+        raw = eobj.eGet(feat)
+        if feat.many:
+            values[feat.name] = tuple(_plain(x) for x in raw)
+        else:
+            values[feat.name] = None if raw is None else _plain(raw)
+    return DSMLNode(eobj.eClass.name, values)
+
+
+# ------------------------------------------------------------
+# pyecore parsing
+# ------------------------------------------------------------
+class _StreamURI(URI):
+    """URI whose input stream is an in-memory buffer instead of the file."""
+
+    def __init__(self, uri: str, stream):
+        super().__init__(uri)
+        self._stream = stream
+
+    def create_instream(self):
+        return self._stream
+
+    def close_stream(self):
+        self._stream.close()
+
+
+class _CommentFilter(io.RawIOBase):
+    """
+    Read-only byte stream that drops XML comments while reading (pyecore decodes
+    every child node as an EObject, comments included).
+
+    The file is consumed in chunks and handed straight to the single lxml parse
+    done by pyecore, so the document is never materialised as a tree or a byte
+    string just to remove comments. CDATA sections are passed through untouched.
+    """
+
+    CHUNK = 64 * 1024
+    # longest marker minus one: a marker split across two chunks is kept for the next round
+    _KEEP = len(b"<![CDATA[") - 1
+
+    def __init__(self, raw):
+        super().__init__()
+        self._raw = raw
+        self._state = "text"   # text | comment | cdata
+        self._carry = b""
+        self._out = bytearray()
+        self._pos = 0          # read offset into _out
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def close(self):
+        try:
+            self._raw.close()
+        finally:
+            super().close()
+
+    def _feed(self, chunk: bytes, final: bool):
+        data = self._carry + chunk
+        out = self._out
+        pos = 0
+        n = len(data)
+        while True:
+            if self._state == "text":
+                m = data.find(b"<!", pos)
+                while m >= 0 and not (data.startswith(b"<!--", m) or data.startswith(b"<![CDATA[", m)) \
+                        and (final or m + self._KEEP < n):
+                    m = data.find(b"<!", m + 2)   # <!DOCTYPE ...
+                if m < 0 or (not final and m + self._KEEP >= n):
+                    stop = n if final else max(pos, min(n - self._KEEP, m if m >= 0 else n))
+                    out += data[pos:stop]
+                    pos = stop
+                    break
+                if data.startswith(b"<!--", m):
+                    out += data[pos:m]
+                    pos = m + 4
+                    self._state = "comment"
+                else:
+                    out += data[pos:m + 9]
+                    pos = m + 9
+                    self._state = "cdata"
+            elif self._state == "comment":
+                e = data.find(b"-->", pos)
+                if e < 0:
+                    pos = n if final else max(pos, n - 2)
+                    break
+                pos = e + 3
+                self._state = "text"
+            else:
+                e = data.find(b"]]>", pos)
+                if e < 0:
+                    stop = n if final else max(pos, n - 2)
+                    out += data[pos:stop]
+                    pos = stop
+                    break
+                out += data[pos:e + 3]
+                pos = e + 3
+                self._state = "text"
+        self._carry = data[pos:]
+
+    def readinto(self, buf) -> int:
+        while self._pos >= len(self._out) and not self._eof:
+            del self._out[:]
+            self._pos = 0
+            chunk = self._raw.read(self.CHUNK)
+            self._eof = not chunk
+            self._feed(chunk, final=self._eof)
+        size = min(len(buf), len(self._out) - self._pos)
+        buf[:size] = self._out[self._pos:self._pos + size]
+        self._pos += size
+        return size
+
+
+def _clean_stream(path: str):
+    """Comment-free stream over the file, filtered while pyecore/lxml reads it."""
+    return _CommentFilter(open(path, "rb"))
+
+
+def _load_resource(rset, path: str):
+    res = rset.create_resource(_StreamURI(path, _clean_stream(path)))
+    res.load()
+    return res
+
+
+def load_metamodel(ecore_path: str, ecore_digest: str = ""):
+    """Parses the DSML ecore once per process (per content digest) and returns its EPackage."""
+    if ResourceSet is None:
+        raise RuntimeError("pyecore is required to load DSML XMI. Install pyecore.")
+    ecore_digest = ecore_digest or _hasher.file_digest(Path(ecore_path).resolve())
+    mm_root = _metamodels.get(ecore_digest)
+    if mm_root is None:
+        mm_root = _load_resource(ResourceSet(), ecore_path).contents[0]
+        _metamodels[ecore_digest] = mm_root
+    return mm_root
+
+
+def parse_dsml_appconfig(xmi_path: str, ecore_path: str, ecore_digest: str = ""):
+    """Parses the XMI with pyecore and returns the live AppConfig EObject."""
+    mm_root = load_metamodel(ecore_path, ecore_digest)
+
+    rset = ResourceSet()
+    rset.metamodel_registry[mm_root.nsURI] = mm_root
+    return _load_resource(rset, xmi_path).contents[0]
+
+
+# ------------------------------------------------------------
+# On-disk snapshot cache
+# ------------------------------------------------------------
+def _snapshot_path(cache_dir: Path, ecore_digest: str, xmi_digest: str) -> Path:
+    key = hashlib.sha256(f"{SNAPSHOT_VERSION}:{ecore_digest}:{xmi_digest}".encode("ascii")).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _read_snapshot(path: Path):
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != SNAPSHOT_VERSION:
+        return None
+    return DSMLNode.from_dict(data["root"])
+
+
+def _write_snapshot(path: Path, node: DSMLNode, xmi_path: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": SNAPSHOT_VERSION, "source": str(Path(xmi_path).resolve()), "root": node.to_dict()}
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_dsml_appconfig(xmi_path: str, ecore_path: str = "dsml_metamodel.ecore",
+                        use_cache: bool = True, cache_dir: Path = DSML_CACHE_DIR) -> DSMLNode:
+    """
+    Loads an AppConfig XMI as a frozen DSMLNode snapshot.
+
+    Lookup order: in-process memo -> on-disk snapshot -> pyecore parse.
+    """
+    ecore_digest = _hasher.file_digest(Path(ecore_path).resolve())
+    xmi_digest = _hasher.file_digest(Path(xmi_path).resolve())
+    key = (ecore_digest, xmi_digest)
+
+    if use_cache:
+        node = _snapshots.get(key)
+        if node is not None:
+            return node
+        snap = _snapshot_path(Path(cache_dir), ecore_digest, xmi_digest)
+        node = _read_snapshot(snap)
+        if node is not None:
+            _snapshots[key] = node
+            return node
+
+    node = compile_appconfig(parse_dsml_appconfig(xmi_path, ecore_path, ecore_digest))
+    if use_cache:
+        _snapshots[key] = node
+        _write_snapshot(_snapshot_path(Path(cache_dir), ecore_digest, xmi_digest), node, xmi_path)
+    return node
@@ -0,0 +1,112 @@
+"""
+generator_client.py
+
+Thin client of generator_daemon.py (standard library only, so it starts in a
+few ms). Relative paths are resolved against the current folder before being
+sent; omitted paths default to the matching run_pipeline stage.
+
+    python generator_client.py gui-m2m --xmi tenants/acme.xmi --out /tmp/acme_gui.py
+    python generator_client.py structural-m2m --xmi tenants/acme.xmi
+    python generator_client.py web-ui --model /tmp/acme_gui.py --out /tmp/acme_site
+    python generator_client.py status
+    python generator_client.py shutdown
+
+Prints the job latency (warm or cold), the cold figures of the daemon (first
+run of the job, start-up cost) and the client round trip.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+RESTART_WAIT_S = 60
+
+
+def request(host: str, port: int, path: str, body: Optional[Dict[str, Any]] = None,
+            timeout: float = 600) -> Tuple[int, Dict[str, Any]]:
+    url = f"http://{f'[{host}]' if ':' in host else host}:{port}{path}"
+    data = None if body is None else json.dumps(body).encode("utf-8")
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b"{}")
+
+
+def _wait_ready(host: str, port: int):
+    deadline = time.monotonic() + RESTART_WAIT_S
+    while time.monotonic() < deadline:
+        try:
+            request(host, port, "/status", timeout=5)
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit(f"generator daemon on {host}:{port} did not come back")
+
+
+def run_job(host: str, port: int, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    code, result = request(host, port, "/run", body)
+    if code == 503 and result.get("restarting"):
+        _wait_ready(host, port)
+        code, result = request(host, port, "/run", body)
+    return code, result
+
+
+def _abs(path: Optional[str]) -> Optional[str]:
+    return os.path.abspath(path) if path else None
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("job", choices=("structural-m2m", "gui-m2m", "web-ui", "status", "shutdown"))
+    ap.add_argument("--xmi", help="AppConfig XMI (structural-m2m, gui-m2m)")
+    ap.add_argument("--ecore", help="DSML metamodel (structural-m2m, gui-m2m)")
+    ap.add_argument("--model", help="generated_gui_model.py to render (web-ui)")
+    ap.add_argument("--out", help="output file (M2M) or folder (web-ui)")
+    ap.add_argument("--export-mode", choices=("direct", "portable"), help="gui-m2m export mode")
+    ap.add_argument("--host", default=DEFAULT_HOST)
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("-v", "--verbose", action="store_true", help="print the job's own output")
+    args = ap.parse_args()
+
+    try:
+        if args.job == "status":
+            print(json.dumps(request(args.host, args.port, "/status")[1], indent=1))
+            return
+        if args.job == "shutdown":
+            request(args.host, args.port, "/shutdown", {})
+            return
+
+        body = {"job": args.job, "xmi": _abs(args.xmi), "ecore": _abs(args.ecore), "model": _abs(args.model),
+                "out": _abs(args.out), "export_mode": args.export_mode}
+        t0 = time.perf_counter()
+        code, result = run_job(args.host, args.port, {k: v for k, v in body.items() if v is not None})
+        rtt = (time.perf_counter() - t0) * 1000
+    except OSError as e:
+        raise SystemExit(f"generator daemon not reachable on {args.host}:{args.port} ({e}); "
+                         f"start it with: python generator_daemon.py")
+
+    if args.verbose or not result.get("ok"):
+        sys.stdout.write(result.get("log", ""))
+    if not result.get("ok"):
+        raise SystemExit(f"{args.job} failed: {result.get('error')}")
+
+    for path in result["written"]:
+        print(f"wrote {path}")
+    cold = f"cold: first run {result['first_ms']:.0f} ms + start-up {result['startup_ms']:.0f} ms"
+    print(f"{args.job}: {result['ms']:.0f} ms ({'warm' if result['warm'] else 'cold'}; {cold}), "
+          f"round trip {rtt:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
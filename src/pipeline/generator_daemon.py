@@ -0,0 +1,303 @@
+"""
+generator_daemon.py
+
+Long-running generator process for interactive use (config preview): BESSER,
+pyecore, lxml and Jinja2 are imported once, and the DSML ecore, the baseline
+GUI (bound to the structural model), the domain model index and the Jinja
+templates are loaded at start-up and kept warm between requests.
+
+It serves JSON over HTTP on a loopback port (127.0.0.1 or ::1):
+
+  POST /run        {"job": "structural-m2m", "xmi": ..., ["ecore", "out"]}
+                   {"job": "gui-m2m", "xmi": ..., ["ecore", "out", "export_mode"]}
+                   {"job": "web-ui", ["model", "out"]}
+  GET  /status     pid, start-up cost, per-job latencies
+  POST /shutdown
+
+Every /run answer carries the job latency, whether it was warm, and the cold
+figures to compare with: the first run of that job in this process and the
+start-up (import + preload) cost a fresh `python script.py` would pay.
+Missing paths default to the inputs/outputs of the matching run_pipeline
+stage. Requests are handled one at a time.
+
+When a .py file of the stage folders changes (transformers, web UI
+generator, structural module...), the daemon answers 503 and re-executes
+itself, so it never serves stale code; generator_client.py retries.
+
+    python generator_daemon.py                  # 127.0.0.1:8765
+    python generator_daemon.py --port 9000
+
+Requests are not authenticated and /run writes wherever "out" points, so
+the daemon refuses a non-loopback --host unless --allow-remote is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import ipaddress
+import json
+import os
+import socket
+import sys
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+SRC = Path(__file__).resolve().parent.parent
+PIPELINE = SRC / "pipeline"
+BACKEND = SRC / "model-2-model-strutural-transformation-for-backend"
+FRONTEND = SRC / "model-2-model-gui-transformation-for-frontend"
+M2T = SRC / "model-2-text"
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+LOCAL_HOSTNAMES = ("localhost",)
+
+# Folders whose .py files are watched for changes (not recursive: generated
+# outputs live in sub-folders)
+WATCHED_DIRS = (PIPELINE, BACKEND, BACKEND / "buml", FRONTEND, M2T)
+
+
+def _source_mtimes() -> Dict[str, int]:
+    mtimes = {}
+    for folder in WATCHED_DIRS:
+        for p in folder.glob("*.py"):
+            if p.name in ("generated_gui_model.py", "custom_buml_model.py"):
+                continue   # written by the jobs themselves
+            try:
+                mtimes[str(p)] = p.stat().st_mtime_ns
+            except OSError:
+                pass
+    return mtimes
+
+
+# ------------------------------------------------------------
+# Warm state
+# ------------------------------------------------------------
+class GeneratorState:
+    """Imports the stage modules once and preloads what every request reuses."""
+
+    def __init__(self):
+        t0 = time.perf_counter()
+        for folder in (BACKEND, FRONTEND, M2T):
+            if str(folder) not in sys.path:
+                sys.path.append(str(folder))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            import m2m_strutural_transformer as structural
+            import m2m_dsml_to_gui_pruning_only_with_py_export as gui_m2m
+            import generate_app
+            import besser_web_ui_generator
+            from dsml_loader import load_metamodel
+
+            self.structural = structural
+            self.gui_m2m = gui_m2m
+            self.generate_app = generate_app
+            self.web_ui = besser_web_ui_generator
+            self.import_ms = (time.perf_counter() - t0) * 1000
+
+            t1 = time.perf_counter()
+            load_metamodel(str(BACKEND / "dsml_metamodel.ecore"))
+            load_metamodel(str(FRONTEND / "dsml_metamodel.ecore"))
+            structural.get_domain_index()
+            baseline = gui_m2m._import_baseline_gui_model(str(FRONTEND / "gui_community_platform.py"))
+            gui_m2m._bound_baseline(baseline, "structural_community_platform")
+            env = besser_web_ui_generator._environment(str(M2T / "templates"))
+            for name in env.list_templates():
+                env.get_template(name)
+            self.preload_ms = (time.perf_counter() - t1) * 1000
+
+        self.started = time.time()
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self.jobs: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+            "structural-m2m": self._structural_m2m,
+            "gui-m2m": self._gui_m2m,
+            "web-ui": self._web_ui,
+        }
+
+    # --------------------------------------------------------
+    # jobs: each returns the paths it wrote
+    # --------------------------------------------------------
+    def _structural_m2m(self, req: Dict[str, Any]) -> List[str]:
+        xmi = req.get("xmi") or str(BACKEND / "test_custom.xmi")
+        out = req.get("out") or str(BACKEND / "buml" / "custom_buml_model.py")
+        before = _mtime(out)
+        self.structural.run_m2m(xmi, req.get("ecore") or str(BACKEND / "dsml_metamodel.ecore"), out)
+        if _mtime(out) == before:
+            raise RuntimeError(f"structural M2M did not write {out}")
+        return [out]
+
+    def _gui_m2m(self, req: Dict[str, Any]) -> List[str]:
+        out = req.get("out") or str(FRONTEND / "generated_gui_model.py")
+        self.gui_m2m.generate_gui_from_dsml_pruning_only_export_py(
+            baseline_gui_py_path=str(FRONTEND / "gui_community_platform.py"),
+            dsml_xmi_path=req.get("xmi") or str(FRONTEND / "test_custom.xmi"),
+            dsml_ecore_path=req.get("ecore") or str(FRONTEND / "dsml_metamodel.ecore"),
+            structural_module="structural_community_platform",
+            output_py_path=out,
+            export_mode=req.get("export_mode") or "direct",
+        )
+        return [out]
+
+    def _web_ui(self, req: Dict[str, Any]) -> List[str]:
+        model_py = req.get("model") or str(FRONTEND / "generated_gui_model.py")
+        out = req.get("out") or str(M2T / "output_besser")
+        gui_model = self.generate_app.prepare_model(self.generate_app.load_model(model_py))
+        self.web_ui.WebUIGenerator(model=gui_model, output_dir=out).generate()
+        return [out]
+
+    # --------------------------------------------------------
+    def run(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        job = req.get("job")
+        fn = self.jobs.get(job)
+        if fn is None:
+            return {"ok": False, "error": f"Unknown job {job!r}. Known: {', '.join(sorted(self.jobs))}"}
+
+        stats = self.stats.setdefault(job, {"runs": 0, "first_ms": None, "last_ms": None, "best_warm_ms": None})
+        log = io.StringIO()
+        t0 = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(log):
+                written = fn(req)
+            ok, error = True, None
+        except Exception as e:
+            written, ok, error = [], False, f"{type(e).__name__}: {e}"
+            log.write(traceback.format_exc())
+        ms = (time.perf_counter() - t0) * 1000
+
+        warm = stats["runs"] > 0
+        stats["runs"] += 1
+        stats["last_ms"] = ms
+        if warm:
+            stats["best_warm_ms"] = min(ms, stats["best_warm_ms"] or ms)
+        else:
+            stats["first_ms"] = ms
+        return {
+            "ok": ok, "job": job, "error": error, "written": written, "log": log.getvalue(),
+            "ms": ms, "warm": warm, "first_ms": stats["first_ms"],
+            "startup_ms": self.import_ms + self.preload_ms,
+        }
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(), "uptime_s": time.time() - self.started,
+            "import_ms": self.import_ms, "preload_ms": self.preload_ms, "jobs": self.stats,
+        }
+
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# ------------------------------------------------------------
+# HTTP front-end
+# ------------------------------------------------------------
+class _Handler(BaseHTTPRequestHandler):
+    server: "GeneratorServer"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _reply(self, code: int, body: Dict[str, Any]):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stale(self) -> bool:
+        if _source_mtimes() == self.server.mtimes:
+            return False
+        self._reply(503, {"ok": False, "restarting": True, "error": "generator sources changed, restarting"})
+        self.server.restart = True
+        return True
+
+    def do_GET(self):
+        if self.path == "/status":
+            self._reply(200, dict(self.server.state.status(), ok=True))
+        else:
+            self._reply(404, {"ok": False, "error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            req = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self._reply(400, {"ok": False, "error": f"Invalid JSON: {e}"})
+            return
+
+        if self.path == "/shutdown":
+            self._reply(200, {"ok": True})
+            self.server.stop = True
+        elif self.path == "/run":
+            if not self._stale():
+                result = self.server.state.run(req)
+                self._reply(200 if result["ok"] else 500, result)
+        else:
+            self._reply(404, {"ok": False, "error": f"Unknown path {self.path}"})
+
+
+def is_loopback(host: str) -> bool:
+    if host in LOCAL_HOSTNAMES:
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class GeneratorServer(HTTPServer):
+
+    def __init__(self, address, state: GeneratorState):
+        if ":" in address[0]:
+            self.address_family = socket.AF_INET6
+        super().__init__(address, _Handler)
+        self.state = state
+        self.mtimes = _source_mtimes()
+        self.stop = False
+        self.restart = False
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, allow_remote: bool = False):
+    if not (allow_remote or is_loopback(host)):
+        raise ValueError(f"refusing to listen on non-loopback host {host!r} without allow_remote")
+    state = GeneratorState()
+    server = GeneratorServer((host, port), state)
+    shown = f"[{host}]" if ":" in host else host
+    print(f"generator daemon on http://{shown}:{port} (pid {os.getpid()}): "
+          f"imports {state.import_ms:.0f} ms, preload {state.preload_ms:.0f} ms", flush=True)
+    try:
+        while not (server.stop or server.restart):
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    if server.restart:
+        print("generator sources changed: restarting", flush=True)
+        os.execv(sys.executable, [sys.executable, str(Path(__file__).resolve())] + sys.argv[1:])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--host", default=DEFAULT_HOST)
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--allow-remote", action="store_true",
+                    help="listen on a non-loopback --host (requests are unauthenticated and write files)")
+    args = ap.parse_args()
+    if not (args.allow_remote or is_loopback(args.host)):
+        ap.error(f"--host {args.host} is not a loopback address; pass --allow-remote to expose the daemon anyway")
+    serve(args.host, args.port, args.allow_remote)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+run_pipeline.py
+
+Runs the whole MDE pipeline (PlantUML -> BUML -> Django, DSML -> custom BUML
+-> custom Django, DSML -> GUI model -> Web UI) with an incremental,
+content-addressed stage cache (see build_cache.py).
+
+A stage only runs when one of its inputs, or the output of a stage it depends
+on, changed since its last successful run.
+
+Run:
+  python run_pipeline.py              # incremental build
+  python run_pipeline.py --force      # ignore the cache
+  python run_pipeline.py --only gui-m2m web-ui
+  python run_pipeline.py --dry-run    # only report what would run
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from build_cache import CACHE_ROOT, Stage, StageCache
+
+SRC = Path(__file__).resolve().parent.parent
+BACKEND = SRC / "model-2-model-strutural-transformation-for-backend"
+FRONTEND = SRC / "model-2-model-gui-transformation-for-frontend"
+M2T = SRC / "model-2-text"
+
+PY = sys.executable
+
+
+# ------------------------------------------------------------
+# Stage graph (declared in execution order)
+# ------------------------------------------------------------
+STAGES: List[Stage] = [
+    Stage(
+        name="plantuml-to-buml",
+        cwd=BACKEND,
+        command=[PY, "community_platform_puml_to_buml_generator.py"],
+        inputs=[
+            "community_platform_puml_to_buml_generator.py",
+            "community_platform_strutural_with_enums.plantuml",
+            "formatters.py",
+        ],
+        outputs=["buml/buml_model.py", "django_backend"],
+    ),
+    Stage(
+        name="structural-m2m",
+        cwd=BACKEND,
+        command=[PY, "m2m_strutural_transformer.py"],
+        inputs=[
+            "m2m_strutural_transformer.py",
+            "domain_model_index.py",
+            "../pipeline/dsml_loader.py",
+            "../pipeline/build_cache.py",
+            "../pipeline/dsml_features.py",
+            "dsml_metamodel.ecore",
+            "test_custom.xmi",
+        ],
+        outputs=["buml/custom_buml_model.py"],
+        upstream=["plantuml-to-buml"],
+    ),
+    Stage(
+        name="custom-django",
+        cwd=BACKEND,
+        command=[PY, "custom_community_platform_puml_to_buml_generator.py"],
+        inputs=["custom_community_platform_puml_to_buml_generator.py", "formatters.py"],
+        outputs=["custom_django_backend"],
+        upstream=["structural-m2m"],
+    ),
+    Stage(
+        name="gui-m2m",
+        cwd=FRONTEND,
+        command=[PY, "m2m_dsml_to_gui_pruning_only_with_py_export.py"],
+        inputs=[
+            "m2m_dsml_to_gui_pruning_only_with_py_export.py",
+            "gui_model_index.py",
+            "gui_pruning_rules.py",
+            "structural_binding.py",
+            "../pipeline/dsml_loader.py",
+            "../pipeline/build_cache.py",
+            "../pipeline/dsml_features.py",
+            "gui_community_platform.py",
+            "structural_community_platform.py",
+            "dsml_metamodel.ecore",
+            "test_custom.xmi",
+        ],
+        outputs=["generated_gui_model.py"],
+    ),
+    Stage(
+        name="web-ui",
+        cwd=M2T,
+        command=[PY, "generate_app.py", str(FRONTEND / "generated_gui_model.py"), "output_besser"],
+        inputs=["generate_app.py", "besser_web_ui_generator.py", "template_cache.py", "bundler.py", "templates",
+                "../pipeline/build_cache.py"],
+        outputs=["output_besser"],
+        upstream=["gui-m2m"],
+    ),
+]
+
+
+def _select(only: List[str]) -> List[Stage]:
+    if not only:
+        return STAGES
+    known = {s.name for s in STAGES}
+    unknown = [n for n in only if n not in known]
+    if unknown:
+        raise SystemExit(f"Unknown stage(s): {', '.join(unknown)}. Known: {', '.join(sorted(known))}")
+    return [s for s in STAGES if s.name in only]
+
+
+def run_pipeline(force: bool = False, only: List[str] = (), dry_run: bool = False) -> bool:
+    cache = StageCache(CACHE_ROOT)
+    selected = {s.name for s in _select(list(only))}
+    outputs: Dict[str, str] = {}
+    ok = True
+    t_total = time.perf_counter()
+
+    for stage in STAGES:
+        t0 = time.perf_counter()
+        key = cache.stage_key(stage, outputs)
+
+        fresh = None if force else cache.is_fresh(stage, key)
+        if fresh is not None or stage.name not in selected:
+            # Unselected stages still contribute their current outputs downstream
+            outputs[stage.name] = fresh or cache.output_digest(stage) or ""
+            if stage.name in selected:
+                print(f"[skip] {stage.name:<18} up to date ({(time.perf_counter() - t0) * 1000:.1f} ms)")
+            continue
+
+        if dry_run:
+            print(f"[todo] {stage.name:<18} would run: {' '.join(stage.command[1:])}")
+            outputs[stage.name] = f"dirty:{key}"
+            continue
+
+        print(f"[run ] {stage.name:<18} {' '.join(stage.command[1:])}")
+        proc = subprocess.run(stage.command, cwd=str(stage.cwd))
+        out_digest = cache.output_digest(stage)
+
+        if proc.returncode != 0 or out_digest is None:
+            cache.forget(stage.name)
+            print(f"[fail] {stage.name:<18} exit={proc.returncode}, outputs present={out_digest is not None}")
+            ok = False
+            break
+
+        cache.record(stage, key, out_digest)
+        outputs[stage.name] = out_digest
+        print(f"[done] {stage.name:<18} {time.perf_counter() - t0:.2f} s")
+
+    if not dry_run:
+        cache.save()
+    print(f"Pipeline {'finished' if ok else 'stopped'} in {time.perf_counter() - t_total:.3f} s")
+    return ok
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Incremental MDE pipeline runner")
+    ap.add_argument("--force", action="store_true", help="run every selected stage regardless of the cache")
+    ap.add_argument("--only", nargs="+", default=[], metavar="STAGE", help="restrict to these stages")
+    ap.add_argument("--dry-run", action="store_true", help="report stale stages without running them")
+    args = ap.parse_args()
+    sys.exit(0 if run_pipeline(force=args.force, only=args.only, dry_run=args.dry_run) else 1)
+
+
+if __name__ == "__main__":
+    main()